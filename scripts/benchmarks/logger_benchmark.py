@@ -0,0 +1,97 @@
+import argparse
+import inspect
+import io
+import logging
+import time
+from typing import Callable
+
+from core.logger.logger import Logger
+
+
+class SlowStreamHandler(logging.StreamHandler):  # type: ignore
+    def __init__(self, latency_ms: float) -> None:
+        super().__init__(io.StringIO())
+        self.latency = latency_ms / 1000
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+
+class InspectStackLogger:
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+
+    def _log(self, level: int, message: str) -> None:
+        caller = inspect.stack()[2]
+        module = inspect.getmodule(caller[0])
+        module_name = module.__name__ if module else "unknown_module"
+        self.logger.log(level, f"{module_name}.{caller.function} - {message}")
+
+    def info(self, message: str) -> None:
+        self._log(logging.INFO, message)
+
+    def debug(self, message: str) -> None:
+        self._log(logging.DEBUG, message)
+
+
+def log_request_inspect_stack(logger: InspectStackLogger, text: str) -> None:
+    logger.info(f"Request {text} started: POST /translate")
+    logger.info(f"Executing translation for text '{text}' from 'en_US' to 'pl_PL'")
+    logger.debug(f"Starting translation of text from '{text}' to 'pl_PL'")
+    logger.debug(f"Translating started from source_language: {text}, target_language: pl_PL")
+    logger.debug(f"Dispatching batch of {len(text)} translation requests")
+    logger.debug(f"Translating completed from source_language: {text}, target_language: pl_PL")
+    logger.debug("Completed translation of text")
+    logger.info("Returning translation result")
+    logger.info(f"Request {text} completed: POST /translate processed in {0.1234:.4f} seconds.")
+
+
+def log_request(logger: Logger, text: str) -> None:
+    logger.info("Request %s started: %s %s", text, "POST", "/translate")
+    logger.info("Executing translation for text '%s' from '%s' to '%s'", text, "en_US", "pl_PL")
+    logger.debug("Starting translation of text from '%s' to '%s'", text, "pl_PL")
+    logger.debug("Translating started from source_language: %s, target_language: %s", text, "pl_PL")
+    logger.debug("Dispatching batch of %d translation requests", len(text))
+    logger.debug("Translating completed from source_language: %s, target_language: %s", text, "pl_PL")
+    logger.debug("Completed translation of text")
+    logger.info("Returning translation result")
+    logger.info("Request %s completed: %s %s processed in %.4f seconds.", text, "POST", "/translate", 0.1234)
+
+
+def measure(name: str, requests: int, log: Callable[[str], None]) -> None:
+    for _ in range(min(requests, 100)):
+        log("warm-up")
+
+    started_at = time.perf_counter()
+
+    for _ in range(requests):
+        log("The tower is 324 metres tall.")
+
+    elapsed = time.perf_counter() - started_at
+    print(f"{name:<24} {elapsed / requests * 1_000_000:10.1f} us/request")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measures per-request logging overhead at the INFO level.")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--sink-latency-ms", type=float, default=0.0, help="Simulated latency of each log write")
+    args = parser.parse_args()
+
+    logger = Logger()
+    logger.logger.handlers = [SlowStreamHandler(args.sink_latency_ms)]
+    logger.logger.setLevel(logging.INFO)
+    inspect_stack_logger = InspectStackLogger(logger.logger)
+
+    measure("inspect.stack()", args.requests, lambda text: log_request_inspect_stack(inspect_stack_logger, text))
+    measure("sys._getframe()", args.requests, lambda text: log_request(logger, text))
+
+    logger.enable_async()
+    measure("sys._getframe() + queue", args.requests, lambda text: log_request(logger, text))
+    logger.disable_async()
+
+
+if __name__ == "__main__":
+    main()
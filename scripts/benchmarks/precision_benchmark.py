@@ -0,0 +1,171 @@
+import argparse
+import math
+import multiprocessing
+import resource
+import time
+from collections import Counter
+from typing import Any, Dict, List, Sequence, Tuple
+
+from core.logger.logger import Logger
+from data.workers.mbart_translation_worker import (
+    MBartTranslationConfig,
+    MBartTranslationWorker,
+)
+from data.workers.seamless_translation_worker import (
+    SeamlessTranslationConfig,
+    SeamlessTranslationWorker,
+)
+
+MODELS: Dict[str, Tuple[str, str, str]] = {
+    "mbart": ("facebook/mbart-large-50-many-to-many-mmt", "en_XX", "pl_PL"),
+    "seamless": ("facebook/seamless-m4t-v2-large", "eng", "pol"),
+}
+
+SAMPLES = [
+    "The tower is 324 metres tall, about the same height as an 81-storey building.",
+    "Please restart the application after the update has been installed.",
+    "The meeting has been moved to Thursday afternoon because of the holiday.",
+    "Our support team will answer your question within two business days.",
+    "The river flooded the lower part of the town after three days of heavy rain.",
+    "You can change the language of the interface in the settings menu.",
+    "The museum is closed on Mondays, but guided tours are available on request.",
+    "Scientists discovered a new species of frog in the rainforest last year.",
+]
+
+
+def create_worker(model: str, precision: str, device: str, download_path: str, num_threads: int) -> Tuple[Any, Any]:
+    model_name, _, _ = MODELS[model]
+    config_class, worker_class = (
+        (MBartTranslationConfig, MBartTranslationWorker)
+        if model == "mbart"
+        else (SeamlessTranslationConfig, SeamlessTranslationWorker)
+    )
+    config = config_class(
+        device=device,
+        model_name=model_name,
+        model_download_path=download_path,
+        log_level="WARNING",
+        num_threads=num_threads,
+        max_input_tokens=400,
+        precision=precision,
+        fast_load=False,
+    )
+
+    return worker_class(config, Logger()), config
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_precision(args: argparse.Namespace, precision: str, results: "multiprocessing.Queue[Dict[str, Any]]") -> None:
+    _, source_language, target_language = MODELS[args.model]
+    worker, config = create_worker(args.model, precision, args.device, args.download_path, args.threads)
+
+    started_at = time.perf_counter()
+    shared_object = worker.initialize_shared_object(config)
+    load_seconds = time.perf_counter() - started_at
+    load_rss_mb = peak_rss_mb()
+
+    def translate() -> List[str]:
+        translations: List[str] = worker.generate(
+            SAMPLES[: args.batch_size],
+            source_language,
+            target_language,
+            {"num_beams": args.num_beams},
+            shared_object,
+            config,
+        )
+        return translations
+
+    translations = translate()
+    latencies = []
+
+    for _ in range(args.repeats):
+        started_at = time.perf_counter()
+        translate()
+        latencies.append(time.perf_counter() - started_at)
+
+    results.put(
+        {
+            "precision": precision,
+            "load_seconds": load_seconds,
+            "load_rss_mb": load_rss_mb,
+            "peak_rss_mb": peak_rss_mb(),
+            "latency_ms": sorted(latencies)[len(latencies) // 2] * 1000,
+            "translations": translations,
+        },
+    )
+
+
+def ngrams(tokens: Sequence[str], n: int) -> "Counter[Tuple[str, ...]]":
+    return Counter(zip(*(tokens[i:] for i in range(n))))
+
+
+def corpus_bleu(hypotheses: List[str], references: List[str], max_n: int = 4) -> float:
+    matches = [0] * max_n
+    totals = [0] * max_n
+    hypothesis_length = 0
+    reference_length = 0
+
+    for hypothesis, reference in zip(hypotheses, references):
+        hypothesis_tokens = hypothesis.split()
+        reference_tokens = reference.split()
+        hypothesis_length += len(hypothesis_tokens)
+        reference_length += len(reference_tokens)
+
+        for n in range(1, max_n + 1):
+            hypothesis_ngrams = ngrams(hypothesis_tokens, n)
+            matches[n - 1] += sum((hypothesis_ngrams & ngrams(reference_tokens, n)).values())
+            totals[n - 1] += sum(hypothesis_ngrams.values())
+
+    if hypothesis_length == 0 or 0 in matches:
+        return 0.0
+
+    log_precision = sum(math.log(match / total) for match, total in zip(matches, totals)) / max_n
+    brevity_penalty = min(1.0, math.exp(1 - reference_length / hypothesis_length))
+
+    return 100 * brevity_penalty * math.exp(log_precision)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compares latency, memory and translation quality of the model precisions against fp32.",
+    )
+    parser.add_argument("--model", choices=sorted(MODELS), default="mbart")
+    parser.add_argument("--precisions", nargs="+", default=["fp32", "int8", "bf16"])
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--download-path", default="downloaded_translation_models")
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=len(SAMPLES))
+    parser.add_argument("--num-beams", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    results: "multiprocessing.Queue[Dict[str, Any]]" = context.Queue()
+    measurements = []
+
+    for precision in ["fp32"] + [precision for precision in args.precisions if precision != "fp32"]:
+        process = context.Process(target=run_precision, args=(args, precision, results))
+        process.start()
+        measurements.append(results.get())
+        process.join()
+
+    references = measurements[0]["translations"]
+
+    print(f"{'precision':<10} {'load s':>8} {'load MB':>9} {'peak MB':>9} {'latency ms':>11} {'BLEU vs fp32':>13}")
+
+    for measurement in measurements:
+        print(
+            f"{measurement['precision']:<10} "
+            f"{measurement['load_seconds']:8.1f} "
+            f"{measurement['load_rss_mb']:9.0f} "
+            f"{measurement['peak_rss_mb']:9.0f} "
+            f"{measurement['latency_ms']:11.1f} "
+            f"{corpus_bleu(measurement['translations'], references):13.1f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
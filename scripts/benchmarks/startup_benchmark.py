@@ -0,0 +1,120 @@
+import argparse
+import multiprocessing
+import os
+import resource
+import time
+from typing import Any, Dict, List, Tuple
+
+from core.logger.logger import Logger
+from data.workers.base_translation_worker import BaseTranslationWorker
+from data.workers.mbart_translation_worker import (
+    MBartTranslationConfig,
+    MBartTranslationWorker,
+)
+from data.workers.seamless_translation_worker import (
+    SeamlessTranslationConfig,
+    SeamlessTranslationWorker,
+)
+
+MODELS: Dict[str, Tuple[str, str, str]] = {
+    "mbart": ("facebook/mbart-large-50-many-to-many-mmt", "en_XX", "pl_PL"),
+    "seamless": ("facebook/seamless-m4t-v2-large", "eng", "pol"),
+}
+
+
+def create_worker(args: argparse.Namespace, fast_load: bool) -> Tuple[Any, Any]:
+    model_name, _, _ = MODELS[args.model]
+    config_class, worker_class = (
+        (MBartTranslationConfig, MBartTranslationWorker)
+        if args.model == "mbart"
+        else (SeamlessTranslationConfig, SeamlessTranslationWorker)
+    )
+    config = config_class(
+        device=args.device,
+        model_name=model_name,
+        model_download_path=args.download_path,
+        log_level="WARNING",
+        num_threads=args.threads,
+        max_input_tokens=400,
+        precision=args.precision,
+        fast_load=fast_load,
+    )
+
+    return worker_class(config, Logger()), config
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_startup(args: argparse.Namespace, fast_load: bool, results: "multiprocessing.Queue[Dict[str, Any]]") -> None:
+    _, source_language, target_language = MODELS[args.model]
+    started_at = time.perf_counter()
+    worker, config = create_worker(args, fast_load)
+    shared_object = worker.initialize_shared_object(config)
+    load_seconds = time.perf_counter() - started_at
+
+    worker.generate(["Hello world."], source_language, target_language, {}, shared_object, config)
+
+    results.put(
+        {
+            "load_seconds": load_seconds,
+            "first_translation_seconds": time.perf_counter() - started_at,
+            "peak_rss_mb": peak_rss_mb(),
+        },
+    )
+
+
+def measure(
+    context: Any,
+    args: argparse.Namespace,
+    fast_load: bool,
+    results: "multiprocessing.Queue[Dict[str, Any]]",
+) -> Dict[str, Any]:
+    process = context.Process(target=run_startup, args=(args, fast_load, results))
+    process.start()
+    measurement: Dict[str, Any] = results.get()
+    process.join()
+
+    return measurement
+
+
+def median(measurements: List[Dict[str, Any]], key: str) -> float:
+    values = sorted(measurement[key] for measurement in measurements)
+    return float(values[len(values) // 2])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compares worker cold-start time and peak memory with and without MODEL_FAST_LOAD.",
+    )
+    parser.add_argument("--model", choices=sorted(MODELS), default="mbart")
+    parser.add_argument("--precision", default="fp32")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--download-path", default="downloaded_translation_models")
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    results: "multiprocessing.Queue[Dict[str, Any]]" = context.Queue()
+    model_name, _, _ = MODELS[args.model]
+
+    if not os.path.isdir(BaseTranslationWorker.get_fast_load_path(args.download_path, model_name)):
+        print("Saving the fast load snapshot")
+        measure(context, args, True, results)
+
+    print(f"{'mode':<10} {'load s':>8} {'first translation s':>20} {'peak MB':>9}")
+
+    for mode, fast_load in [("default", False), ("fast_load", True)]:
+        measurements = [measure(context, args, fast_load, results) for _ in range(args.repeats)]
+        print(
+            f"{mode:<10} "
+            f"{median(measurements, 'load_seconds'):8.1f} "
+            f"{median(measurements, 'first_translation_seconds'):20.1f} "
+            f"{median(measurements, 'peak_rss_mb'):9.0f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ModelStatusDto(BaseModel):
+    status: str
+    alive: bool
+    model_loaded: bool
+    worker_pids: List[int]
+    queue_depth: int
+    in_flight: int
+    last_inference_latency_ms: Optional[float]
+    loaded_models: List[str]
@@ -0,0 +1,49 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, field_validator
+
+from api.dtos.translate_dto import TranslateDTO
+
+
+class TranslateBatchItemDTO(BaseModel):
+    text_to_translate: str
+    source_language: Optional[str] = None
+    target_language: Optional[str] = None
+
+    @field_validator("source_language", "target_language")
+    def validate_languages(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None:
+            language: str = TranslateDTO.validate_language_format(v)
+            return language
+
+        return v
+
+
+class TranslateBatchDTO(BaseModel):
+    texts_to_translate: List[Union[str, TranslateBatchItemDTO]]
+    source_language: str
+    target_language: str
+    generation_parameters: Dict[str, Any] = {}
+    model: Optional[str] = None
+
+    @field_validator("source_language", "target_language")
+    def validate_languages(cls, v: str) -> str:
+        language: str = TranslateDTO.validate_language_format(v)
+        return language
+
+    def get_items(self) -> List[Tuple[str, str, str]]:
+        items: List[Tuple[str, str, str]] = []
+
+        for item in self.texts_to_translate:
+            if isinstance(item, str):
+                items.append((item, self.source_language, self.target_language))
+            else:
+                items.append(
+                    (
+                        item.text_to_translate,
+                        item.source_language or self.source_language,
+                        item.target_language or self.target_language,
+                    ),
+                )
+
+        return items
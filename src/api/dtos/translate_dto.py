@@ -11,6 +11,8 @@ class TranslateDTO(BaseModel):
     source_language: str
     target_language: str
     generation_parameters: Dict[str, Any] = {}
+    model: Optional[str] = None
+    include_timings: bool = False
 
     @staticmethod
     def validate_language_format(v: str) -> str:
@@ -1,5 +1,8 @@
+from typing import Dict, Optional
+
 from pydantic import BaseModel
 
 
 class TranslateResultDTO(BaseModel):
     translation: str
+    timings: Optional[Dict[str, float]] = None
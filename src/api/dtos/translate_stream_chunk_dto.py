@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class TranslateStreamChunkDTO(BaseModel):
+    index: int
+    translation: str
+    separator: str
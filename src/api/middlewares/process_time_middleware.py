@@ -1,35 +1,66 @@
 import time
-import uuid
-from typing import Any, Awaitable, Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from core.logger.logger import Logger
+from core.metrics.metrics import Metrics
 
 
-class ProcessTimeMiddleware(BaseHTTPMiddleware):
+class ProcessTimeMiddleware:
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp,
         logger: Logger,
+        metrics: Metrics,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.logger = logger
+        self.metrics = metrics
 
-    async def dispatch(
+    async def __call__(
         self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        request_id = str(uuid.uuid4())
-        self.logger.info(f"Request {request_id} started: {request.method} {request.url}")
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
-        self.logger.info(
-            f"Request {request_id} completed: {request.method} {request.url} processed in {process_time:.4f} seconds.",
-        )
-        return response
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = self.logger.begin_request()
+        method = scope["method"]
+        path = scope["path"]
+        status_code = 500
+        start_time = time.perf_counter()
+        self.logger.info("Request %s started: %s %s", request_id, method, path)
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", str(time.perf_counter() - start_time))
+                headers.append("X-Request-ID", request_id)
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            process_time = time.perf_counter() - start_time
+            route = scope.get("route")
+            self.metrics.http_request_duration_seconds.labels(
+                method,
+                getattr(route, "path", "unmatched"),
+                str(status_code),
+            ).observe(process_time)
+            self.logger.info(
+                "Request %s completed: %s %s with status %d processed in %.4f seconds.",
+                request_id,
+                method,
+                path,
+                status_code,
+                process_time,
+            )
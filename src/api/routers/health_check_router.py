@@ -1,12 +1,40 @@
-from fastapi import APIRouter
+from dataclasses import asdict
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response, status
 
 from api.dtos.health_check_result_dto import HealthCheckResultDto
+from api.dtos.model_status_dto import ModelStatusDto
+from application.usecases.check_liveness_usecase import CheckLivenessUseCase
+from application.usecases.check_readiness_usecase import CheckReadinessUseCase
 
 
 class HealthCheckRouter:
     def __init__(self) -> None:
         self.router = APIRouter()
         self.router.get("/healthcheck")(self.healthcheck)
+        self.router.get("/liveness")(self.liveness)
+        self.router.get("/readiness")(self.readiness)
 
     async def healthcheck(self) -> HealthCheckResultDto:
         return HealthCheckResultDto(status="OK")
+
+    async def liveness(
+        self,
+        check_liveness_usecase: Annotated[CheckLivenessUseCase, Depends()],
+    ) -> ModelStatusDto:
+        model_status = check_liveness_usecase.execute()
+
+        return ModelStatusDto(status="ALIVE", **asdict(model_status))
+
+    async def readiness(
+        self,
+        response: Response,
+        check_readiness_usecase: Annotated[CheckReadinessUseCase, Depends()],
+    ) -> ModelStatusDto:
+        ready, model_status = check_readiness_usecase.execute()
+
+        if not ready:
+            response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+        return ModelStatusDto(status="READY" if ready else "NOT_READY", **asdict(model_status))
@@ -0,0 +1,17 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response
+
+from core.metrics.metrics import Metrics
+
+
+class MetricsRouter:
+    def __init__(self) -> None:
+        self.router = APIRouter()
+        self.router.get("/metrics")(self.metrics)
+
+    async def metrics(
+        self,
+        metrics: Annotated[Metrics, Depends()],
+    ) -> Response:
+        return Response(content=metrics.render(), media_type=metrics.content_type)
@@ -1,29 +1,91 @@
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Response
+from fastapi.responses import StreamingResponse
 
+from api.dtos.translate_batch_dto import TranslateBatchDTO
+from api.dtos.translate_batch_result_dto import TranslateBatchResultDTO
 from api.dtos.translate_dto import TranslateDTO
 from api.dtos.translate_result_dto import TranslateResultDTO
+from api.dtos.translate_stream_chunk_dto import TranslateStreamChunkDTO
+from application.usecases.translate_batch_usecase import TranslateBatchUseCase
+from application.usecases.translate_text_stream_usecase import (
+    TranslateTextStreamUseCase,
+)
 from application.usecases.translate_text_usecase import TranslateTextUseCase
+from core.metrics.request_timings import RequestTimings
 
 
 class TranslateRouter:
     def __init__(self) -> None:
         self.router = APIRouter()
-        self.router.post("/translate")(self.translate)
+        self.router.post("/translate", response_model_exclude_none=True)(self.translate)
+        self.router.post("/translate/batch")(self.translate_batch)
+        self.router.post("/translate/stream")(self.translate_stream)
 
     async def translate(
         self,
+        response: Response,
         translate_text_usecase: Annotated[TranslateTextUseCase, Depends()],
         translate_dto: TranslateDTO = Body(...),
     ) -> TranslateResultDTO:
-        translation = await translate_text_usecase.execute(
+        timings = RequestTimings.begin() if translate_dto.include_timings else None
+
+        with RequestTimings.measure("total"):
+            translation = await translate_text_usecase.execute(
+                translate_dto.text_to_translate,
+                translate_dto.source_language,
+                translate_dto.target_language,
+                translate_dto.generation_parameters,
+                translate_dto.model,
+            )
+
+        if timings is None:
+            return TranslateResultDTO(
+                translation=translation,
+            )
+
+        response.headers["Server-Timing"] = timings.to_server_timing()
+
+        return TranslateResultDTO(
+            translation=translation,
+            timings=timings.to_milliseconds(),
+        )
+
+    async def translate_batch(
+        self,
+        translate_batch_usecase: Annotated[TranslateBatchUseCase, Depends()],
+        translate_batch_dto: TranslateBatchDTO = Body(...),
+    ) -> TranslateBatchResultDTO:
+        translations = await translate_batch_usecase.execute(
+            translate_batch_dto.get_items(),
+            translate_batch_dto.generation_parameters,
+            translate_batch_dto.model,
+        )
+
+        return TranslateBatchResultDTO(
+            translations=translations,
+        )
+
+    async def translate_stream(
+        self,
+        translate_text_stream_usecase: Annotated[TranslateTextStreamUseCase, Depends()],
+        translate_dto: TranslateDTO = Body(...),
+    ) -> StreamingResponse:
+        translations = translate_text_stream_usecase.execute(
             translate_dto.text_to_translate,
             translate_dto.source_language,
             translate_dto.target_language,
             translate_dto.generation_parameters,
+            translate_dto.model,
         )
 
-        return TranslateResultDTO(
-            translation=translation,
-        )
+        async def stream_chunks() -> AsyncIterator[str]:
+            index = 0
+
+            async for translation, separator in translations:
+                chunk = TranslateStreamChunkDTO(index=index, translation=translation, separator=separator)
+                index += 1
+                yield chunk.model_dump_json() + "\n"
+
+        return StreamingResponse(stream_chunks(), media_type="application/x-ndjson")
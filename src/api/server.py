@@ -1,12 +1,34 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 import uvicorn
 from fastapi import FastAPI
 
 from api.handlers.global_exception_handler import GlobalExceptionHandler
 from api.middlewares.process_time_middleware import ProcessTimeMiddleware
 from api.routers.health_check_router import HealthCheckRouter
+from api.routers.metrics_router import MetricsRouter
 from api.routers.translate_router import TranslateRouter
+from application.usecases.preload_model_usecase import PreloadModelUseCase
+from core.cache.lru_ttl_cache import LruTtlCacheFactory
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from core.metrics.metrics import Metrics
+from core.timer.timer import TimerFactory
+from data.factories.translation_batch_scheduler_factory import (
+    TranslationBatchSchedulerFactory,
+)
+from data.factories.translation_worker_factory import TranslationWorkerFactory
+from data.repositories.directory_repository_impl import DirectoryRepositoryImpl
+from data.repositories.translation_memory_repository_impl import (
+    TranslationMemoryRepositoryImpl,
+)
+from data.repositories.translation_model_repository_impl import (
+    TranslationModelRepositoryImpl,
+)
+from domain.services.language_mapping_service import LanguageMappingService
+from domain.services.text_segmentation_service import TextSegmentationService
+from domain.services.translation_service import TranslationService
 
 
 class APIServer:
@@ -17,11 +39,50 @@ class APIServer:
     ) -> None:
         self.config = config
         self.logger = logger
-        self.app = FastAPI()
+        self.app = FastAPI(lifespan=self.lifespan)
         self.exception_handler = GlobalExceptionHandler(self.app, logger)
-        self.app.add_middleware(ProcessTimeMiddleware, logger=logger)
+        self.app.add_middleware(ProcessTimeMiddleware, logger=logger, metrics=Metrics())
         self.app.include_router(TranslateRouter().router, tags=["Translate"])
         self.app.include_router(HealthCheckRouter().router, tags=["HealthCheck"])
+        self.app.include_router(MetricsRouter().router, tags=["Metrics"])
+
+    def _create_preload_model_usecase(self) -> PreloadModelUseCase:
+        directory_repository = DirectoryRepositoryImpl(self.logger)
+        metrics = Metrics()
+
+        return PreloadModelUseCase(
+            config=self.config,
+            logger=self.logger,
+            translation_service=TranslationService(
+                config=self.config,
+                translation_model_repository=TranslationModelRepositoryImpl(
+                    config=self.config,
+                    directory_repository=directory_repository,
+                    timer_factory=TimerFactory(),
+                    logger=self.logger,
+                    worker_factory=TranslationWorkerFactory(self.config, self.logger, metrics),
+                    scheduler_factory=TranslationBatchSchedulerFactory(self.config, self.logger, metrics),
+                    cache_factory=LruTtlCacheFactory(),
+                    metrics=metrics,
+                    translation_memory_repository=TranslationMemoryRepositoryImpl(
+                        config=self.config,
+                        directory_repository=directory_repository,
+                        logger=self.logger,
+                        metrics=metrics,
+                    ),
+                ),
+                logger=self.logger,
+                language_mapping_service=LanguageMappingService(),
+                text_segmentation_service=TextSegmentationService(),
+            ),
+        )
+
+    @asynccontextmanager
+    async def lifespan(self, app: FastAPI) -> AsyncIterator[None]:
+        if self.config.model_preload:
+            self._create_preload_model_usecase().execute()
+
+        yield
 
     def start(self) -> None:
         self.logger.info("Starting FastAPI server...")
@@ -0,0 +1,27 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.models.translation_model_status import TranslationModelStatus
+from domain.services.translation_service import TranslationService
+
+
+class CheckLivenessUseCase:
+    def __init__(
+        self,
+        config: Annotated[AppConfig, Depends()],
+        logger: Annotated[Logger, Depends()],
+        translation_service: Annotated[TranslationService, Depends()],
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.translation_service = translation_service
+
+    def execute(self) -> TranslationModelStatus:
+        status = self.translation_service.get_model_status()
+
+        self.logger.debug("Translation model status: %s", status)
+
+        return status
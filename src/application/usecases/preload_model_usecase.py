@@ -0,0 +1,24 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.services.translation_service import TranslationService
+
+
+class PreloadModelUseCase:
+    def __init__(
+        self,
+        config: Annotated[AppConfig, Depends()],
+        logger: Annotated[Logger, Depends()],
+        translation_service: Annotated[TranslationService, Depends()],
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.translation_service = translation_service
+
+    def execute(self) -> None:
+        self.logger.info(f"Preloading translation model {self.config.translation_model_name}")
+
+        self.translation_service.preload_model()
@@ -0,0 +1,37 @@
+from typing import Annotated, Any, Dict, List, Optional, Tuple
+
+from fastapi import Depends
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.services.translation_service import TranslationService
+
+
+class TranslateBatchUseCase:
+    def __init__(
+        self,
+        config: Annotated[AppConfig, Depends()],
+        logger: Annotated[Logger, Depends()],
+        translation_service: Annotated[TranslationService, Depends()],
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.translation_service = translation_service
+
+    async def execute(
+        self,
+        texts_to_translate: List[Tuple[str, str, str]],
+        generation_parameters: Dict[str, Any],
+        model_name: Optional[str] = None,
+    ) -> List[str]:
+        self.logger.info("Executing batch translation for %d texts", len(texts_to_translate))
+
+        translations: List[str] = await self.translation_service.translate_batch(
+            texts_to_translate,
+            generation_parameters,
+            model_name,
+        )
+
+        self.logger.info("Returning batch translation result")
+
+        return translations
@@ -0,0 +1,50 @@
+from typing import Annotated, Any, AsyncIterator, Dict, Optional, Tuple
+
+from fastapi import Depends
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.services.translation_service import TranslationService
+
+
+class TranslateTextStreamUseCase:
+    def __init__(
+        self,
+        config: Annotated[AppConfig, Depends()],
+        logger: Annotated[Logger, Depends()],
+        translation_service: Annotated[TranslationService, Depends()],
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.translation_service = translation_service
+
+    async def _stream(self, translations: AsyncIterator[Tuple[str, str]]) -> AsyncIterator[Tuple[str, str]]:
+        async for translation, separator in translations:
+            yield translation, separator
+
+        self.logger.info("Streamed translation result completed")
+
+    def execute(
+        self,
+        text_to_translate: str,
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        model_name: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[str, str]]:
+        self.logger.info(
+            "Executing streamed translation for text '%s' from '%s' to '%s'",
+            self.logger.text(text_to_translate),
+            source_language,
+            target_language,
+        )
+
+        return self._stream(
+            self.translation_service.translate_text_stream(
+                text_to_translate,
+                source_language,
+                target_language,
+                generation_parameters,
+                model_name,
+            ),
+        )
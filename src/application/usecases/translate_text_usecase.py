@@ -1,4 +1,4 @@
-from typing import Annotated, Any, Dict
+from typing import Annotated, Any, Dict, Optional
 
 from fastapi import Depends
 
@@ -24,16 +24,21 @@ class TranslateTextUseCase:
         source_language: str,
         target_language: str,
         generation_parameters: Dict[str, Any],
+        model_name: Optional[str] = None,
     ) -> str:
         self.logger.info(
-            f"Executing translation for text '{text_to_translate}' from '{source_language}' to '{target_language}'",
+            "Executing translation for text '%s' from '%s' to '%s'",
+            self.logger.text(text_to_translate),
+            source_language,
+            target_language,
         )
 
-        translation: str = self.translation_service.translate_text(
+        translation: str = await self.translation_service.translate_text(
             text_to_translate,
             source_language,
             target_language,
             generation_parameters,
+            model_name,
         )
 
         self.logger.info("Returning translation result")
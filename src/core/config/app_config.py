@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import List, Optional
 
 from dotenv import load_dotenv
 
@@ -10,12 +10,40 @@ class AppConfig:
     _instance: Optional["AppConfig"] = None
 
     log_level: Optional[str]
+    log_async: Optional[bool]
+    log_format: Optional[str]
+    log_request_sample_rate: Optional[float]
+    log_text_max_length: Optional[int]
+    log_redact_text: Optional[bool]
     device: Optional[str]
     fastapi_host: Optional[str]
     fastapi_port: Optional[int]
     translation_model_name: Optional[str]
+    translation_model_names: Optional[List[str]]
+    translation_engine: Optional[str]
     translation_model_download_path: Optional[str]
     model_idle_timeout: Optional[int]
+    model_preload: Optional[bool]
+    model_min_warm_workers: Optional[int]
+    model_precision: Optional[str]
+    model_fast_load: Optional[bool]
+    model_shared_memory: Optional[bool]
+    max_loaded_models: Optional[int]
+    model_memory_budget_mb: Optional[int]
+    model_eviction_policy: Optional[str]
+    readiness_max_queue_depth: Optional[int]
+    translation_workers: Optional[int]
+    translation_worker_threads: Optional[int]
+    translation_batch_max_size: Optional[int]
+    translation_batch_max_wait_ms: Optional[int]
+    translation_batch_max_in_flight: Optional[int]
+    translation_max_input_tokens: Optional[int]
+    translation_cache_enabled: Optional[bool]
+    translation_cache_max_size: Optional[int]
+    translation_cache_ttl: Optional[int]
+    translation_memory_enabled: Optional[bool]
+    translation_memory_max_entries: Optional[int]
+    translation_segment_cache_enabled: Optional[bool]
 
     def __new__(cls) -> "AppConfig":
         if cls._instance is None:
@@ -25,14 +53,56 @@ class AppConfig:
 
     def _load_env_variables(self) -> None:
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
+        self.log_async = os.getenv("LOG_ASYNC", "false").lower() in ("true", "1", "yes")
+        self.log_format = os.getenv("LOG_FORMAT", "text").lower()
+        self.log_request_sample_rate = float(os.getenv("LOG_REQUEST_SAMPLE_RATE", "1.0"))
+        self.log_text_max_length = int(os.getenv("LOG_TEXT_MAX_LENGTH", "200"))
+        self.log_redact_text = os.getenv("LOG_REDACT_TEXT", "false").lower() in ("true", "1", "yes")
         self.device = os.getenv("DEVICE", "cpu")
         self.fastapi_host = os.getenv("FASTAPI_HOST", "127.0.0.1")
         self.model_idle_timeout = int(os.getenv("MODEL_IDLE_TIMEOUT", "60"))
+        self.model_preload = os.getenv("MODEL_PRELOAD", "false").lower() in ("true", "1", "yes")
+        self.model_min_warm_workers = int(os.getenv("MODEL_MIN_WARM_WORKERS", "0"))
+        self.model_precision = os.getenv("MODEL_PRECISION", "fp32").lower()
+        self.model_fast_load = os.getenv("MODEL_FAST_LOAD", "false").lower() in ("true", "1", "yes")
+        self.model_shared_memory = os.getenv("MODEL_SHARED_MEMORY", "false").lower() in ("true", "1", "yes")
+        self.max_loaded_models = int(os.getenv("MAX_LOADED_MODELS", "0"))
+        self.model_memory_budget_mb = int(os.getenv("MODEL_MEMORY_BUDGET_MB", "0"))
+        self.model_eviction_policy = os.getenv("MODEL_EVICTION_POLICY", "lru").lower()
+        self.readiness_max_queue_depth = int(os.getenv("READINESS_MAX_QUEUE_DEPTH", "0"))
         self.translation_model_name = os.getenv("TRANSLATION_MODEL_NAME", "facebook/mbart-large-50-many-to-many-mmt")
+        self.translation_model_names = list(
+            dict.fromkeys(
+                model_name.strip()
+                for model_name in [self.translation_model_name, *os.getenv("TRANSLATION_MODEL_NAMES", "").split(",")]
+                if model_name.strip()
+            ),
+        )
+        self.translation_engine = os.getenv("TRANSLATION_ENGINE", "torch").lower()
         self.translation_model_download_path = os.getenv(
             "TRANSLATION_MODEL_DOWNLOAD_PATH",
             "downloaded_translation_models",
         )
+        self.translation_workers = int(os.getenv("TRANSLATION_WORKERS", "1"))
+        self.translation_worker_threads = int(os.getenv("TRANSLATION_WORKER_THREADS", "0"))
+        self.translation_batch_max_size = int(os.getenv("TRANSLATION_BATCH_MAX_SIZE", "8"))
+        self.translation_batch_max_wait_ms = int(os.getenv("TRANSLATION_BATCH_MAX_WAIT_MS", "10"))
+        self.translation_batch_max_in_flight = int(os.getenv("TRANSLATION_BATCH_MAX_IN_FLIGHT", "2"))
+        self.translation_max_input_tokens = int(os.getenv("TRANSLATION_MAX_INPUT_TOKENS", "400"))
+        self.translation_cache_enabled = os.getenv("TRANSLATION_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+        self.translation_cache_max_size = int(os.getenv("TRANSLATION_CACHE_MAX_SIZE", "10000"))
+        self.translation_cache_ttl = int(os.getenv("TRANSLATION_CACHE_TTL", "3600"))
+        self.translation_memory_enabled = os.getenv("TRANSLATION_MEMORY_ENABLED", "false").lower() in (
+            "true",
+            "1",
+            "yes",
+        )
+        self.translation_memory_max_entries = int(os.getenv("TRANSLATION_MEMORY_MAX_ENTRIES", "100000"))
+        self.translation_segment_cache_enabled = os.getenv("TRANSLATION_SEGMENT_CACHE_ENABLED", "false").lower() in (
+            "true",
+            "1",
+            "yes",
+        )
         try:
             self.fastapi_port = int(os.getenv("FASTAPI_PORT", "8000"))
         except ValueError:
@@ -48,12 +118,40 @@ class AppConfig:
         config_message = (
             f"Configuration loaded:\n"
             f"LOG_LEVEL: {self.log_level}\n"
+            f"LOG_ASYNC: {self.log_async}\n"
+            f"LOG_FORMAT: {self.log_format}\n"
+            f"LOG_REQUEST_SAMPLE_RATE: {self.log_request_sample_rate}\n"
+            f"LOG_TEXT_MAX_LENGTH: {self.log_text_max_length}\n"
+            f"LOG_REDACT_TEXT: {self.log_redact_text}\n"
             f"DEVICE: {self.device}\n"
             f"FASTAPI_HOST: {self.fastapi_host}\n"
             f"FASTAPI_PORT: {self.fastapi_port}\n"
             f"TRANSLATION_MODEL_NAME: {self.translation_model_name}\n"
+            f"TRANSLATION_MODEL_NAMES: {self.translation_model_names}\n"
+            f"TRANSLATION_ENGINE: {self.translation_engine}\n"
             f"TRANSLATION_MODEL_DOWNLOAD_PATH: {self.translation_model_download_path}\n"
-            f"MODEL_IDLE_TIMEOUT: {self.model_idle_timeout}"
+            f"MODEL_IDLE_TIMEOUT: {self.model_idle_timeout}\n"
+            f"MODEL_PRELOAD: {self.model_preload}\n"
+            f"MODEL_MIN_WARM_WORKERS: {self.model_min_warm_workers}\n"
+            f"MODEL_PRECISION: {self.model_precision}\n"
+            f"MODEL_FAST_LOAD: {self.model_fast_load}\n"
+            f"MODEL_SHARED_MEMORY: {self.model_shared_memory}\n"
+            f"MAX_LOADED_MODELS: {self.max_loaded_models}\n"
+            f"MODEL_MEMORY_BUDGET_MB: {self.model_memory_budget_mb}\n"
+            f"MODEL_EVICTION_POLICY: {self.model_eviction_policy}\n"
+            f"READINESS_MAX_QUEUE_DEPTH: {self.readiness_max_queue_depth}\n"
+            f"TRANSLATION_WORKERS: {self.translation_workers}\n"
+            f"TRANSLATION_WORKER_THREADS: {self.translation_worker_threads}\n"
+            f"TRANSLATION_BATCH_MAX_SIZE: {self.translation_batch_max_size}\n"
+            f"TRANSLATION_BATCH_MAX_WAIT_MS: {self.translation_batch_max_wait_ms}\n"
+            f"TRANSLATION_BATCH_MAX_IN_FLIGHT: {self.translation_batch_max_in_flight}\n"
+            f"TRANSLATION_MAX_INPUT_TOKENS: {self.translation_max_input_tokens}\n"
+            f"TRANSLATION_CACHE_ENABLED: {self.translation_cache_enabled}\n"
+            f"TRANSLATION_CACHE_MAX_SIZE: {self.translation_cache_max_size}\n"
+            f"TRANSLATION_CACHE_TTL: {self.translation_cache_ttl}\n"
+            f"TRANSLATION_MEMORY_ENABLED: {self.translation_memory_enabled}\n"
+            f"TRANSLATION_MEMORY_MAX_ENTRIES: {self.translation_memory_max_entries}\n"
+            f"TRANSLATION_SEGMENT_CACHE_ENABLED: {self.translation_segment_cache_enabled}"
         )
         logger.info(config_message)
         logger.info("Configuration initialized successfully.")
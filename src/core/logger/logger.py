@@ -1,6 +1,51 @@
-import inspect
+import atexit
 import logging
-from typing import Optional
+import os
+import queue
+import random
+import sys
+import uuid
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.logger.json_formatter import JsonFormatter
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_request_context: ContextVar[Optional[Tuple[str, bool]]] = ContextVar("log_request_context", default=None)
+
+
+class DeferredQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class RequestContextFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _request_context.get()
+        record.request_id = context[0] if context is not None else None
+        return True
+
+
+class LoggedText:
+    __slots__ = ("text", "max_length", "redact")
+
+    def __init__(self, text: str, max_length: int, redact: bool) -> None:
+        self.text = text
+        self.max_length = max_length
+        self.redact = redact
+
+    def __str__(self) -> str:
+        if self.redact:
+            return f"<redacted {len(self.text)} chars>"
+
+        max_length = self.max_length
+
+        if 0 < max_length < len(self.text):
+            return f"{self.text[:max_length]}... ({len(self.text)} chars)"
+
+        return self.text
 
 
 class Logger:
@@ -32,28 +77,96 @@ class Logger:
         self.logger = logging.getLogger("translation-api")
         self.logger.setLevel(logging.INFO)
         handler = logging.StreamHandler()
-        handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
         self.logger.addHandler(handler)
+        self.logger.addFilter(RequestContextFilter())
+        self.request_sample_rate = 1.0
+        self.text_max_length = 0
+        self.redact_text = False
+        self._listener: Optional[QueueListener] = None
+        self._sync_handlers: List[logging.Handler] = []
+        self._configure_uvicorn_loggers()
+
+    def _restore_sync_handlers(self) -> None:
+        if self._listener is None:
+            return
+
+        self.logger.handlers = self._sync_handlers
+        self._listener = None
         self._configure_uvicorn_loggers()
 
-    def _log(self, level: int, message: str) -> None:
-        caller = inspect.stack()[2]
-        module = inspect.getmodule(caller[0])
-        module_name = module.__name__ if module else "unknown_module"
-        log_message = f"{module_name}.{caller.function} - {message}"
-        self.logger.log(level, log_message)
+    def _log(self, level: int, message: str, args: Any) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
 
-    def info(self, message: str) -> None:
-        self._log(logging.INFO, message)
+        if level < logging.WARNING:
+            context = _request_context.get()
 
-    def error(self, message: str) -> None:
-        self._log(logging.ERROR, message)
+            if context is not None and not context[1]:
+                return
 
-    def debug(self, message: str) -> None:
-        self._log(logging.DEBUG, message)
+        caller = sys._getframe(2)
+        module_name = caller.f_globals.get("__name__", "unknown_module")
+        self.logger.log(level, f"{module_name}.{caller.f_code.co_name} - {message}", *args)
 
-    def warning(self, message: str) -> None:
-        self._log(logging.WARNING, message)
+    def info(self, message: str, *args: Any) -> None:
+        self._log(logging.INFO, message, args)
+
+    def error(self, message: str, *args: Any) -> None:
+        self._log(logging.ERROR, message, args)
+
+    def debug(self, message: str, *args: Any) -> None:
+        self._log(logging.DEBUG, message, args)
+
+    def warning(self, message: str, *args: Any) -> None:
+        self._log(logging.WARNING, message, args)
+
+    def configure(
+        self,
+        log_format: str,
+        request_sample_rate: float,
+        text_max_length: int,
+        redact_text: bool,
+    ) -> None:
+        formatter = JsonFormatter() if log_format == "json" else logging.Formatter(TEXT_FORMAT)
+
+        for handler in self._sync_handlers if self._listener is not None else self.logger.handlers:
+            handler.setFormatter(formatter)
+
+        self.request_sample_rate = min(max(request_sample_rate, 0.0), 1.0)
+        self.text_max_length = text_max_length
+        self.redact_text = redact_text
+
+    def begin_request(self) -> str:
+        request_id = uuid.uuid4().hex
+        _request_context.set((request_id, random.random() < self.request_sample_rate))  # nosec B311
+
+        return request_id
+
+    def text(self, value: str) -> LoggedText:
+        return LoggedText(value, self.text_max_length, self.redact_text)
+
+    def enable_async(self) -> None:
+        if self._listener is not None:
+            return
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._sync_handlers = list(self.logger.handlers)
+        self._listener = QueueListener(log_queue, *self._sync_handlers, respect_handler_level=True)
+        self.logger.handlers = [DeferredQueueHandler(log_queue)]
+        self._configure_uvicorn_loggers()
+        self._listener.start()
+        atexit.register(self.disable_async)
+
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._restore_sync_handlers)
+
+    def disable_async(self) -> None:
+        if self._listener is None:
+            return
+
+        self._listener.stop()
+        self._restore_sync_handlers()
 
     def set_level(self, log_level: str) -> None:
         self.info(f"Setting log level to {log_level}")
@@ -66,3 +179,10 @@ class Logger:
         self._configure_uvicorn_loggers()
 
         self.info("Log level set successfully.")
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_listener"] = None
+        state["_sync_handlers"] = []
+
+        return state
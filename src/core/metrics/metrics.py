@@ -0,0 +1,101 @@
+from typing import Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class Metrics:
+    _instance: Optional["Metrics"] = None
+
+    content_type = CONTENT_TYPE_LATEST
+
+    def __new__(cls) -> "Metrics":
+        if cls._instance is None:
+            cls._instance = super(Metrics, cls).__new__(cls)
+            cls._instance._initialize()
+
+        return cls._instance
+
+    def _initialize(self) -> None:
+        self.registry = CollectorRegistry()
+        self.http_request_duration_seconds = Histogram(
+            "http_request_duration_seconds",
+            "Time spent handling an HTTP request, until the last byte of the response body is sent",
+            ["method", "route", "status"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.queue_wait_seconds = Histogram(
+            "translation_queue_wait_seconds",
+            "Time a translation waits in the batch queue before being dispatched to a worker",
+            ["model", "source_language", "target_language"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.stage_seconds = Histogram(
+            "translation_stage_seconds",
+            "Time spent by the worker in each stage of the translation pipeline",
+            ["model", "source_language", "target_language", "stage"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.ipc_round_trip_seconds = Histogram(
+            "translation_ipc_round_trip_seconds",
+            "Batch round-trip time between the API process and the worker, excluding worker processing time",
+            ["model"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.batch_size = Histogram(
+            "translation_batch_size",
+            "Number of translations dispatched to a worker in one batch",
+            ["model"],
+            buckets=BATCH_SIZE_BUCKETS,
+            registry=self.registry,
+        )
+        self.tokens = Counter(
+            "translation_tokens",
+            "Number of tokens passed to and produced by the model",
+            ["model", "source_language", "target_language", "direction"],
+            registry=self.registry,
+        )
+        self.cache_requests = Counter(
+            "translation_cache_requests",
+            "Number of translation cache lookups",
+            ["cache", "result"],
+            registry=self.registry,
+        )
+        self.worker_restarts = Counter(
+            "translation_worker_restarts",
+            "Number of translation workers restarted after an unexpected exit",
+            ["worker"],
+            registry=self.registry,
+        )
+        self.model_evictions = Counter(
+            "translation_model_evictions",
+            "Number of translation models unloaded, by reason",
+            ["model", "reason"],
+            registry=self.registry,
+        )
+        self.model_memory_bytes = Gauge(
+            "translation_model_memory_bytes",
+            "Resident memory of the worker processes of each translation model at the last check",
+            ["model"],
+            registry=self.registry,
+        )
+
+    def record_cache_lookup(self, cache: str, hit: bool) -> None:
+        self.cache_requests.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+    def render(self) -> bytes:
+        output: bytes = generate_latest(self.registry)
+        return output
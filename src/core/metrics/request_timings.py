@@ -0,0 +1,54 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+_current_request_timings: ContextVar[Optional["RequestTimings"]] = ContextVar("request_timings", default=None)
+
+
+class RequestTimings:
+    def __init__(self) -> None:
+        self.stage_seconds: Dict[str, float] = {}
+
+    @staticmethod
+    def begin() -> "RequestTimings":
+        timings = RequestTimings()
+        _current_request_timings.set(timings)
+        return timings
+
+    @staticmethod
+    def current() -> Optional["RequestTimings"]:
+        return _current_request_timings.get()
+
+    @staticmethod
+    def record(stage_seconds: Dict[str, float]) -> None:
+        timings = _current_request_timings.get()
+
+        if timings is not None:
+            for stage, seconds in stage_seconds.items():
+                timings.add(stage, seconds)
+
+    @staticmethod
+    @contextmanager
+    def measure(stage: str) -> Iterator[None]:
+        timings = _current_request_timings.get()
+
+        if timings is None:
+            yield
+            return
+
+        started_at = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            timings.add(stage, time.perf_counter() - started_at)
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    def to_milliseconds(self) -> Dict[str, float]:
+        return {stage: round(seconds * 1000, 3) for stage, seconds in self.stage_seconds.items()}
+
+    def to_server_timing(self) -> str:
+        return ", ".join(f"{stage};dur={milliseconds}" for stage, milliseconds in self.to_milliseconds().items())
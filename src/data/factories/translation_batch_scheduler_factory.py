@@ -0,0 +1,36 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from core.metrics.metrics import Metrics
+from data.schedulers.translation_batch_scheduler import TranslationBatchScheduler
+from data.workers.translation_worker_pool import TranslationWorkerPool
+
+
+class TranslationBatchSchedulerFactory:
+    def __init__(
+        self,
+        config: Annotated[AppConfig, Depends()],
+        logger: Annotated[Logger, Depends()],
+        metrics: Annotated[Metrics, Depends()],
+    ):
+        self.config = config
+        self.logger = logger
+        self.metrics = metrics
+
+    def create(
+        self,
+        worker_pool: TranslationWorkerPool,
+        model_name: str,
+    ) -> TranslationBatchScheduler:
+        return TranslationBatchScheduler(
+            worker_pool,
+            max_batch_size=self.config.translation_batch_max_size,
+            max_wait_ms=self.config.translation_batch_max_wait_ms,
+            max_in_flight_batches=self.config.translation_batch_max_in_flight * len(worker_pool.workers),
+            logger=self.logger,
+            metrics=self.metrics,
+            model_name=model_name,
+        )
@@ -1,9 +1,15 @@
-from typing import Annotated, Union
+import os
+from typing import Annotated, Dict, Type, Union
 
 from fastapi import Depends
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from core.metrics.metrics import Metrics
+from data.workers.mbart_ctranslate2_translation_worker import (
+    MBartCTranslate2TranslationWorker,
+)
+from data.workers.mbart_onnx_translation_worker import MBartOnnxTranslationWorker
 from data.workers.mbart_translation_worker import (
     MBartTranslationConfig,
     MBartTranslationWorker,
@@ -12,9 +18,26 @@ from data.workers.seamless_translation_worker import (
     SeamlessTranslationConfig,
     SeamlessTranslationWorker,
 )
+from data.workers.translation_worker_pool import TranslationWorkerPool
 from domain.exceptions.unsupported_model_configuration_error import (
     UnsupportedModelConfigurationError,
 )
+from domain.exceptions.unsupported_model_precision_error import (
+    UnsupportedModelPrecisionError,
+)
+from domain.exceptions.unsupported_translation_engine_error import (
+    UnsupportedTranslationEngineError,
+)
+
+SUPPORTED_MODEL_PRECISIONS = ("fp32", "int8", "bf16")
+MBART_ENGINES: Dict[str, Type[MBartTranslationWorker]] = {
+    "torch": MBartTranslationWorker,
+    "onnx": MBartOnnxTranslationWorker,
+    "ctranslate2": MBartCTranslate2TranslationWorker,
+}
+SEAMLESS_ENGINES: Dict[str, Type[SeamlessTranslationWorker]] = {
+    "torch": SeamlessTranslationWorker,
+}
 
 
 class TranslationWorkerFactory:
@@ -22,30 +45,83 @@ class TranslationWorkerFactory:
         self,
         config: Annotated[AppConfig, Depends()],
         logger: Annotated[Logger, Depends()],
+        metrics: Annotated[Metrics, Depends()],
     ):
         self.config = config
         self.logger = logger
+        self.metrics = metrics
+
+    def _get_num_threads(self) -> int:
+        num_threads: int = self.config.translation_worker_threads or max(
+            (os.cpu_count() or 1) // self.config.translation_workers,
+            1,
+        )
+
+        return num_threads
+
+    def create(self, model_name: str) -> Union[MBartTranslationWorker, SeamlessTranslationWorker]:
+        if self.config.model_precision not in SUPPORTED_MODEL_PRECISIONS:
+            raise UnsupportedModelPrecisionError(self.config.model_precision)
 
-    def create(self) -> Union[MBartTranslationWorker, SeamlessTranslationWorker]:
-        if self.config.translation_model_name == "facebook/mbart-large-50-many-to-many-mmt":
-            return MBartTranslationWorker(
+        if model_name == "facebook/mbart-large-50-many-to-many-mmt":
+            if self.config.translation_engine not in MBART_ENGINES:
+                raise UnsupportedTranslationEngineError(
+                    self.config.translation_engine,
+                    model_name,
+                )
+
+            return MBART_ENGINES[self.config.translation_engine](
                 MBartTranslationConfig(
                     device=self.config.device,
-                    model_name=self.config.translation_model_name,
+                    model_name=model_name,
                     model_download_path=self.config.translation_model_download_path,
                     log_level=self.config.log_level,
+                    num_threads=self._get_num_threads(),
+                    max_input_tokens=self.config.translation_max_input_tokens,
+                    precision=self.config.model_precision,
+                    fast_load=self.config.model_fast_load,
                 ),
                 logger=self.logger,
             )
-        elif self.config.translation_model_name == "facebook/seamless-m4t-v2-large":
-            return SeamlessTranslationWorker(
+        elif model_name == "facebook/seamless-m4t-v2-large":
+            if self.config.translation_engine not in SEAMLESS_ENGINES:
+                raise UnsupportedTranslationEngineError(
+                    self.config.translation_engine,
+                    model_name,
+                )
+
+            return SEAMLESS_ENGINES[self.config.translation_engine](
                 SeamlessTranslationConfig(
                     device=self.config.device,
-                    model_name=self.config.translation_model_name,
+                    model_name=model_name,
                     model_download_path=self.config.translation_model_download_path,
                     log_level=self.config.log_level,
+                    num_threads=self._get_num_threads(),
+                    max_input_tokens=self.config.translation_max_input_tokens,
+                    precision=self.config.model_precision,
+                    fast_load=self.config.model_fast_load,
                 ),
                 logger=self.logger,
             )
         else:
-            raise UnsupportedModelConfigurationError(self.config.translation_model_name)
+            raise UnsupportedModelConfigurationError(model_name)
+
+    def _use_shared_memory(self) -> bool:
+        if not self.config.model_shared_memory:
+            return False
+
+        if self.config.translation_engine != "torch" or self.config.device != "cpu":
+            self.logger.warning(
+                "MODEL_SHARED_MEMORY is only supported by the torch engine on cpu, each worker loads its own model",
+            )
+            return False
+
+        return True
+
+    def create_pool(self, model_name: str) -> TranslationWorkerPool:
+        return TranslationWorkerPool(
+            [self.create(model_name) for _ in range(max(self.config.translation_workers, 1))],
+            logger=self.logger,
+            metrics=self.metrics,
+            shared_memory=self._use_shared_memory(),
+        )
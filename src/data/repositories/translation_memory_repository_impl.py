@@ -0,0 +1,212 @@
+import hashlib
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Annotated, Any, Dict, List, Optional, Tuple
+
+from fastapi import Depends
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from core.metrics.metrics import Metrics
+from core.metrics.request_timings import RequestTimings
+from data.repositories.directory_repository_impl import DirectoryRepositoryImpl
+from domain.repositories.directory_repository import DirectoryRepository
+from domain.repositories.translation_memory_repository import (
+    TranslationMemoryRepository,
+)
+
+TranslationMemoryWrite = Tuple[bytes, Optional[str], float]
+
+
+class TranslationMemoryRepositoryImpl(TranslationMemoryRepository):  # type: ignore
+    _instance: Optional["TranslationMemoryRepositoryImpl"] = None
+    _lock = threading.Lock()
+
+    def __new__(
+        cls,
+        config: Annotated[AppConfig, Depends()],
+        directory_repository: Annotated[DirectoryRepository, Depends(DirectoryRepositoryImpl)],
+        logger: Annotated[Logger, Depends()],
+        metrics: Annotated[Metrics, Depends()],
+    ) -> "TranslationMemoryRepositoryImpl":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(TranslationMemoryRepositoryImpl, cls).__new__(cls)
+                    cls._instance._initialize(config, directory_repository, logger, metrics)
+
+        return cls._instance
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS translation_memory ("
+            "key BLOB PRIMARY KEY, translation TEXT NOT NULL, last_access REAL NOT NULL) WITHOUT ROWID",
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS translation_memory_last_access ON translation_memory (last_access)",
+        )
+
+        return connection
+
+    def _apply_writes(self, writes: List[TranslationMemoryWrite], evict: bool) -> None:
+        inserts = [
+            (key, translation, last_access) for key, translation, last_access in writes if translation is not None
+        ]
+        touches = [(last_access, key) for key, translation, last_access in writes if translation is None]
+
+        if self._writer is None:
+            return
+
+        self._writer.execute("BEGIN")
+        self._writer.executemany(
+            "INSERT INTO translation_memory (key, translation, last_access) VALUES (?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET translation = excluded.translation, last_access = excluded.last_access",
+            inserts,
+        )
+        self._writer.executemany("UPDATE translation_memory SET last_access = ? WHERE key = ?", touches)
+
+        if evict:
+            self._writer.execute(
+                "DELETE FROM translation_memory WHERE key IN ("
+                "SELECT key FROM translation_memory ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+        self._writer.execute("COMMIT")
+
+    def _write_behind(self) -> None:
+        inserts_since_eviction = 0
+
+        while True:
+            writes: List[TranslationMemoryWrite] = [self._writes.get()]
+
+            while not self._writes.empty() and len(writes) < 1000:
+                writes.append(self._writes.get_nowait())
+
+            inserts_since_eviction += sum(1 for _, translation, _ in writes if translation is not None)
+            evict = self.max_entries > 0 and inserts_since_eviction >= max(self.max_entries // 100, 1)
+
+            if evict:
+                inserts_since_eviction = 0
+
+            try:
+                self._apply_writes(writes, evict)
+            except sqlite3.Error as e:
+                if self._writer is not None and self._writer.in_transaction:
+                    self._writer.execute("ROLLBACK")
+
+                self.logger.error(f"Failed to write translation memory: {e}")
+            finally:
+                for _ in writes:
+                    self._writes.task_done()
+
+    def _initialize(
+        self,
+        config: AppConfig,
+        directory_repository: DirectoryRepository,
+        logger: Logger,
+        metrics: Metrics,
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.metrics = metrics
+        self.enabled = bool(config.translation_memory_enabled)
+        self.max_entries = config.translation_memory_max_entries
+        self._writes: "queue.Queue[TranslationMemoryWrite]" = queue.Queue()
+        self._reader_lock = threading.Lock()
+        self._reader: Optional[sqlite3.Connection] = None
+        self._writer: Optional[sqlite3.Connection] = None
+
+        if self.enabled:
+            path = os.path.join(config.translation_model_download_path, "translation_memory.sqlite3")
+            directory_repository.create_directory(config.translation_model_download_path)
+            self._writer = self._connect(path)
+            self._reader = self._connect(path)
+            threading.Thread(target=self._write_behind, daemon=True).start()
+            self.logger.info(f"Translation memory opened at: {path}")
+
+    @staticmethod
+    def _create_key(
+        text_to_translate: str,
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        model_name: str,
+    ) -> bytes:
+        canonical = json.dumps(
+            [
+                model_name,
+                source_language,
+                target_language,
+                unicodedata.normalize("NFC", text_to_translate).strip(),
+                generation_parameters,
+            ],
+            sort_keys=True,
+            default=str,
+            ensure_ascii=False,
+        )
+
+        return hashlib.sha256(canonical.encode("utf-8")).digest()[:16]
+
+    def _is_cacheable(self, generation_parameters: Dict[str, Any]) -> bool:
+        return self._reader is not None and not generation_parameters.get("do_sample")
+
+    def find(
+        self,
+        text_to_translate: str,
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        model_name: str,
+    ) -> Optional[str]:
+        if not self._is_cacheable(generation_parameters):
+            return None
+
+        key = self._create_key(text_to_translate, source_language, target_language, generation_parameters, model_name)
+
+        with RequestTimings.measure("memory_lookup"), self._reader_lock:
+            if self._reader is None:
+                return None
+
+            row = self._reader.execute(
+                "SELECT translation FROM translation_memory WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+        self.metrics.record_cache_lookup("memory", row is not None)
+
+        if row is None:
+            return None
+
+        self._writes.put((key, None, time.time()))
+        translation: str = row[0]
+
+        return translation
+
+    def save(
+        self,
+        text_to_translate: str,
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        translation: str,
+        model_name: str,
+    ) -> None:
+        if not self._is_cacheable(generation_parameters):
+            return
+
+        key = self._create_key(text_to_translate, source_language, target_language, generation_parameters, model_name)
+        self._writes.put((key, translation, time.time()))
+
+    def flush(self) -> None:
+        if self._writer is not None:
+            self._writes.join()
@@ -1,17 +1,54 @@
+import asyncio
+import functools
+import json
 import threading
 import time
-from typing import Annotated, Any, Dict, Optional
+import unicodedata
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 
 from fastapi import Depends
 
+from core.cache.lru_ttl_cache import LruTtlCache, LruTtlCacheFactory
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
-from core.timer.timer import TimerFactory
+from core.metrics.metrics import Metrics
+from core.metrics.request_timings import RequestTimings
+from core.timer.timer import Timer, TimerFactory
+from data.factories.translation_batch_scheduler_factory import (
+    TranslationBatchSchedulerFactory,
+)
 from data.factories.translation_worker_factory import TranslationWorkerFactory
 from data.repositories.directory_repository_impl import DirectoryRepositoryImpl
+from data.repositories.translation_memory_repository_impl import (
+    TranslationMemoryRepositoryImpl,
+)
+from data.schedulers.translation_batch_scheduler import TranslationBatchScheduler
+from data.workers.translation_worker_pool import TranslationWorkerPool
+from domain.exceptions.unsupported_model_configuration_error import (
+    UnsupportedModelConfigurationError,
+)
+from domain.models.translation_model_status import TranslationModelStatus
 from domain.repositories.directory_repository import DirectoryRepository
+from domain.repositories.translation_memory_repository import (
+    TranslationMemoryRepository,
+)
 from domain.repositories.translation_model_repository import TranslationModelRepository
 
+TranslationCacheKey = Tuple[str, str, str, str, str]
+SharedTranslation = Tuple["Future[str]", int, Dict[str, float]]
+
+
+@dataclass
+class HostedTranslationModel:
+    worker_pool: TranslationWorkerPool
+    scheduler: TranslationBatchScheduler
+    timer: Timer
+    last_access_time: float = 0.0
+    request_count: int = 0
+    rss_bytes: int = 0
+
 
 class TranslationModelRepositoryImpl(TranslationModelRepository):  # type: ignore
     _instance: Optional["TranslationModelRepositoryImpl"] = None
@@ -24,12 +61,29 @@ class TranslationModelRepositoryImpl(TranslationModelRepository):  # type: ignor
         timer_factory: Annotated[TimerFactory, Depends()],
         logger: Annotated[Logger, Depends()],
         worker_factory: Annotated[TranslationWorkerFactory, Depends()],
+        scheduler_factory: Annotated[TranslationBatchSchedulerFactory, Depends()],
+        cache_factory: Annotated[LruTtlCacheFactory, Depends()],
+        metrics: Annotated[Metrics, Depends()],
+        translation_memory_repository: Annotated[
+            TranslationMemoryRepository,
+            Depends(TranslationMemoryRepositoryImpl),
+        ],
     ) -> "TranslationModelRepositoryImpl":
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super(TranslationModelRepositoryImpl, cls).__new__(cls)
-                    cls._instance._initialize(config, directory_repository, timer_factory, logger, worker_factory)
+                    cls._instance._initialize(
+                        config,
+                        directory_repository,
+                        timer_factory,
+                        logger,
+                        worker_factory,
+                        scheduler_factory,
+                        cache_factory,
+                        metrics,
+                        translation_memory_repository,
+                    )
 
         return cls._instance
 
@@ -40,55 +94,386 @@ class TranslationModelRepositoryImpl(TranslationModelRepository):  # type: ignor
         timer_factory: TimerFactory,
         logger: Logger,
         worker_factory: TranslationWorkerFactory,
+        scheduler_factory: TranslationBatchSchedulerFactory,
+        cache_factory: LruTtlCacheFactory,
+        metrics: Metrics,
+        translation_memory_repository: TranslationMemoryRepository,
     ) -> None:
         directory_repository.create_directory(config.translation_model_download_path)
         self.config = config
-        self.timer = timer_factory.create()
         self.logger = logger
-        self.worker = worker_factory.create()
-        self.last_access_time = 0.0
+        self.metrics = metrics
+        self.translation_memory_repository = translation_memory_repository
+        self.models: Dict[str, HostedTranslationModel] = {}
+
+        for model_name in config.translation_model_names:
+            worker_pool = worker_factory.create_pool(model_name)
+            self.models[model_name] = HostedTranslationModel(
+                worker_pool=worker_pool,
+                scheduler=scheduler_factory.create(worker_pool, model_name),
+                timer=timer_factory.create(),
+            )
+
+        self._in_flight: Dict[TranslationCacheKey, SharedTranslation] = {}
+        self._in_flight_lock = threading.Lock()
+        self.cache: Optional[LruTtlCache[TranslationCacheKey, str]] = (
+            cache_factory.create(config.translation_cache_max_size, config.translation_cache_ttl)
+            if config.translation_cache_enabled
+            else None
+        )
+
+    def _get_model(self, model_name: str) -> HostedTranslationModel:
+        if model_name not in self.models:
+            raise UnsupportedModelConfigurationError(model_name)
+
+        return self.models[model_name]
+
+    @staticmethod
+    def _is_idle(model: HostedTranslationModel) -> bool:
+        return (
+            not model.worker_pool.is_processing()
+            and model.worker_pool.pending_count() == 0
+            and model.scheduler.pending_count() == 0
+        )
+
+    def _eviction_key(self, model_name: str) -> Tuple[int, float]:
+        model = self.models[model_name]
+
+        if self.config.model_eviction_policy == "lfu":
+            return model.request_count, model.last_access_time
+
+        return 0, model.last_access_time
+
+    def _unload(self, model_name: str, reason: str, keep_workers: int = 0) -> None:
+        model = self.models[model_name]
+        model.worker_pool.stop(keep_workers)
+        model.timer.cancel()
+        self.metrics.model_evictions.labels(model=model_name, reason=reason).inc()
+        self.metrics.model_memory_bytes.labels(model=model_name).set(model.worker_pool.rss_bytes())
 
-    def _check_idle_timeout(self) -> None:
-        self.logger.debug("Checking translation model idle timeout")
+    def _measure_memory(self) -> int:
+        used = 0
 
-        if self.worker.is_alive() and not self.worker.is_processing():
+        for model_name, model in self.models.items():
+            if model.worker_pool.is_alive():
+                model.rss_bytes = model.worker_pool.rss_bytes()
+                used += model.rss_bytes
+
+            self.metrics.model_memory_bytes.labels(model=model_name).set(
+                model.rss_bytes if model.worker_pool.is_alive() else 0,
+            )
+
+        return used
+
+    def _enforce_memory_budget(self, model_name: Optional[str], required_bytes: int) -> None:
+        budget = self.config.model_memory_budget_mb * 1024 * 1024
+        used = self._measure_memory()
+        loaded = [name for name, model in self.models.items() if name != model_name and model.worker_pool.is_alive()]
+
+        while loaded and used + required_bytes > budget:
+            idle = [name for name in loaded if self._is_idle(self.models[name])]
+
+            if not idle:
+                self.logger.warning(
+                    "Translation models use %d MB, exceeding MODEL_MEMORY_BUDGET_MB, no idle model can be unloaded",
+                    (used + required_bytes) // (1024 * 1024),
+                )
+                return
+
+            unloaded = min(idle, key=self._eviction_key)
+            used -= self.models[unloaded].rss_bytes
+            self._unload(unloaded, "memory_budget")
+            loaded.remove(unloaded)
+            self.logger.info("Translation model %s unloaded to stay within MODEL_MEMORY_BUDGET_MB", unloaded)
+
+    def _check_idle_timeout(self, model_name: str) -> None:
+        self.logger.debug("Checking translation model idle timeout for %s", model_name)
+
+        if self.config.model_memory_budget_mb > 0:
             with self._lock:
-                self.worker.stop()
-                self.timer.cancel()
-                self.logger.info("Translation model stopped due to idle timeout")
+                self._enforce_memory_budget(None, 0)
+
+            return
+
+        model = self.models[model_name]
+        keep_warm = (
+            max(self.config.model_min_warm_workers, 1 if self.config.model_preload else 0)
+            if model_name == self.config.translation_model_name
+            else 0
+        )
+
+        with self._lock:
+            if model.worker_pool.alive_count() > keep_warm and self._is_idle(model):
+                self._unload(model_name, "idle_timeout", keep_warm)
+                self.logger.info(
+                    "Translation model %s stopped due to idle timeout, keeping %d warm workers",
+                    model_name,
+                    keep_warm,
+                )
 
-    def translate(
+    def _enforce_max_loaded_models(self, model_name: str) -> None:
+        if self.config.max_loaded_models <= 0:
+            return
+
+        loaded = [name for name, model in self.models.items() if name != model_name and model.worker_pool.is_alive()]
+
+        while len(loaded) >= self.config.max_loaded_models:
+            idle = [name for name in loaded if self._is_idle(self.models[name])]
+
+            if not idle:
+                self.logger.warning(
+                    "Loading translation model %s exceeds MAX_LOADED_MODELS, no idle model can be unloaded",
+                    model_name,
+                )
+                return
+
+            unloaded = min(idle, key=self._eviction_key)
+            self._unload(unloaded, "max_loaded_models")
+            loaded.remove(unloaded)
+            self.logger.info("Translation model %s unloaded to load %s", unloaded, model_name)
+
+    def _ensure_started(self, model_name: str) -> HostedTranslationModel:
+        model = self._get_model(model_name)
+
+        with self._lock:
+            if not model.worker_pool.is_alive():
+                self._enforce_max_loaded_models(model_name)
+
+                if self.config.model_memory_budget_mb > 0:
+                    self._enforce_memory_budget(model_name, model.rss_bytes)
+
+            model.worker_pool.start()
+            model.scheduler.start()
+
+        return model
+
+    def _mark_accessed(self, model_name: str) -> None:
+        model = self.models[model_name]
+        model.timer.start(
+            self.config.model_idle_timeout,
+            functools.partial(self._check_idle_timeout, model_name),
+        )
+
+        model.last_access_time = time.time()
+        model.request_count += 1
+
+    @staticmethod
+    def _create_cache_key(
+        model_name: str,
+        text_to_translate: str,
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+    ) -> Optional[TranslationCacheKey]:
+        if generation_parameters.get("do_sample"):
+            return None
+
+        return (
+            model_name,
+            source_language,
+            target_language,
+            unicodedata.normalize("NFC", text_to_translate).strip(),
+            json.dumps(generation_parameters, sort_keys=True, default=str),
+        )
+
+    async def _await_shared(
         self,
+        scheduler: TranslationBatchScheduler,
+        cache_key: TranslationCacheKey,
         text_to_translate: str,
         source_language: str,
         target_language: str,
         generation_parameters: Dict[str, Any],
     ) -> str:
-        with self._lock:
-            if not self.worker.is_alive():
-                self.logger.info("Starting translation worker")
-                self.worker.start()
+        with self._in_flight_lock:
+            shared = self._in_flight.get(cache_key)
 
-        self.logger.debug(
-            f"Translating started from source_language: {source_language}, target_language: {target_language}",
+            if shared is None:
+                stage_seconds: Dict[str, float] = {}
+                future = scheduler.submit(
+                    text_to_translate,
+                    source_language,
+                    target_language,
+                    generation_parameters,
+                    stage_seconds,
+                )
+                waiters = 0
+            else:
+                self.logger.debug("Joining identical in-flight translation")
+                future, waiters, stage_seconds = shared
+
+            self._in_flight[cache_key] = (future, waiters + 1, stage_seconds)
+
+        try:
+            translation: str = await asyncio.shield(asyncio.wrap_future(future))
+            RequestTimings.record(stage_seconds)
+            return translation
+
+        finally:
+            with self._in_flight_lock:
+                _, waiters, _ = self._in_flight[cache_key]
+
+                if waiters > 1:
+                    self._in_flight[cache_key] = (future, waiters - 1, stage_seconds)
+                else:
+                    del self._in_flight[cache_key]
+                    future.cancel()
+
+    async def _translate_text(
+        self,
+        text_to_translate: str,
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        model_name: str,
+    ) -> str:
+        cache_key = self._create_cache_key(
+            model_name,
+            text_to_translate,
+            source_language,
+            target_language,
+            generation_parameters,
         )
 
-        translation: str = self.worker.translate(
+        if self.cache is not None and cache_key is not None:
+            with RequestTimings.measure("cache_lookup"):
+                cached_translation: Optional[str] = self.cache.get(cache_key)
+
+            self.metrics.record_cache_lookup("result", cached_translation is not None)
+
+            if cached_translation is not None:
+                return cached_translation
+
+        if cache_key is not None and self.config.translation_memory_enabled:
+            remembered_translation: Optional[str] = await asyncio.to_thread(
+                self.translation_memory_repository.find,
+                text_to_translate,
+                source_language,
+                target_language,
+                generation_parameters,
+                model_name,
+            )
+
+            if remembered_translation is not None:
+                if self.cache is not None:
+                    self.cache.set(cache_key, remembered_translation)
+
+                return remembered_translation
+
+        with RequestTimings.measure("worker_start"):
+            model = await asyncio.to_thread(self._ensure_started, model_name)
+
+        if cache_key is None:
+            stage_seconds: Dict[str, float] = {}
+            translation: str = await asyncio.wrap_future(
+                model.scheduler.submit(
+                    text_to_translate,
+                    source_language,
+                    target_language,
+                    generation_parameters,
+                    stage_seconds,
+                ),
+            )
+            RequestTimings.record(stage_seconds)
+        else:
+            translation = await self._await_shared(
+                model.scheduler,
+                cache_key,
+                text_to_translate,
+                source_language,
+                target_language,
+                generation_parameters,
+            )
+
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, translation)
+
+        self.translation_memory_repository.save(
             text_to_translate,
             source_language,
             target_language,
             generation_parameters,
+            translation,
+            model_name,
         )
 
-        self.timer.start(
-            self.config.model_idle_timeout,
-            self._check_idle_timeout,
+        return translation
+
+    def preload(self, model_name: str) -> None:
+        self.logger.info("Preloading translation model %s", model_name)
+        self._ensure_started(model_name)
+        self._mark_accessed(model_name)
+
+    def get_status(self) -> TranslationModelStatus:
+        models = list(self.models.values())
+        last_used_model = max(models, key=lambda model: model.last_access_time)
+
+        return TranslationModelStatus(
+            alive=any(model.worker_pool.is_alive() for model in models),
+            model_loaded=any(model.worker_pool.is_ready() for model in models),
+            worker_pids=[pid for model in models for pid in model.worker_pool.pids() if pid is not None],
+            queue_depth=sum(model.scheduler.queue_depth() for model in models),
+            in_flight=sum(model.scheduler.in_flight_count() for model in models),
+            last_inference_latency_ms=last_used_model.scheduler.last_batch_latency_ms,
+            loaded_models=[name for name, model in self.models.items() if model.worker_pool.is_ready()],
         )
 
-        self.last_access_time = time.time()
+    async def translate(
+        self,
+        text_to_translate: str,
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        model_name: str,
+    ) -> str:
+        self.logger.debug(
+            "Translating started from source_language: %s, target_language: %s",
+            source_language,
+            target_language,
+        )
+
+        translation = await self._translate_text(
+            text_to_translate,
+            source_language,
+            target_language,
+            generation_parameters,
+            model_name,
+        )
+
+        self._mark_accessed(model_name)
 
         self.logger.debug(
-            f"Translating completed from source_language: {source_language}, target_language: {target_language}",
+            "Translating completed from source_language: %s, target_language: %s",
+            source_language,
+            target_language,
         )
 
         return translation
+
+    async def translate_batch(
+        self,
+        requests: List[Tuple[str, str, str, Dict[str, Any]]],
+        model_name: str,
+    ) -> List[str]:
+        self.logger.debug("Batch translating started for %d texts", len(requests))
+
+        translations: List[str] = list(
+            await asyncio.gather(
+                *(
+                    self._translate_text(
+                        text_to_translate,
+                        source_language,
+                        target_language,
+                        generation_parameters,
+                        model_name,
+                    )
+                    for text_to_translate, source_language, target_language, generation_parameters in requests
+                ),
+            ),
+        )
+
+        self._mark_accessed(model_name)
+
+        self.logger.debug("Batch translating completed for %d texts", len(requests))
+
+        return translations
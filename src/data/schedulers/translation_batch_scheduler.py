@@ -0,0 +1,235 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from core.logger.logger import Logger
+from core.metrics.metrics import Metrics
+from data.workers.base_translation_worker import (
+    TranslationBatchOutput,
+    TranslationRequest,
+    TranslationResult,
+)
+from data.workers.translation_worker_pool import TranslationWorkerPool
+
+
+@dataclass
+class ScheduledTranslation:
+    request: TranslationRequest
+    future: "Future[str]" = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+
+
+class TranslationBatchScheduler:
+    def __init__(
+        self,
+        worker_pool: TranslationWorkerPool,
+        max_batch_size: int,
+        max_wait_ms: int,
+        max_in_flight_batches: int,
+        logger: Logger,
+        metrics: Metrics,
+        model_name: str,
+    ) -> None:
+        self.worker_pool = worker_pool
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max(max_wait_ms, 0) / 1000
+        self.max_in_flight_batches = max(max_in_flight_batches, 1)
+        self.logger = logger
+        self.metrics = metrics
+        self.model_name = model_name
+        self._dispatch_slots = threading.Semaphore(self.max_in_flight_batches)
+        self._queue: "queue.Queue[ScheduledTranslation]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._in_flight = 0
+        self._pending = 0
+        self.last_batch_latency_ms: Optional[float] = None
+
+    def _collect_batch(self) -> List[ScheduledTranslation]:
+        try:
+            batch = [self._queue.get(timeout=1)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _drop_cancelled(self, batch: List[ScheduledTranslation]) -> List[ScheduledTranslation]:
+        active = [scheduled for scheduled in batch if not scheduled.future.cancelled()]
+
+        if len(active) < len(batch):
+            self.logger.debug("Dropping %d cancelled translation requests", len(batch) - len(active))
+
+            with self._stats_lock:
+                self._pending -= len(batch) - len(active)
+
+        return active
+
+    @staticmethod
+    def _set_result(scheduled: ScheduledTranslation, result: TranslationResult) -> None:
+        if not scheduled.future.set_running_or_notify_cancel():
+            return
+
+        if isinstance(result, Exception):
+            scheduled.future.set_exception(result)
+        else:
+            scheduled.future.set_result(result)
+
+    def _record_batch_metrics(self, output: TranslationBatchOutput, round_trip_seconds: float) -> None:
+        self.metrics.ipc_round_trip_seconds.labels(model=self.model_name).observe(
+            max(round_trip_seconds - output.duration_seconds, 0.0),
+        )
+
+        for stats in output.group_stats:
+            labels = (self.model_name, stats.source_language, stats.target_language)
+
+            for stage, seconds in stats.stage_seconds.items():
+                self.metrics.stage_seconds.labels(*labels, stage).observe(seconds)
+
+            self.metrics.tokens.labels(*labels, "input").inc(stats.input_tokens)
+            self.metrics.tokens.labels(*labels, "output").inc(stats.output_tokens)
+
+    @staticmethod
+    def _record_stage_seconds(
+        batch: List[ScheduledTranslation],
+        output: TranslationBatchOutput,
+        round_trip_seconds: float,
+    ) -> None:
+        for scheduled in batch:
+            scheduled.stage_seconds["ipc"] = max(round_trip_seconds - output.duration_seconds, 0.0)
+
+        for stats in output.group_stats:
+            for index in stats.indices:
+                batch[index].stage_seconds.update(stats.stage_seconds)
+
+    def _complete(
+        self,
+        batch: List[ScheduledTranslation],
+        batch_future: "Future[TranslationBatchOutput]",
+        dispatched_at: float,
+    ) -> None:
+        self._dispatch_slots.release()
+        round_trip_seconds = time.perf_counter() - dispatched_at
+
+        with self._stats_lock:
+            self._in_flight -= len(batch)
+            self.last_batch_latency_ms = round_trip_seconds * 1000
+
+        results: List[TranslationResult]
+
+        try:
+            output = batch_future.result()
+            results = output.results
+            self._record_batch_metrics(output, round_trip_seconds)
+            self._record_stage_seconds(batch, output, round_trip_seconds)
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for scheduled, result in zip(batch, results):
+            self._set_result(scheduled, result)
+
+    def _dispatch(self, batch: List[ScheduledTranslation]) -> None:
+        self.logger.debug("Dispatching batch of %d translation requests", len(batch))
+
+        try:
+            batch_future = self.worker_pool.translate_batch([scheduled.request for scheduled in batch])
+        except Exception as e:
+            self._dispatch_slots.release()
+
+            with self._stats_lock:
+                self._pending -= len(batch)
+
+            for scheduled in batch:
+                self._set_result(scheduled, e)
+
+            return
+
+        dispatched_at = time.perf_counter()
+
+        with self._stats_lock:
+            self._pending -= len(batch)
+            self._in_flight += len(batch)
+
+        self.metrics.batch_size.labels(model=self.model_name).observe(len(batch))
+
+        for scheduled in batch:
+            _, source_language, target_language, _ = scheduled.request
+            scheduled.stage_seconds["queue"] = dispatched_at - scheduled.enqueued_at
+            self.metrics.queue_wait_seconds.labels(self.model_name, source_language, target_language).observe(
+                scheduled.stage_seconds["queue"],
+            )
+
+        batch_future.add_done_callback(lambda future: self._complete(batch, future, dispatched_at))
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            if not self._dispatch_slots.acquire(timeout=1):
+                continue
+
+            batch = self._drop_cancelled(self._collect_batch())
+
+            if batch:
+                self._dispatch(batch)
+            else:
+                self._dispatch_slots.release()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop_event.clear()
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                self._stop_event.set()
+                self._thread.join(timeout=5)
+
+            self._thread = None
+
+    def submit(
+        self,
+        text_to_translate: str,
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        stage_seconds: Optional[Dict[str, float]] = None,
+    ) -> "Future[str]":
+        scheduled = ScheduledTranslation(
+            request=(text_to_translate, source_language, target_language, generation_parameters),
+            stage_seconds=stage_seconds if stage_seconds is not None else {},
+        )
+
+        with self._stats_lock:
+            self._pending += 1
+
+        self._queue.put(scheduled)
+
+        return scheduled.future
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def pending_count(self) -> int:
+        with self._stats_lock:
+            return self._pending
+
+    def in_flight_count(self) -> int:
+        with self._stats_lock:
+            return self._in_flight
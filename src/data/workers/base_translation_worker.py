@@ -0,0 +1,399 @@
+import itertools
+import json
+import multiprocessing.synchronize
+import os
+import shutil
+import tempfile
+import time
+from abc import abstractmethod
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from multiprocessing.sharedctypes import Synchronized
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import torch
+from filelock import FileLock
+
+from data.workers.base_worker import BaseWorker, ConfigType, SharedObjectType
+from domain.exceptions.unsupported_worker_command_error import (
+    UnsupportedWorkerCommandError,
+)
+from domain.services.text_segmentation_service import TextSegmentationService
+
+TranslationRequest = Tuple[str, str, str, Dict[str, Any]]
+TranslationResult = Union[str, Exception]
+TextLayout = Tuple[str, List[str], str]
+
+
+@dataclass
+class TranslationGroupStats:
+    source_language: str
+    target_language: str
+    indices: List[int]
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+@dataclass
+class TranslationBatchOutput:
+    results: List[TranslationResult]
+    group_stats: List[TranslationGroupStats]
+    duration_seconds: float
+
+
+class BaseTranslationWorker(
+    BaseWorker[  # type: ignore
+        List[TranslationRequest],
+        TranslationBatchOutput,
+        ConfigType,
+        SharedObjectType,
+    ],
+):
+    _group_stats: Optional[TranslationGroupStats] = None
+
+    @staticmethod
+    def group_requests(
+        requests: Sequence[TranslationRequest],
+    ) -> List[Tuple[List[int], str, str, Dict[str, Any]]]:
+        groups: Dict[Tuple[str, str, str], Tuple[List[int], str, str, Dict[str, Any]]] = {}
+
+        for index, (_, source_language, target_language, generation_parameters) in enumerate(requests):
+            key = (
+                source_language,
+                target_language,
+                json.dumps(generation_parameters, sort_keys=True, default=str),
+            )
+
+            if key not in groups:
+                groups[key] = ([], source_language, target_language, dict(generation_parameters))
+
+            groups[key][0].append(index)
+
+        return list(groups.values())
+
+    @staticmethod
+    def join_sequences(
+        sequences: List[str],
+        input_count: int,
+    ) -> List[str]:
+        sequences_per_input = max(len(sequences) // input_count, 1)
+        joined: List[str] = []
+
+        for index in range(input_count):
+            start, end = index * sequences_per_input, (index + 1) * sequences_per_input
+            joined.append("".join(sequences[start:end]))
+
+        return joined
+
+    @staticmethod
+    def merge_segments(
+        segments: List[Tuple[str, str]],
+        token_counts: List[int],
+        max_input_tokens: int,
+    ) -> List[Tuple[str, str]]:
+        chunks: List[Tuple[str, str]] = []
+        chunk_tokens = 0
+
+        for (segment, separator), token_count in zip(segments, token_counts):
+            if chunks and "\n" not in chunks[-1][1] and chunk_tokens + token_count <= max_input_tokens:
+                chunks[-1] = (chunks[-1][0] + chunks[-1][1] + segment, separator)
+                chunk_tokens += token_count
+            else:
+                chunks.append((segment, separator))
+                chunk_tokens = token_count
+
+        return chunks
+
+    @staticmethod
+    def join_chunks(
+        translations: List[str],
+        layouts: List[TextLayout],
+    ) -> List[str]:
+        translated: Iterator[str] = iter(translations)
+
+        return [
+            prefix + "".join(next(translated) + separator for separator in separators) + suffix
+            for prefix, separators, suffix in layouts
+        ]
+
+    def split_texts(
+        self,
+        texts: List[str],
+        shared_object: SharedObjectType,
+        config: ConfigType,
+    ) -> Tuple[List[str], List[TextLayout]]:
+        max_input_tokens = self.get_max_input_tokens(config)
+
+        if max_input_tokens <= 0:
+            return list(texts), [("", [""], "") for _ in texts]
+
+        chunks: List[str] = []
+        layouts: List[TextLayout] = []
+
+        for text, token_count in zip(texts, self.count_tokens(texts, shared_object)):
+            if token_count <= max_input_tokens:
+                chunks.append(text)
+                layouts.append(("", [""], ""))
+                continue
+
+            start = len(text) - len(text.lstrip())
+            end = start + len(text.strip())
+            segments = TextSegmentationService().split(text[start:end])
+            merged = self.merge_segments(
+                segments,
+                self.count_tokens([segment for segment, _ in segments], shared_object),
+                max_input_tokens,
+            )
+
+            chunks.extend(chunk for chunk, _ in merged)
+            layouts.append((text[:start], [separator for _, separator in merged], text[end:]))
+
+        return chunks, layouts
+
+    @staticmethod
+    def lock_path(path: str) -> FileLock:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return FileLock(f"{path}.lock")
+
+    @staticmethod
+    def get_fast_load_path(model_download_path: str, model_name: str) -> str:
+        return os.path.join(model_download_path, "safetensors", model_name.replace("/", "--"))
+
+    def _save_fast_load_snapshot(self, model: Any, processor: Any, fast_load_path: str) -> None:
+        self._logger.info(f"Saving safetensors weights and tokenizer in {fast_load_path}")
+
+        os.makedirs(os.path.dirname(fast_load_path), exist_ok=True)
+        temporary_path = tempfile.mkdtemp(dir=os.path.dirname(fast_load_path))
+
+        try:
+            model.save_pretrained(temporary_path, safe_serialization=True)
+            processor.save_pretrained(temporary_path)
+            os.rename(temporary_path, fast_load_path)
+        except OSError as error:
+            self._logger.warning(f"Could not save safetensors weights in {fast_load_path}: {error}")
+        finally:
+            shutil.rmtree(temporary_path, ignore_errors=True)
+
+    def load_pretrained(
+        self,
+        model_class: Any,
+        processor_class: Any,
+        model_name: str,
+        model_download_path: str,
+        fast_load: bool,
+    ) -> Tuple[Any, Any]:
+        if not fast_load:
+            return (
+                model_class.from_pretrained(model_name, cache_dir=model_download_path),
+                processor_class.from_pretrained(model_name, cache_dir=model_download_path),
+            )
+
+        fast_load_path = self.get_fast_load_path(model_download_path, model_name)
+        config_path = os.path.join(fast_load_path, "config.json")
+
+        if not os.path.isfile(config_path):
+            with self.lock_path(fast_load_path):
+                if not os.path.isfile(config_path):
+                    model = model_class.from_pretrained(
+                        model_name,
+                        cache_dir=model_download_path,
+                        low_cpu_mem_usage=True,
+                    )
+                    processor = processor_class.from_pretrained(model_name, cache_dir=model_download_path)
+                    self._save_fast_load_snapshot(model, processor, fast_load_path)
+
+                    return model, processor
+
+        return (
+            model_class.from_pretrained(fast_load_path, low_cpu_mem_usage=True, use_safetensors=True),
+            processor_class.from_pretrained(fast_load_path),
+        )
+
+    def create_shared_object(self) -> SharedObjectType:
+        num_threads = torch.get_num_threads()
+
+        try:
+            shared_object = self.initialize_shared_object(self._config)
+        finally:
+            torch.set_num_threads(num_threads)
+
+        for item in shared_object if isinstance(shared_object, tuple) else (shared_object,):
+            if isinstance(item, torch.nn.Module):
+                item.requires_grad_(False)
+                item.share_memory()
+
+        return shared_object
+
+    @staticmethod
+    def shared_object_bytes(shared_object: SharedObjectType) -> int:
+        return sum(
+            tensor.nelement() * tensor.element_size()
+            for item in (shared_object if isinstance(shared_object, tuple) else (shared_object,))
+            if isinstance(item, torch.nn.Module)
+            for tensor in itertools.chain(item.parameters(), item.buffers())
+        )
+
+    def attach_shared_object(
+        self,
+        shared_object: SharedObjectType,
+        config: ConfigType,
+    ) -> SharedObjectType:
+        torch.set_num_threads(config.num_threads)
+        return shared_object
+
+    def apply_precision(
+        self,
+        model: Any,
+        precision: str,
+        device: str,
+    ) -> Any:
+        if precision == "int8":
+            if device != "cpu":
+                self._logger.warning(f"int8 precision is only supported on cpu, keeping fp32 weights on {device}")
+                return model
+
+            return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)  # type: ignore
+
+        if precision == "bf16":
+            if device.startswith("cuda") and not torch.cuda.is_bf16_supported():
+                self._logger.warning(f"bf16 precision is not supported on {device}, keeping fp32 weights")
+                return model
+
+            return model.to(torch.bfloat16)
+
+        return model
+
+    @contextmanager
+    def measure_stage(self, stage: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            if self._group_stats is not None:
+                elapsed = time.perf_counter() - started_at
+                self._group_stats.stage_seconds[stage] = self._group_stats.stage_seconds.get(stage, 0.0) + elapsed
+
+    def record_tokens(
+        self,
+        attention_mask: Any,
+        output_ids: Any,
+        pad_token_id: Optional[int],
+    ) -> None:
+        if self._group_stats is None:
+            return
+
+        self.record_token_counts(
+            int(attention_mask.sum()),
+            int((output_ids != pad_token_id).sum() if pad_token_id is not None else output_ids.numel()),
+        )
+
+    def record_token_counts(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+    ) -> None:
+        if self._group_stats is None:
+            return
+
+        self._group_stats.input_tokens += input_tokens
+        self._group_stats.output_tokens += output_tokens
+
+    def translate_batch(
+        self,
+        requests: List[TranslationRequest],
+    ) -> "Future[TranslationBatchOutput]":
+        future: "Future[TranslationBatchOutput]" = self.send_command("translate_batch", requests)
+
+        return future
+
+    @abstractmethod
+    def count_tokens(
+        self,
+        texts: List[str],
+        shared_object: SharedObjectType,
+    ) -> List[int]:
+        pass
+
+    def get_max_input_tokens(
+        self,
+        config: ConfigType,
+    ) -> int:
+        return 0
+
+    @abstractmethod
+    def generate(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        shared_object: SharedObjectType,
+        config: ConfigType,
+    ) -> List[str]:
+        pass
+
+    def handle_command(
+        self,
+        command: str,
+        args: List[TranslationRequest],
+        shared_object: SharedObjectType,
+        config: ConfigType,
+        is_processing: Synchronized,  # type: ignore
+        processing_lock: multiprocessing.synchronize.Lock,
+    ) -> TranslationBatchOutput:
+        if command != "translate_batch":
+            raise UnsupportedWorkerCommandError(command)
+
+        started_at = time.perf_counter()
+
+        try:
+            with processing_lock:
+                is_processing.value = True
+
+            results: List[TranslationResult] = [""] * len(args)
+            group_stats: List[TranslationGroupStats] = []
+
+            for indices, source_language, target_language, generation_parameters in self.group_requests(args):
+                self._group_stats = TranslationGroupStats(source_language, target_language, indices)
+                group_stats.append(self._group_stats)
+
+                try:
+                    with self.measure_stage("segment"):
+                        chunks, layouts = self.split_texts(
+                            [args[index][0] for index in indices],
+                            shared_object,
+                            config,
+                        )
+
+                    translations = self.join_chunks(
+                        self.generate(
+                            chunks,
+                            source_language,
+                            target_language,
+                            generation_parameters,
+                            shared_object,
+                            config,
+                        ),
+                        layouts,
+                    )
+
+                    for index, translation in zip(indices, translations):
+                        results[index] = translation
+
+                except Exception as e:
+                    for index in indices:
+                        results[index] = e
+
+            return TranslationBatchOutput(results, group_stats, time.perf_counter() - started_at)
+
+        finally:
+            self._group_stats = None
+
+            with processing_lock:
+                is_processing.value = False
+
+    def get_worker_name(self) -> str:
+        return type(self).__name__
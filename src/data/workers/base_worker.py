@@ -1,11 +1,17 @@
 import multiprocessing
 import multiprocessing.connection
 import multiprocessing.synchronize
+import threading
+import uuid
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from multiprocessing.sharedctypes import Synchronized
-from typing import Generic, Optional, TypeVar
+from typing import Any, Dict, Generic, Optional, TypeVar
+
+import psutil
 
 from core.logger.logger import Logger
+from domain.exceptions.worker_not_running_error import WorkerNotRunningError
 
 InputType = TypeVar("InputType")
 OutputType = TypeVar("OutputType")
@@ -31,9 +37,15 @@ class BaseWorker(
         self._logger = logger
         self._process: Optional[multiprocessing.Process] = None
         self._is_processing: Synchronized = multiprocessing.Value("b", False)  # type: ignore
+        self._is_ready: Synchronized = multiprocessing.Value("b", False)  # type: ignore
         self._processing_lock: multiprocessing.synchronize.Lock = multiprocessing.Lock()
         self._pipe_parent, self._pipe_child = multiprocessing.Pipe()
         self._stop_event = multiprocessing.Event()
+        self._send_lock = threading.Lock()
+        self._pending: Dict[str, "Future[OutputType]"] = {}
+        self._pending_lock = threading.Lock()
+        self._reader_thread: Optional[threading.Thread] = None
+        self._shared_object: Optional[SharedObjectType] = None
 
     @abstractmethod
     def initialize_shared_object(
@@ -49,16 +61,25 @@ class BaseWorker(
         args: InputType,
         shared_object: SharedObjectType,
         config: ConfigType,
-        pipe: multiprocessing.connection.Connection,
         is_processing: Synchronized,  # type: ignore
         processing_lock: multiprocessing.synchronize.Lock,
-    ) -> None:
+    ) -> OutputType:
         pass
 
     @abstractmethod
     def get_worker_name(self) -> str:
         pass
 
+    def attach_shared_object(
+        self,
+        shared_object: SharedObjectType,
+        config: ConfigType,
+    ) -> SharedObjectType:
+        return shared_object
+
+    def share_object(self, shared_object: Optional[SharedObjectType]) -> None:
+        self._shared_object = shared_object
+
     def _run_process(
         self,
         config: ConfigType,
@@ -66,27 +87,122 @@ class BaseWorker(
         stop_event: multiprocessing.synchronize.Event,
         is_processing: Synchronized,  # type: ignore
         processing_lock: multiprocessing.synchronize.Lock,
+        is_ready: Synchronized,  # type: ignore
     ) -> None:
+        shared_object: Optional[SharedObjectType] = None
+
         try:
             self._logger.set_level(config.log_level)  # type: ignore
             self._logger.info(f"{self.get_worker_name()} started with PID: {multiprocessing.current_process().pid}")
-            shared_object = self.initialize_shared_object(config)
+            shared_object = (
+                self.initialize_shared_object(config)
+                if self._shared_object is None
+                else self.attach_shared_object(self._shared_object, config)
+            )
+            is_ready.value = True
+            self._logger.info(f"{self.get_worker_name()} is ready")
 
             while not stop_event.is_set():
                 if pipe.poll(timeout=1):
-                    command, args = pipe.recv()
-                    self._logger.debug(f"{self.get_worker_name()} received command: {command} with args: {args}")
-                    self.handle_command(command, args, shared_object, config, pipe, is_processing, processing_lock)
-                    self._logger.debug(f"{self.get_worker_name()} command: {command} processed")
+                    request_id, command, args = pipe.recv()
+                    self._logger.debug("%s received command: %s (%s)", self.get_worker_name(), command, request_id)
+
+                    try:
+                        result: Any = self.handle_command(
+                            command,
+                            args,
+                            shared_object,
+                            config,
+                            is_processing,
+                            processing_lock,
+                        )
+                    except Exception as e:
+                        result = e
+
+                    pipe.send((request_id, result))
+                    self._logger.debug("%s command: %s (%s) processed", self.get_worker_name(), command, request_id)
 
         finally:
+            is_ready.value = False
             del shared_object
             pipe.close()
             self._logger.info(f"{self.get_worker_name()} stopped with PID: {multiprocessing.current_process().pid}")
 
+    def _resolve(self, request_id: str, result: Any) -> None:
+        with self._pending_lock:
+            future = self._pending.pop(request_id, None)
+
+        if future is None:
+            self._logger.warning(f"{self.get_worker_name()} received response for unknown request: {request_id}")
+            return
+
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+    def _fail_pending(self, error: Exception) -> None:
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+
+        for future in pending:
+            future.set_exception(error)
+
+    def _read_responses(self) -> None:
+        while True:
+            with self._pending_lock:
+                if self._process is None and not self._pending:
+                    self._reader_thread = None
+                    return
+
+            try:
+                if self._pipe_parent.poll(timeout=1):
+                    request_id, result = self._pipe_parent.recv()
+                    self._resolve(request_id, result)
+                elif not self.is_alive():
+                    self._fail_pending(WorkerNotRunningError())
+
+            except (EOFError, OSError):
+                self._fail_pending(WorkerNotRunningError())
+
+                with self._pending_lock:
+                    self._reader_thread = None
+
+                return
+
+    def _ensure_reader(self) -> None:
+        with self._pending_lock:
+            if self._reader_thread is None:
+                self._reader_thread = threading.Thread(target=self._read_responses, daemon=True)
+                self._reader_thread.start()
+
+    def send_command(
+        self,
+        command: str,
+        args: InputType,
+    ) -> "Future[OutputType]":
+        if not self.is_alive():
+            raise WorkerNotRunningError()
+
+        request_id = uuid.uuid4().hex
+        future: "Future[OutputType]" = Future()
+
+        with self._pending_lock:
+            self._pending[request_id] = future
+
+        with self._send_lock:
+            self._pipe_parent.send((request_id, command, args))
+
+        self._ensure_reader()
+
+        return future
+
     def start(self) -> None:
         if self._process is None or not self._process.is_alive():
+            self._fail_pending(WorkerNotRunningError())
             self._stop_event.clear()
+            self._is_ready.value = False
             self._process = multiprocessing.Process(
                 target=self._run_process,
                 args=(
@@ -95,9 +211,11 @@ class BaseWorker(
                     self._stop_event,
                     self._is_processing,
                     self._processing_lock,
+                    self._is_ready,
                 ),
             )
             self._process.start()
+            self._ensure_reader()
 
     def stop(self) -> None:
         if self._process and self._process.is_alive():
@@ -107,10 +225,50 @@ class BaseWorker(
             if self._process.is_alive():
                 self._process.terminate()
 
-            self._process = None
+        self._process = None
+        self._is_ready.value = False
+        self._fail_pending(WorkerNotRunningError())
 
     def is_alive(self) -> bool:
         return self._process is not None and self._process.is_alive()
 
     def is_processing(self) -> bool:
         return bool(self._is_processing.value)
+
+    def is_ready(self) -> bool:
+        return self.is_alive() and bool(self._is_ready.value)
+
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process is not None else None
+
+    def rss_bytes(self) -> int:
+        if self._process is None or not self._process.is_alive() or self._process.pid is None:
+            return 0
+
+        try:
+            rss: int = psutil.Process(self._process.pid).memory_info().rss
+            return rss
+        except psutil.Error:
+            return 0
+
+    def uss_bytes(self) -> int:
+        if self._process is None or not self._process.is_alive() or self._process.pid is None:
+            return 0
+
+        try:
+            uss: int = psutil.Process(self._process.pid).memory_full_info().uss
+            return uss
+        except psutil.Error:
+            return 0
+
+    def pending_count(self) -> int:
+        with self._pending_lock:
+            return len(self._pending)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+
+        for attribute in ("_send_lock", "_pending", "_pending_lock", "_reader_thread"):
+            state.pop(attribute, None)
+
+        return state
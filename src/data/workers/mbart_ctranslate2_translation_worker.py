@@ -0,0 +1,140 @@
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, List, Tuple
+
+from huggingface_hub import snapshot_download
+from transformers import AutoTokenizer
+
+from data.workers.mbart_translation_worker import (
+    MBartTranslationConfig,
+    MBartTranslationWorker,
+)
+
+COMPUTE_TYPES = {
+    "fp32": "float32",
+    "int8": "int8",
+    "bf16": "bfloat16",
+}
+CONVERSION_FILE_PATTERNS = [
+    "*.json",
+    "*.model",
+    "*.txt",
+    "*.safetensors",
+    "pytorch_model*.bin",
+]
+TRANSLATE_OPTIONS = {
+    "num_beams": "beam_size",
+    "num_return_sequences": "num_hypotheses",
+    "max_length": "max_decoding_length",
+    "max_new_tokens": "max_decoding_length",
+    "min_length": "min_decoding_length",
+    "length_penalty": "length_penalty",
+    "repetition_penalty": "repetition_penalty",
+    "no_repeat_ngram_size": "no_repeat_ngram_size",
+    "top_k": "sampling_topk",
+    "top_p": "sampling_topp",
+    "temperature": "sampling_temperature",
+}
+
+
+class MBartCTranslate2TranslationWorker(MBartTranslationWorker):  # type: ignore
+    @staticmethod
+    def get_converted_path(config: MBartTranslationConfig) -> str:
+        return os.path.join(config.model_download_path, "ctranslate2", config.model_name.replace("/", "--"))
+
+    def _convert_model(self, config: MBartTranslationConfig, converted_path: str) -> None:
+        import ctranslate2
+
+        self._logger.info(f"Converting {config.model_name} to CTranslate2 in {converted_path}")
+
+        model_path = snapshot_download(
+            config.model_name,
+            cache_dir=config.model_download_path,
+            allow_patterns=CONVERSION_FILE_PATTERNS,
+        )
+        os.makedirs(os.path.dirname(converted_path), exist_ok=True)
+        temporary_path = tempfile.mkdtemp(dir=os.path.dirname(converted_path))
+
+        try:
+            ctranslate2.converters.TransformersConverter(model_path).convert(temporary_path, force=True)
+            os.rename(temporary_path, converted_path)
+        except OSError:
+            shutil.rmtree(temporary_path, ignore_errors=True)
+
+    def _ensure_converted(self, config: MBartTranslationConfig, converted_path: str) -> None:
+        with self.lock_path(converted_path):
+            if not os.path.isfile(os.path.join(converted_path, "model.bin")):
+                self._convert_model(config, converted_path)
+
+    def initialize_shared_object(
+        self,
+        config: MBartTranslationConfig,
+    ) -> Tuple[Any, AutoTokenizer]:
+        import ctranslate2
+
+        converted_path = self.get_converted_path(config)
+        self._ensure_converted(config, converted_path)
+
+        translator = ctranslate2.Translator(
+            converted_path,
+            device="cuda" if config.device.startswith("cuda") else "cpu",
+            compute_type=COMPUTE_TYPES[config.precision],
+            intra_threads=config.num_threads,
+        )
+        tokenizer = AutoTokenizer.from_pretrained(
+            config.model_name,
+            cache_dir=config.model_download_path,
+        )
+        return translator, tokenizer
+
+    def get_translate_options(self, generation_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        options: Dict[str, Any] = {}
+
+        for name, value in generation_parameters.items():
+            if name in TRANSLATE_OPTIONS:
+                options[TRANSLATE_OPTIONS[name]] = value
+            elif name not in ("do_sample", "forced_bos_token_id"):
+                self._logger.warning(f"Generation parameter {name} is not supported by the ctranslate2 engine")
+
+        if not generation_parameters.get("do_sample"):
+            return {name: value for name, value in options.items() if not name.startswith("sampling_")}
+
+        options.setdefault("sampling_topk", 50)
+        return options
+
+    def generate(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        shared_object: Tuple[Any, AutoTokenizer],
+        config: MBartTranslationConfig,
+    ) -> List[str]:
+        translator, tokenizer = shared_object
+
+        with self.measure_stage("tokenize"):
+            tokenizer.src_lang = source_language
+            source_tokens = [tokenizer.convert_ids_to_tokens(input_ids) for input_ids in tokenizer(texts)["input_ids"]]
+
+        with self.measure_stage("generate"):
+            results = translator.translate_batch(
+                source_tokens,
+                target_prefix=[[target_language]] * len(texts),
+                **self.get_translate_options(generation_parameters),
+            )
+
+        with self.measure_stage("decode"):
+            hypotheses = [hypothesis[1:] for result in results for hypothesis in result.hypotheses]
+            output = [
+                tokenizer.decode(tokenizer.convert_tokens_to_ids(tokens), skip_special_tokens=True)
+                for tokens in hypotheses
+            ]
+
+        self.record_token_counts(
+            sum(len(tokens) for tokens in source_tokens),
+            sum(len(tokens) for tokens in hypotheses),
+        )
+
+        return self.join_sequences(output, len(texts))
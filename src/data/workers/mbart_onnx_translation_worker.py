@@ -0,0 +1,73 @@
+import os
+import shutil
+import tempfile
+from typing import Any, Tuple
+
+import torch
+from transformers import AutoTokenizer
+
+from data.workers.mbart_translation_worker import (
+    MBartTranslationConfig,
+    MBartTranslationWorker,
+)
+
+
+class MBartOnnxTranslationWorker(MBartTranslationWorker):  # type: ignore
+    @staticmethod
+    def get_export_path(config: MBartTranslationConfig) -> str:
+        return os.path.join(config.model_download_path, "onnx", config.model_name.replace("/", "--"))
+
+    def _export_model(self, config: MBartTranslationConfig, export_path: str, **model_kwargs: Any) -> None:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+        self._logger.info(f"Exporting {config.model_name} to ONNX in {export_path}")
+
+        model = ORTModelForSeq2SeqLM.from_pretrained(
+            config.model_name,
+            export=True,
+            cache_dir=config.model_download_path,
+            **model_kwargs,
+        )
+
+        os.makedirs(os.path.dirname(export_path), exist_ok=True)
+        temporary_path = tempfile.mkdtemp(dir=os.path.dirname(export_path))
+
+        try:
+            model.save_pretrained(temporary_path)
+            os.rename(temporary_path, export_path)
+        except OSError:
+            shutil.rmtree(temporary_path, ignore_errors=True)
+
+    def _ensure_exported(self, config: MBartTranslationConfig, export_path: str, **model_kwargs: Any) -> None:
+        with self.lock_path(export_path):
+            if not os.path.isfile(os.path.join(export_path, "config.json")):
+                self._export_model(config, export_path, **model_kwargs)
+
+    def initialize_shared_object(
+        self,
+        config: MBartTranslationConfig,
+    ) -> Tuple[Any, AutoTokenizer]:
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+        torch.set_num_threads(config.num_threads)
+
+        if config.precision != "fp32":
+            self._logger.warning(f"{config.precision} precision is not supported by the onnx engine, using fp32")
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = config.num_threads
+        model_kwargs = {
+            "use_cache": True,
+            "provider": "CUDAExecutionProvider" if config.device.startswith("cuda") else "CPUExecutionProvider",
+            "session_options": session_options,
+        }
+        export_path = self.get_export_path(config)
+
+        self._ensure_exported(config, export_path, **model_kwargs)
+        model = ORTModelForSeq2SeqLM.from_pretrained(export_path, **model_kwargs)
+        tokenizer = AutoTokenizer.from_pretrained(
+            config.model_name,
+            cache_dir=config.model_download_path,
+        )
+        return model, tokenizer
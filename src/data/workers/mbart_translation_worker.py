@@ -1,14 +1,10 @@
-import multiprocessing
-import multiprocessing.connection
-import multiprocessing.synchronize
 from dataclasses import dataclass
-from multiprocessing.sharedctypes import Synchronized
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
+import torch
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 
-from data.workers.base_worker import BaseWorker
-from domain.exceptions.worker_not_running_error import WorkerNotRunningError
+from data.workers.base_translation_worker import BaseTranslationWorker
 
 
 @dataclass
@@ -17,94 +13,72 @@ class MBartTranslationConfig:
     model_name: str
     model_download_path: str
     log_level: str
+    num_threads: int
+    max_input_tokens: int
+    precision: str
+    fast_load: bool
 
 
 class MBartTranslationWorker(
-    BaseWorker[  # type: ignore
-        Tuple[str, str, str, Dict[str, Any]],
-        str,
+    BaseTranslationWorker[  # type: ignore
         MBartTranslationConfig,
         Tuple[AutoModelForSeq2SeqLM, AutoTokenizer],
     ],
 ):
-    def translate(
-        self,
-        text_to_translate: str,
-        source_language: str,
-        target_language: str,
-        generation_parameters: Dict[str, Any],
-    ) -> str:
-        if not self.is_alive():
-            raise WorkerNotRunningError()
-
-        self._pipe_parent.send(
-            (
-                "translate",
-                (
-                    text_to_translate,
-                    source_language,
-                    target_language,
-                    generation_parameters,
-                ),
-            ),
-        )
-        result = self._pipe_parent.recv()
-
-        if isinstance(result, Exception):
-            raise result
-
-        return str(result)
-
     def initialize_shared_object(
         self,
         config: MBartTranslationConfig,
     ) -> Tuple[AutoModelForSeq2SeqLM, AutoTokenizer]:
-        model = AutoModelForSeq2SeqLM.from_pretrained(
-            config.model_name,
-            cache_dir=config.model_download_path,
-        ).to(config.device)
-        tokenizer = AutoTokenizer.from_pretrained(
+        torch.set_num_threads(config.num_threads)
+
+        model, tokenizer = self.load_pretrained(
+            AutoModelForSeq2SeqLM,
+            AutoTokenizer,
             config.model_name,
-            cache_dir=config.model_download_path,
+            config.model_download_path,
+            config.fast_load,
         )
-        return model, tokenizer
+        return self.apply_precision(model.to(config.device), config.precision, config.device), tokenizer
 
-    def handle_command(
+    def count_tokens(
         self,
-        command: str,
-        args: Tuple[str, str, str, Dict[str, Any]],
+        texts: List[str],
         shared_object: Tuple[AutoModelForSeq2SeqLM, AutoTokenizer],
-        config: MBartTranslationConfig,
-        pipe: multiprocessing.connection.Connection,
-        is_processing: Synchronized,  # type: ignore
-        processing_lock: multiprocessing.synchronize.Lock,
-    ) -> None:
-        if command == "translate":
-            try:
-                with processing_lock:
-                    is_processing.value = True
+    ) -> List[int]:
+        _, tokenizer = shared_object
 
-                text, source_language, target_language, generation_parameters = args
-                model, tokenizer = shared_object
+        return [len(input_ids) for input_ids in tokenizer(texts, add_special_tokens=False)["input_ids"]]
 
-                tokenizer.src_lang = source_language
-                inputs = tokenizer(text, return_tensors="pt").to(config.device)
+    def get_max_input_tokens(
+        self,
+        config: MBartTranslationConfig,
+    ) -> int:
+        return config.max_input_tokens
 
-                if "forced_bos_token_id" not in generation_parameters:
-                    generation_parameters["forced_bos_token_id"] = tokenizer.lang_code_to_id[target_language]
+    def generate(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        shared_object: Tuple[AutoModelForSeq2SeqLM, AutoTokenizer],
+        config: MBartTranslationConfig,
+    ) -> List[str]:
+        model, tokenizer = shared_object
 
-                translation = model.generate(**inputs, **generation_parameters)
+        with self.measure_stage("tokenize"):
+            tokenizer.src_lang = source_language
+            inputs = tokenizer(texts, return_tensors="pt", padding=True).to(config.device)
 
-                output = [tokenizer.decode(t, skip_special_tokens=True) for t in translation]
+        if "forced_bos_token_id" not in generation_parameters:
+            generation_parameters["forced_bos_token_id"] = tokenizer.lang_code_to_id[target_language]
 
-                pipe.send("".join(output))
+        with self.measure_stage("generate"):
+            translation = model.generate(**inputs, **generation_parameters)
 
-            except Exception as e:
-                pipe.send(e)
+        with self.measure_stage("decode"):
+            output = tokenizer.batch_decode(translation, skip_special_tokens=True)
 
-            finally:
-                with processing_lock:
-                    is_processing.value = False
+        self.record_tokens(inputs["attention_mask"], translation, tokenizer.pad_token_id)
 
-    def get_worker_name(self) -> str:
-        return type(self).__name__
+        return self.join_sequences(output, len(texts))
@@ -1,14 +1,10 @@
-import multiprocessing
-import multiprocessing.connection
-import multiprocessing.synchronize
 from dataclasses import dataclass
-from multiprocessing.sharedctypes import Synchronized
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
+import torch
 from transformers import AutoProcessor, SeamlessM4Tv2ForTextToText
 
-from data.workers.base_worker import BaseWorker
-from domain.exceptions.worker_not_running_error import WorkerNotRunningError
+from data.workers.base_translation_worker import BaseTranslationWorker
 
 
 @dataclass
@@ -17,102 +13,80 @@ class SeamlessTranslationConfig:
     model_name: str
     model_download_path: str
     log_level: str
+    num_threads: int
+    max_input_tokens: int
+    precision: str
+    fast_load: bool
 
 
 class SeamlessTranslationWorker(
-    BaseWorker[  # type: ignore
-        Tuple[str, str, str, Dict[str, Any]],
-        str,
+    BaseTranslationWorker[  # type: ignore
         SeamlessTranslationConfig,
         Tuple[SeamlessM4Tv2ForTextToText, AutoProcessor],
     ],
 ):
-    def translate(
+    def initialize_shared_object(
         self,
-        text_to_translate: str,
-        source_language: str,
-        target_language: str,
-        generation_parameters: Dict[str, Any],
-    ) -> str:
-        if not self.is_alive():
-            raise WorkerNotRunningError()
-
-        self._pipe_parent.send(
-            (
-                "translate",
-                (
-                    text_to_translate,
-                    source_language,
-                    target_language,
-                    generation_parameters,
-                ),
-            ),
+        config: SeamlessTranslationConfig,
+    ) -> Tuple[SeamlessM4Tv2ForTextToText, AutoProcessor]:
+        torch.set_num_threads(config.num_threads)
+
+        model, processor = self.load_pretrained(
+            SeamlessM4Tv2ForTextToText,
+            AutoProcessor,
+            config.model_name,
+            config.model_download_path,
+            config.fast_load,
         )
-        result = self._pipe_parent.recv()
+        return self.apply_precision(model.to(config.device), config.precision, config.device), processor
 
-        if isinstance(result, Exception):
-            raise result
+    def count_tokens(
+        self,
+        texts: List[str],
+        shared_object: Tuple[SeamlessM4Tv2ForTextToText, AutoProcessor],
+    ) -> List[int]:
+        _, processor = shared_object
 
-        return str(result)
+        return [len(input_ids) for input_ids in processor.tokenizer(texts, add_special_tokens=False)["input_ids"]]
 
-    def initialize_shared_object(
+    def get_max_input_tokens(
         self,
         config: SeamlessTranslationConfig,
-    ) -> Tuple[SeamlessM4Tv2ForTextToText, AutoProcessor]:
-        model = SeamlessM4Tv2ForTextToText.from_pretrained(
-            config.model_name,
-            cache_dir=config.model_download_path,
-        ).to(config.device)
-        processor = AutoProcessor.from_pretrained(
-            config.model_name,
-            cache_dir=config.model_download_path,
-        )
-        return model, processor
+    ) -> int:
+        return config.max_input_tokens
 
-    def handle_command(
+    def generate(
         self,
-        command: str,
-        args: Tuple[str, str, str, Dict[str, Any]],
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
         shared_object: Tuple[SeamlessM4Tv2ForTextToText, AutoProcessor],
         config: SeamlessTranslationConfig,
-        pipe: multiprocessing.connection.Connection,
-        is_processing: Synchronized,  # type: ignore
-        processing_lock: multiprocessing.synchronize.Lock,
-    ) -> None:
-        if command == "translate":
-            try:
-                with processing_lock:
-                    is_processing.value = True
-
-                text, source_language, target_language, generation_parameters = args
-                model, processor = shared_object
-
-                input_tokens = processor(
-                    text,
-                    src_lang=source_language,
-                    return_tensors="pt",
-                    padding=True,
-                ).to(config.device)
-
-                output_tokens = model.generate(
-                    **input_tokens,
-                    tgt_lang=target_language,
-                    **generation_parameters,
-                )[0].tolist()
-
-                text_output = processor.decode(
-                    output_tokens,
-                    skip_special_tokens=True,
-                )
-
-                pipe.send("".join(text_output))
-
-            except Exception as e:
-                pipe.send(e)
-
-            finally:
-                with processing_lock:
-                    is_processing.value = False
-
-    def get_worker_name(self) -> str:
-        return type(self).__name__
+    ) -> List[str]:
+        model, processor = shared_object
+
+        with self.measure_stage("tokenize"):
+            input_tokens = processor(
+                texts,
+                src_lang=source_language,
+                return_tensors="pt",
+                padding=True,
+            ).to(config.device)
+
+        with self.measure_stage("generate"):
+            output_tokens = model.generate(
+                **input_tokens,
+                tgt_lang=target_language,
+                **generation_parameters,
+            )
+
+        with self.measure_stage("decode"):
+            text_output = processor.batch_decode(
+                output_tokens,
+                skip_special_tokens=True,
+            )
+
+        self.record_tokens(input_tokens["attention_mask"], output_tokens, processor.tokenizer.pad_token_id)
+
+        return self.join_sequences(text_output, len(texts))
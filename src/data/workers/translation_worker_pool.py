@@ -0,0 +1,95 @@
+from concurrent.futures import Future
+from typing import Any, List, Optional
+
+from core.logger.logger import Logger
+from core.metrics.metrics import Metrics
+from data.workers.base_translation_worker import (
+    BaseTranslationWorker,
+    TranslationBatchOutput,
+    TranslationRequest,
+)
+from domain.exceptions.worker_not_running_error import WorkerNotRunningError
+
+
+class TranslationWorkerPool:
+    def __init__(
+        self,
+        workers: List[BaseTranslationWorker],
+        logger: Logger,
+        metrics: Metrics,
+        shared_memory: bool = False,
+    ) -> None:
+        self.workers = workers
+        self.logger = logger
+        self.metrics = metrics
+        self.shared_memory = shared_memory
+        self._shared_object: Optional[Any] = None
+        self._shared_object_bytes = 0
+
+    def start(self) -> None:
+        if self.shared_memory and self._shared_object is None:
+            self.logger.info(f"Loading the model into shared memory for {len(self.workers)} translation workers")
+            self._shared_object = self.workers[0].create_shared_object()
+            self._shared_object_bytes = self.workers[0].shared_object_bytes(self._shared_object)
+
+            for worker in self.workers:
+                worker.share_object(self._shared_object)
+
+        for index, worker in enumerate(self.workers):
+            if not worker.is_alive():
+                if worker.pid() is not None:
+                    self.logger.warning(f"Translation worker {index + 1}/{len(self.workers)} exited unexpectedly")
+                    self.metrics.worker_restarts.labels(worker=worker.get_worker_name()).inc()
+
+                self.logger.info(f"Starting translation worker {index + 1}/{len(self.workers)}")
+                worker.start()
+
+    def stop(self, keep_warm: int = 0) -> None:
+        for worker in self.workers[keep_warm:]:
+            worker.stop()
+
+        if keep_warm <= 0 and self._shared_object is not None:
+            self._shared_object = None
+            self._shared_object_bytes = 0
+
+            for worker in self.workers:
+                worker.share_object(None)
+
+    def is_alive(self) -> bool:
+        return any(worker.is_alive() for worker in self.workers)
+
+    def alive_count(self) -> int:
+        return sum(worker.is_alive() for worker in self.workers)
+
+    def is_ready(self) -> bool:
+        return any(worker.is_ready() for worker in self.workers)
+
+    def pids(self) -> List[Optional[int]]:
+        return [worker.pid() for worker in self.workers]
+
+    def is_processing(self) -> bool:
+        return any(worker.is_processing() for worker in self.workers)
+
+    def pending_count(self) -> int:
+        return sum(worker.pending_count() for worker in self.workers)
+
+    def rss_bytes(self) -> int:
+        if self._shared_object is None:
+            return sum(worker.rss_bytes() for worker in self.workers)
+
+        unique_bytes: int = sum(worker.uss_bytes() for worker in self.workers)
+        return self._shared_object_bytes + unique_bytes
+
+    def translate_batch(
+        self,
+        requests: List[TranslationRequest],
+    ) -> "Future[TranslationBatchOutput]":
+        live_workers = [worker for worker in self.workers if worker.is_alive()]
+
+        if not live_workers:
+            raise WorkerNotRunningError()
+
+        worker = min(live_workers, key=lambda live_worker: live_worker.pending_count())
+        future: "Future[TranslationBatchOutput]" = worker.translate_batch(requests)
+
+        return future
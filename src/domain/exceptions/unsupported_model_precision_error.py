@@ -0,0 +1,3 @@
+class UnsupportedModelPrecisionError(ValueError):
+    def __init__(self, precision: str) -> None:
+        super().__init__(f"Unsupported model precision: {precision}")
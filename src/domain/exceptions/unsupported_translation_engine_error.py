@@ -0,0 +1,3 @@
+class UnsupportedTranslationEngineError(ValueError):
+    def __init__(self, engine: str, model_name: str) -> None:
+        super().__init__(f"Unsupported translation engine: {engine} for model: {model_name}")
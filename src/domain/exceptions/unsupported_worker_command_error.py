@@ -0,0 +1,3 @@
+class UnsupportedWorkerCommandError(ValueError):
+    def __init__(self, command: str) -> None:
+        super().__init__(f"Unsupported worker command: {command}")
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class TranslationModelStatus:
+    alive: bool
+    model_loaded: bool
+    worker_pids: List[int]
+    queue_depth: int
+    in_flight: int
+    last_inference_latency_ms: Optional[float]
+    loaded_models: List[str]
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class TranslationMemoryRepository(ABC):
+    @abstractmethod
+    def find(
+        self,
+        text_to_translate: str,
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        model_name: str,
+    ) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def save(
+        self,
+        text_to_translate: str,
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        translation: str,
+        model_name: str,
+    ) -> None:
+        pass
@@ -1,14 +1,33 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
+
+from domain.models.translation_model_status import TranslationModelStatus
 
 
 class TranslationModelRepository(ABC):
     @abstractmethod
-    def translate(
+    def preload(self, model_name: str) -> None:
+        pass
+
+    @abstractmethod
+    def get_status(self) -> TranslationModelStatus:
+        pass
+
+    @abstractmethod
+    async def translate(
         self,
         text_to_translate: str,
         source_language: str,
         target_language: str,
         generation_parameters: Dict[str, Any],
+        model_name: str,
     ) -> str:
         pass
+
+    @abstractmethod
+    async def translate_batch(
+        self,
+        requests: List[Tuple[str, str, str, Dict[str, Any]]],
+        model_name: str,
+    ) -> List[str]:
+        pass
@@ -0,0 +1,25 @@
+import re
+from typing import List, Tuple
+
+
+class TextSegmentationService:
+    _segment_boundary = re.compile(r"(?<=[.!?…。！？])\s+|\s*\n\s*")
+
+    def split(self, text: str) -> List[Tuple[str, str]]:
+        segments: List[Tuple[str, str]] = []
+        position = 0
+
+        for match in self._segment_boundary.finditer(text):
+            start, end = match.span()
+            segment = text[position:start]
+            position = end
+
+            if segment.strip():
+                segments.append((segment, match.group()))
+            elif segments:
+                segments[-1] = (segments[-1][0], segments[-1][1] + match.group())
+
+        if text[position:].strip():
+            segments.append((text[position:], ""))
+
+        return segments
@@ -1,4 +1,5 @@
-from typing import Annotated, Any, Dict
+import asyncio
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from fastapi import Depends
 
@@ -7,8 +8,13 @@ from core.logger.logger import Logger
 from data.repositories.translation_model_repository_impl import (
     TranslationModelRepositoryImpl,
 )
+from domain.exceptions.unsupported_model_configuration_error import (
+    UnsupportedModelConfigurationError,
+)
+from domain.models.translation_model_status import TranslationModelStatus
 from domain.repositories.translation_model_repository import TranslationModelRepository
 from domain.services.language_mapping_service import LanguageMappingService
+from domain.services.text_segmentation_service import TextSegmentationService
 
 
 class TranslationService:
@@ -18,37 +24,213 @@ class TranslationService:
         translation_model_repository: Annotated[TranslationModelRepository, Depends(TranslationModelRepositoryImpl)],
         logger: Annotated[Logger, Depends()],
         language_mapping_service: Annotated[LanguageMappingService, Depends()],
+        text_segmentation_service: Annotated[TextSegmentationService, Depends()],
     ) -> None:
         self.config = config
         self.translation_model_repository = translation_model_repository
         self.logger = logger
         self.language_mapping_service = language_mapping_service
+        self.text_segmentation_service = text_segmentation_service
+
+    def _resolve_model_name(self, model_name: Optional[str]) -> str:
+        resolved_model_name: str = model_name or self.config.translation_model_name
+
+        if resolved_model_name not in self.config.translation_model_names:
+            raise UnsupportedModelConfigurationError(resolved_model_name)
+
+        return resolved_model_name
+
+    async def _translate_segments(
+        self,
+        text_to_translate: str,
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        model_name: str,
+    ) -> str:
+        content = text_to_translate.lstrip()
+        segments = self.text_segmentation_service.split(content)
+
+        if len(segments) <= 1:
+            translation: str = await self.translation_model_repository.translate(
+                text_to_translate,
+                source_language,
+                target_language,
+                generation_parameters,
+                model_name,
+            )
+
+            return translation
+
+        self.logger.debug("Translating text as %d cached segments", len(segments))
+
+        translations = await asyncio.gather(
+            *(
+                self.translation_model_repository.translate(
+                    segment,
+                    source_language,
+                    target_language,
+                    generation_parameters,
+                    model_name,
+                )
+                for segment, _ in segments
+            ),
+        )
+
+        prefix_length = len(text_to_translate) - len(content)
+
+        return text_to_translate[:prefix_length] + "".join(
+            translation + separator for translation, (_, separator) in zip(translations, segments)
+        )
+
+    def preload_model(self) -> None:
+        self.translation_model_repository.preload(self.config.translation_model_name)
+
+    def get_model_status(self) -> TranslationModelStatus:
+        status: TranslationModelStatus = self.translation_model_repository.get_status()
+        return status
+
+    def is_model_ready(self, status: TranslationModelStatus) -> bool:
+        max_queue_depth = self.config.readiness_max_queue_depth
+
+        ready: bool = status.model_loaded and (max_queue_depth <= 0 or status.queue_depth < max_queue_depth)
+        return ready
 
-    def translate_text(
+    async def translate_text(
         self,
         text_to_translate: str,
         source_language: str,
         target_language: str,
         generation_parameters: Dict[str, Any],
+        model_name: Optional[str] = None,
     ) -> str:
-        self.logger.debug(f"Starting translation of text from '{source_language}' to '{target_language}'")
+        self.logger.debug("Starting translation of text from '%s' to '%s'", source_language, target_language)
 
+        resolved_model_name = self._resolve_model_name(model_name)
         source_language_mapped = self.language_mapping_service.map_language(
             source_language,
-            self.config.translation_model_name,
+            resolved_model_name,
         )
         target_language_mapped = self.language_mapping_service.map_language(
             target_language,
-            self.config.translation_model_name,
+            resolved_model_name,
         )
 
-        translation: str = self.translation_model_repository.translate(
+        if self.config.translation_segment_cache_enabled:
+            translate = self._translate_segments
+        else:
+            translate = self.translation_model_repository.translate
+
+        translation = await translate(
             text_to_translate,
             source_language_mapped,
             target_language_mapped,
             generation_parameters,
+            resolved_model_name,
         )
 
         self.logger.debug("Completed translation of text")
 
         return translation
+
+    async def translate_batch(
+        self,
+        texts_to_translate: List[Tuple[str, str, str]],
+        generation_parameters: Dict[str, Any],
+        model_name: Optional[str] = None,
+    ) -> List[str]:
+        self.logger.debug("Starting batch translation of %d texts", len(texts_to_translate))
+
+        resolved_model_name = self._resolve_model_name(model_name)
+        mapped_languages: Dict[str, str] = {}
+
+        for _, source_language, target_language in texts_to_translate:
+            for language in (source_language, target_language):
+                if language not in mapped_languages:
+                    mapped_languages[language] = self.language_mapping_service.map_language(
+                        language,
+                        resolved_model_name,
+                    )
+
+        requests = [
+            (
+                text_to_translate,
+                mapped_languages[source_language],
+                mapped_languages[target_language],
+                generation_parameters,
+            )
+            for text_to_translate, source_language, target_language in texts_to_translate
+        ]
+
+        if self.config.translation_segment_cache_enabled:
+            translations: List[str] = list(
+                await asyncio.gather(
+                    *(self._translate_segments(*request, resolved_model_name) for request in requests),
+                ),
+            )
+        else:
+            translations = await self.translation_model_repository.translate_batch(requests, resolved_model_name)
+
+        self.logger.debug("Completed batch translation of texts")
+
+        return translations
+
+    async def _stream_segments(
+        self,
+        segments: List[Tuple[str, str]],
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        model_name: str,
+    ) -> AsyncIterator[Tuple[str, str]]:
+        self.logger.debug("Starting streamed translation of %d segments", len(segments))
+
+        tasks = [
+            asyncio.ensure_future(
+                self.translation_model_repository.translate(
+                    segment,
+                    source_language,
+                    target_language,
+                    generation_parameters,
+                    model_name,
+                ),
+            )
+            for segment, _ in segments
+        ]
+
+        try:
+            for task, (_, separator) in zip(tasks, segments):
+                translation: str = await task
+                yield translation, separator
+
+            self.logger.debug("Completed streamed translation of text")
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def translate_text_stream(
+        self,
+        text_to_translate: str,
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        model_name: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[str, str]]:
+        resolved_model_name = self._resolve_model_name(model_name)
+        source_language_mapped = self.language_mapping_service.map_language(
+            source_language,
+            resolved_model_name,
+        )
+        target_language_mapped = self.language_mapping_service.map_language(
+            target_language,
+            resolved_model_name,
+        )
+
+        return self._stream_segments(
+            self.text_segmentation_service.split(text_to_translate),
+            source_language_mapped,
+            target_language_mapped,
+            generation_parameters,
+            resolved_model_name,
+        )
@@ -13,6 +13,16 @@ def main(
     logger.info("Starting the translation-api server...")
     config.initialize(logger)
     logger.set_level(config.log_level)
+    logger.configure(
+        config.log_format,
+        config.log_request_sample_rate,
+        config.log_text_max_length,
+        config.log_redact_text,
+    )
+
+    if config.log_async:
+        logger.enable_async()
+
     server.start()
 
 
@@ -0,0 +1,41 @@
+import pytest
+from pydantic import ValidationError
+
+from src.api.dtos.translate_batch_dto import TranslateBatchDTO
+
+
+def test_translate_batch_dto_get_items_uses_default_languages() -> None:
+    # Given
+    dto = TranslateBatchDTO.model_validate(
+        {
+            "texts_to_translate": [
+                "Hello",
+                {"text_to_translate": "Good morning", "target_language": "de_DE"},
+            ],
+            "source_language": "en_US",
+            "target_language": "pl_PL",
+        },
+    )
+
+    # When
+    items = dto.get_items()
+
+    # Then
+    assert items == [
+        ("Hello", "en_US", "pl_PL"),
+        ("Good morning", "en_US", "de_DE"),
+    ]
+
+
+def test_translate_batch_dto_invalid_item_language() -> None:
+    # When / Then
+    with pytest.raises(ValidationError) as exc_info:
+        TranslateBatchDTO.model_validate(
+            {
+                "texts_to_translate": [{"text_to_translate": "Hello", "source_language": "english"}],
+                "source_language": "en_US",
+                "target_language": "pl_PL",
+            },
+        )
+
+    assert "Invalid language format. Expected format is xx_XX" in str(exc_info.value)
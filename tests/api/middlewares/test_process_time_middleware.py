@@ -1,48 +1,110 @@
-from unittest.mock import AsyncMock, Mock, patch
+from typing import AsyncIterator, Dict
+from unittest.mock import AsyncMock, Mock
 
 import pytest
-from starlette.requests import Request
-from starlette.responses import Response
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
 
 from api.middlewares.process_time_middleware import ProcessTimeMiddleware
 from core.logger.logger import Logger
+from core.metrics.metrics import Metrics
 
 
 @pytest.fixture
 def mock_logger() -> Logger:
-    return Mock(Logger)
+    logger = Mock(Logger)
+    logger.begin_request.return_value = "request-id"
+    return logger
 
 
 @pytest.fixture
-def mock_call_next() -> AsyncMock:
-    return AsyncMock(return_value=Response("test response"))
+def client(mock_logger: Logger) -> TestClient:
+    app = FastAPI()
 
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> Dict[str, int]:
+        return {"item_id": item_id}
 
-@pytest.mark.asyncio
-async def test_process_time_middleware(mock_call_next: AsyncMock, mock_logger: Logger) -> None:
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[str]:
+            for index in range(3):
+                yield f"{index}\n"
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    @app.get("/error")
+    async def error() -> None:
+        raise RuntimeError("test exception")
+
+    app.add_middleware(ProcessTimeMiddleware, logger=mock_logger, metrics=Metrics())
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_process_time_middleware_adds_headers(client: TestClient, mock_logger: Mock) -> None:
+    # When
+    response = client.get("/items/1")
+
+    # Then
+    assert response.status_code == 200
+    assert float(response.headers["X-Process-Time"]) >= 0
+    assert response.headers["X-Request-ID"] == "request-id"
+    mock_logger.begin_request.assert_called_once()
+    assert mock_logger.info.call_count == 2
+
+
+def test_process_time_middleware_records_route_metrics(client: TestClient) -> None:
+    # Given
+    registry = Metrics().registry
+    labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    count = registry.get_sample_value("http_request_duration_seconds_count", labels) or 0.0
+
+    # When
+    client.get("/items/2")
+
+    # Then
+    assert registry.get_sample_value("http_request_duration_seconds_count", labels) == count + 1
+
+
+def test_process_time_middleware_passes_streaming_responses_through(client: TestClient) -> None:
+    # When
+    with client.stream("GET", "/stream") as response:
+        lines = list(response.iter_lines())
+
+    # Then
+    assert response.status_code == 200
+    assert "X-Process-Time" in response.headers
+    assert lines == ["0", "1", "2"]
+
+
+def test_process_time_middleware_exception(client: TestClient, mock_logger: Mock) -> None:
     # Given
-    request = Mock(Request)
-    middleware = ProcessTimeMiddleware(app=Mock(), logger=mock_logger)
+    registry = Metrics().registry
+    labels = {"method": "GET", "route": "/error", "status": "500"}
+    count = registry.get_sample_value("http_request_duration_seconds_count", labels) or 0.0
 
-    with patch("time.time", side_effect=[1.0, 2.0]):
-        # When
-        response = await middleware.dispatch(request, mock_call_next)
+    # When
+    response = client.get("/error")
 
-        # Then
-        assert response.headers["X-Process-Time"] == "1.0"
-        mock_call_next.assert_awaited_once_with(request)
+    # Then
+    assert response.status_code == 500
+    assert registry.get_sample_value("http_request_duration_seconds_count", labels) == count + 1
+    assert "completed" in mock_logger.info.call_args[0][0]
 
 
 @pytest.mark.asyncio
-async def test_process_time_middleware_exception(mock_call_next: AsyncMock, mock_logger: Logger) -> None:
+async def test_process_time_middleware_skips_non_http_scopes(mock_logger: Mock) -> None:
     # Given
-    request = Mock(Request)
-    middleware = ProcessTimeMiddleware(app=Mock(), logger=mock_logger)
-    mock_call_next.side_effect = Exception("test exception")
+    app = AsyncMock()
+    middleware = ProcessTimeMiddleware(app=app, logger=mock_logger, metrics=Metrics())
+    scope = {"type": "lifespan"}
+    receive = AsyncMock()
+    send = AsyncMock()
 
-    with patch("time.time", side_effect=[1.0, 2.0]):
-        # When / Then
-        with pytest.raises(Exception, match="test exception"):
-            await middleware.dispatch(request, mock_call_next)
+    # When
+    await middleware(scope, receive, send)
 
-        mock_call_next.assert_awaited_once_with(request)
+    # Then
+    app.assert_awaited_once_with(scope, receive, send)
+    mock_logger.begin_request.assert_not_called()
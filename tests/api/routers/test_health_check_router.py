@@ -1,15 +1,48 @@
+from unittest.mock import Mock
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from api.routers.health_check_router import HealthCheckRouter
+from application.usecases.check_liveness_usecase import CheckLivenessUseCase
+from application.usecases.check_readiness_usecase import CheckReadinessUseCase
+from domain.models.translation_model_status import TranslationModelStatus
+
+
+@pytest.fixture
+def mock_check_readiness_usecase() -> CheckReadinessUseCase:
+    return Mock(CheckReadinessUseCase)
 
 
 @pytest.fixture
-def client() -> TestClient:
+def mock_check_liveness_usecase() -> CheckLivenessUseCase:
+    return Mock(CheckLivenessUseCase)
+
+
+@pytest.fixture
+def model_status() -> TranslationModelStatus:
+    return TranslationModelStatus(
+        alive=True,
+        model_loaded=True,
+        worker_pids=[1234],
+        queue_depth=2,
+        in_flight=4,
+        last_inference_latency_ms=120.5,
+        loaded_models=["facebook/mbart-large-50-many-to-many-mmt"],
+    )
+
+
+@pytest.fixture
+def client(
+    mock_check_readiness_usecase: CheckReadinessUseCase,
+    mock_check_liveness_usecase: CheckLivenessUseCase,
+) -> TestClient:
     router = HealthCheckRouter()
     app = FastAPI()
     app.include_router(router.router)
+    app.dependency_overrides[CheckReadinessUseCase] = lambda: mock_check_readiness_usecase
+    app.dependency_overrides[CheckLivenessUseCase] = lambda: mock_check_liveness_usecase
     return TestClient(app)
 
 
@@ -20,3 +53,63 @@ def test_healthcheck_success(client: TestClient) -> None:
     # Then
     assert response.status_code == 200
     assert response.json() == {"status": "OK"}
+
+
+def test_liveness_reports_model_status(
+    client: TestClient,
+    mock_check_liveness_usecase: Mock,
+    model_status: TranslationModelStatus,
+) -> None:
+    # Given
+    mock_check_liveness_usecase.execute.return_value = model_status
+
+    # When
+    response = client.get("/liveness")
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {
+        "status": "ALIVE",
+        "alive": True,
+        "model_loaded": True,
+        "worker_pids": [1234],
+        "queue_depth": 2,
+        "in_flight": 4,
+        "last_inference_latency_ms": 120.5,
+        "loaded_models": ["facebook/mbart-large-50-many-to-many-mmt"],
+    }
+
+
+def test_readiness_ready(
+    client: TestClient,
+    mock_check_readiness_usecase: Mock,
+    model_status: TranslationModelStatus,
+) -> None:
+    # Given
+    mock_check_readiness_usecase.execute.return_value = (True, model_status)
+
+    # When
+    response = client.get("/readiness")
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["status"] == "READY"
+    assert response.json()["worker_pids"] == [1234]
+
+
+def test_readiness_not_ready(
+    client: TestClient,
+    mock_check_readiness_usecase: Mock,
+    model_status: TranslationModelStatus,
+) -> None:
+    # Given
+    model_status.model_loaded = False
+    mock_check_readiness_usecase.execute.return_value = (False, model_status)
+
+    # When
+    response = client.get("/readiness")
+
+    # Then
+    assert response.status_code == 503
+    assert response.json()["status"] == "NOT_READY"
+    assert response.json()["model_loaded"] is False
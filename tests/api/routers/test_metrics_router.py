@@ -0,0 +1,28 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routers.metrics_router import MetricsRouter
+from core.metrics.metrics import Metrics
+
+
+@pytest.fixture
+def client() -> TestClient:
+    router = MetricsRouter()
+    app = FastAPI()
+    app.include_router(router.router)
+    return TestClient(app)
+
+
+def test_metrics_exposes_prometheus_text_format(client: TestClient) -> None:
+    # Given
+    Metrics().record_cache_lookup("result", True)
+
+    # When
+    response = client.get("/metrics")
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'translation_cache_requests_total{cache="result",result="hit"}' in response.text
+    assert "translation_queue_wait_seconds" in response.text
@@ -1,11 +1,24 @@
+import json
+from typing import Any, AsyncIterator, Tuple
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from api.handlers.global_exception_handler import GlobalExceptionHandler
 from api.routers.translate_router import TranslateRouter
+from application.usecases.translate_batch_usecase import TranslateBatchUseCase
+from application.usecases.translate_text_stream_usecase import (
+    TranslateTextStreamUseCase,
+)
 from application.usecases.translate_text_usecase import TranslateTextUseCase
+from core.logger.logger import Logger
+from core.metrics.request_timings import RequestTimings
+from domain.exceptions.language_not_found_error import LanguageNotFoundError
+from domain.exceptions.unsupported_model_configuration_error import (
+    UnsupportedModelConfigurationError,
+)
 
 
 @pytest.fixture
@@ -13,14 +26,28 @@ def mock_translate_text_usecase() -> TranslateTextUseCase:
     return Mock(TranslateTextUseCase)
 
 
+@pytest.fixture
+def mock_translate_batch_usecase() -> TranslateBatchUseCase:
+    return Mock(TranslateBatchUseCase)
+
+
+@pytest.fixture
+def mock_translate_text_stream_usecase() -> TranslateTextStreamUseCase:
+    return Mock(TranslateTextStreamUseCase)
+
+
 @pytest.fixture
 def client(
     mock_translate_text_usecase: TranslateTextUseCase,
+    mock_translate_batch_usecase: TranslateBatchUseCase,
+    mock_translate_text_stream_usecase: TranslateTextStreamUseCase,
 ) -> TestClient:
     router = TranslateRouter()
     app = FastAPI()
     app.include_router(router.router)
     app.dependency_overrides[TranslateTextUseCase] = lambda: mock_translate_text_usecase
+    app.dependency_overrides[TranslateBatchUseCase] = lambda: mock_translate_batch_usecase
+    app.dependency_overrides[TranslateTextStreamUseCase] = lambda: mock_translate_text_stream_usecase
     return TestClient(app)
 
 
@@ -47,6 +74,66 @@ def test_translate_success(
         "translation": "translation_result",
     }
     mock_translate_text_usecase.execute.assert_awaited_once()
+    assert "server-timing" not in response.headers
+
+
+def test_translate_returns_stage_timings_when_requested(
+    client: TestClient,
+    mock_translate_text_usecase: TranslateTextUseCase,
+) -> None:
+    # Given
+    async def execute(*args: Any) -> str:
+        RequestTimings.record({"generate": 0.25})
+        return "translation_result"
+
+    mock_translate_text_usecase.execute = AsyncMock(side_effect=execute)
+
+    # When
+    response = client.post(
+        "/translate",
+        json={
+            "text_to_translate": "Hello, how are you?",
+            "source_language": "en_US",
+            "target_language": "pl_PL",
+            "include_timings": True,
+        },
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["translation"] == "translation_result"
+    assert response.json()["timings"]["generate"] == 250.0
+    assert "total" in response.json()["timings"]
+    assert "generate;dur=250.0" in response.headers["server-timing"]
+
+
+def test_translate_passes_requested_model(
+    client: TestClient,
+    mock_translate_text_usecase: TranslateTextUseCase,
+) -> None:
+    # Given
+    mock_translate_text_usecase.execute = AsyncMock(return_value="translation_result")
+
+    # When
+    response = client.post(
+        "/translate",
+        json={
+            "text_to_translate": "Hello",
+            "source_language": "en_US",
+            "target_language": "pl_PL",
+            "model": "facebook/seamless-m4t-v2-large",
+        },
+    )
+
+    # Then
+    assert response.status_code == 200
+    mock_translate_text_usecase.execute.assert_awaited_once_with(
+        "Hello",
+        "en_US",
+        "pl_PL",
+        {},
+        "facebook/seamless-m4t-v2-large",
+    )
 
 
 def test_translate_missing_source_language(client: TestClient) -> None:
@@ -57,3 +144,99 @@ def test_translate_missing_source_language(client: TestClient) -> None:
 
     # Then
     assert response.status_code == 422  # Unprocessable Entity
+
+
+def test_translate_batch_success(
+    client: TestClient,
+    mock_translate_batch_usecase: TranslateBatchUseCase,
+) -> None:
+    # Given
+    mock_translate_batch_usecase.execute = AsyncMock(return_value=["Cześć", "Hallo"])
+
+    # When
+    response = client.post(
+        "/translate/batch",
+        json={
+            "texts_to_translate": ["Hello", {"text_to_translate": "Hello", "target_language": "de_DE"}],
+            "source_language": "en_US",
+            "target_language": "pl_PL",
+        },
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {
+        "translations": ["Cześć", "Hallo"],
+    }
+    mock_translate_batch_usecase.execute.assert_awaited_once_with(
+        [("Hello", "en_US", "pl_PL"), ("Hello", "en_US", "de_DE")],
+        {},
+        None,
+    )
+
+
+def test_translate_stream_success(
+    client: TestClient,
+    mock_translate_text_stream_usecase: Mock,
+) -> None:
+    # Given
+    async def execute(*_: object) -> AsyncIterator[Tuple[str, str]]:
+        yield "Cześć.", " "
+        yield "Jak się masz?", ""
+
+    mock_translate_text_stream_usecase.execute.side_effect = execute
+
+    # When
+    response = client.post(
+        "/translate/stream",
+        json={
+            "text_to_translate": "Hello. How are you?",
+            "source_language": "en_US",
+            "target_language": "pl_PL",
+        },
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"index": 0, "translation": "Cześć.", "separator": " "},
+        {"index": 1, "translation": "Jak się masz?", "separator": ""},
+    ]
+
+
+@pytest.mark.parametrize(
+    "error, status_code",
+    [
+        (UnsupportedModelConfigurationError("unknown/model"), 422),
+        (LanguageNotFoundError("xx_XX", "mbart"), 500),
+    ],
+)
+def test_translate_stream_returns_error_before_streaming(
+    mock_translate_text_usecase: TranslateTextUseCase,
+    mock_translate_batch_usecase: TranslateBatchUseCase,
+    mock_translate_text_stream_usecase: Mock,
+    error: Exception,
+    status_code: int,
+) -> None:
+    # Given
+    app = FastAPI()
+    app.include_router(TranslateRouter().router)
+    GlobalExceptionHandler(app, Mock(Logger))
+    app.dependency_overrides[TranslateTextStreamUseCase] = lambda: mock_translate_text_stream_usecase
+    mock_translate_text_stream_usecase.execute.side_effect = error
+
+    # When
+    response = TestClient(app, raise_server_exceptions=False).post(
+        "/translate/stream",
+        json={
+            "text_to_translate": "Hello. How are you?",
+            "source_language": "xx_XX",
+            "target_language": "pl_PL",
+            "model": "unknown/model",
+        },
+    )
+
+    # Then
+    assert response.status_code == status_code
+    assert response.headers["content-type"] == "application/json"
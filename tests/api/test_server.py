@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch
 import pytest
 import uvicorn
 from fastapi import FastAPI
+from fastapi.testclient import TestClient
 
 from api.server import APIServer
 from core.config.app_config import AppConfig
@@ -58,3 +59,37 @@ def test_api_server_start(
             server_header=False,
             log_config=None,
         )
+
+
+def test_api_server_lifespan_preloads_model(
+    api_server: APIServer,
+    mock_config: Mock,
+) -> None:
+    # Given
+    mock_config.model_preload = True
+    mock_usecase = Mock()
+
+    # When
+    with (
+        patch.object(api_server, "_create_preload_model_usecase", return_value=mock_usecase),
+        TestClient(api_server.app),
+    ):
+        pass
+
+    # Then
+    mock_usecase.execute.assert_called_once()
+
+
+def test_api_server_lifespan_skips_preload(
+    api_server: APIServer,
+    mock_config: Mock,
+) -> None:
+    # Given
+    mock_config.model_preload = False
+
+    # When
+    with patch.object(api_server, "_create_preload_model_usecase") as mock_create_usecase, TestClient(api_server.app):
+        pass
+
+    # Then
+    mock_create_usecase.assert_not_called()
@@ -0,0 +1,52 @@
+from unittest.mock import Mock
+
+import pytest
+
+from application.usecases.check_liveness_usecase import CheckLivenessUseCase
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.models.translation_model_status import TranslationModelStatus
+from domain.services.translation_service import TranslationService
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_config() -> AppConfig:
+    return Mock(AppConfig)
+
+
+@pytest.fixture
+def mock_translation_service() -> TranslationService:
+    return Mock(TranslationService)
+
+
+@pytest.fixture
+def use_case(
+    mock_config: AppConfig,
+    mock_logger: Logger,
+    mock_translation_service: TranslationService,
+) -> CheckLivenessUseCase:
+    return CheckLivenessUseCase(
+        config=mock_config,
+        logger=mock_logger,
+        translation_service=mock_translation_service,
+    )
+
+
+def test_execute_returns_model_status(
+    use_case: CheckLivenessUseCase,
+    mock_translation_service: Mock,
+) -> None:
+    # Given
+    status = TranslationModelStatus(True, False, [1234], 0, 0, None, [])
+    mock_translation_service.get_model_status.return_value = status
+
+    # When
+    result = use_case.execute()
+
+    # Then
+    assert result == status
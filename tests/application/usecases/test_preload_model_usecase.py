@@ -0,0 +1,49 @@
+from unittest.mock import Mock
+
+import pytest
+
+from application.usecases.preload_model_usecase import PreloadModelUseCase
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.services.translation_service import TranslationService
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_config() -> AppConfig:
+    config = Mock(AppConfig)
+    config.translation_model_name = "test_model"
+    return config
+
+
+@pytest.fixture
+def mock_translation_service() -> TranslationService:
+    return Mock(TranslationService)
+
+
+@pytest.fixture
+def use_case(
+    mock_config: AppConfig,
+    mock_logger: Logger,
+    mock_translation_service: TranslationService,
+) -> PreloadModelUseCase:
+    return PreloadModelUseCase(
+        config=mock_config,
+        logger=mock_logger,
+        translation_service=mock_translation_service,
+    )
+
+
+def test_execute_preloads_model(
+    use_case: PreloadModelUseCase,
+    mock_translation_service: Mock,
+) -> None:
+    # When
+    use_case.execute()
+
+    # Then
+    mock_translation_service.preload_model.assert_called_once()
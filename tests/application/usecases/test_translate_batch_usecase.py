@@ -0,0 +1,56 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.usecases.translate_batch_usecase import TranslateBatchUseCase
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.services.translation_service import TranslationService
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_config() -> AppConfig:
+    return Mock(AppConfig)
+
+
+@pytest.fixture
+def mock_translation_service() -> TranslationService:
+    return Mock(TranslationService)
+
+
+@pytest.fixture
+def use_case(
+    mock_config: AppConfig,
+    mock_logger: Logger,
+    mock_translation_service: TranslationService,
+) -> TranslateBatchUseCase:
+    return TranslateBatchUseCase(
+        config=mock_config,
+        logger=mock_logger,
+        translation_service=mock_translation_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_success(
+    use_case: TranslateBatchUseCase,
+    mock_translation_service: Mock,
+) -> None:
+    # Given
+    mock_translation_service.translate_batch = AsyncMock(return_value=["Cześć", "Hallo"])
+
+    # When
+    result = await use_case.execute([("Hello", "en", "pl"), ("Hello", "en", "de")], {})
+
+    # Then
+    assert result == ["Cześć", "Hallo"]
+    mock_translation_service.translate_batch.assert_awaited_once_with(
+        [("Hello", "en", "pl"), ("Hello", "en", "de")],
+        {},
+        None,
+    )
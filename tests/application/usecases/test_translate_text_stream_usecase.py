@@ -0,0 +1,74 @@
+from typing import AsyncIterator, Tuple
+from unittest.mock import Mock
+
+import pytest
+
+from application.usecases.translate_text_stream_usecase import (
+    TranslateTextStreamUseCase,
+)
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.exceptions.unsupported_model_configuration_error import (
+    UnsupportedModelConfigurationError,
+)
+from domain.services.translation_service import TranslationService
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_config() -> AppConfig:
+    return Mock(AppConfig)
+
+
+@pytest.fixture
+def mock_translation_service() -> TranslationService:
+    return Mock(TranslationService)
+
+
+@pytest.fixture
+def use_case(
+    mock_config: AppConfig,
+    mock_logger: Logger,
+    mock_translation_service: TranslationService,
+) -> TranslateTextStreamUseCase:
+    return TranslateTextStreamUseCase(
+        config=mock_config,
+        logger=mock_logger,
+        translation_service=mock_translation_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_success(
+    use_case: TranslateTextStreamUseCase,
+    mock_translation_service: Mock,
+) -> None:
+    # Given
+    async def translate_text_stream(*_: object) -> AsyncIterator[Tuple[str, str]]:
+        yield "Cześć.", " "
+        yield "Świecie!", ""
+
+    mock_translation_service.translate_text_stream.side_effect = translate_text_stream
+
+    # When
+    result = [chunk async for chunk in use_case.execute("Hello. World!", "en", "pl", {})]
+
+    # Then
+    assert result == [("Cześć.", " "), ("Świecie!", "")]
+    mock_translation_service.translate_text_stream.assert_called_once_with("Hello. World!", "en", "pl", {}, None)
+
+
+def test_execute_raises_before_streaming(
+    use_case: TranslateTextStreamUseCase,
+    mock_translation_service: Mock,
+) -> None:
+    # Given
+    mock_translation_service.translate_text_stream.side_effect = UnsupportedModelConfigurationError("unknown/model")
+
+    # When / Then
+    with pytest.raises(UnsupportedModelConfigurationError, match="Unsupported model name: unknown/model"):
+        use_case.execute("Hello. World!", "en", "pl", {}, "unknown/model")
@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -42,11 +42,11 @@ async def test_execute_success(
     mock_translation_service: Mock,
 ) -> None:
     # Given
-    mock_translation_service.translate_text = Mock(return_value="translated_result")
+    mock_translation_service.translate_text = AsyncMock(return_value="translated_result")
 
     # When
     result = await use_case.execute("Hello", "en", "pl", {})
 
     # Then
     assert result == "translated_result"
-    mock_translation_service.translate_text.assert_called_once_with("Hello", "en", "pl", {})
+    mock_translation_service.translate_text.assert_awaited_once_with("Hello", "en", "pl", {}, None)
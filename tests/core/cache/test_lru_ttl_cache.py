@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+from core.cache.lru_ttl_cache import LruTtlCache, LruTtlCacheFactory
+
+
+def test_get_returns_cached_value_and_counts_hits() -> None:
+    # Given
+    cache: LruTtlCache[str, str] = LruTtlCache(max_size=2, ttl_seconds=60)
+    cache.set("hello", "hola")
+
+    # When
+    hit = cache.get("hello")
+    miss = cache.get("goodbye")
+
+    # Then
+    assert hit == "hola"
+    assert miss is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_set_evicts_least_recently_used_entry() -> None:
+    # Given
+    cache: LruTtlCache[str, str] = LruTtlCache(max_size=2, ttl_seconds=60)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+
+    # When
+    cache.set("c", "3")
+
+    # Then
+    assert len(cache) == 2
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+
+
+def test_get_expires_entries_after_ttl() -> None:
+    # Given
+    cache: LruTtlCache[str, str] = LruTtlCache(max_size=2, ttl_seconds=10)
+
+    with patch("core.cache.lru_ttl_cache.time.monotonic", return_value=100.0):
+        cache.set("a", "1")
+
+    # When
+    with patch("core.cache.lru_ttl_cache.time.monotonic", return_value=110.0):
+        result = cache.get("a")
+
+    # Then
+    assert result is None
+    assert len(cache) == 0
+    assert cache.misses == 1
+
+
+def test_set_with_zero_max_size_does_not_store() -> None:
+    # Given
+    cache: LruTtlCache[str, str] = LruTtlCache(max_size=0, ttl_seconds=10)
+
+    # When
+    cache.set("a", "1")
+
+    # Then
+    assert len(cache) == 0
+
+
+def test_factory_creates_cache() -> None:
+    # When
+    cache = LruTtlCacheFactory().create(5, 30)
+
+    # Then
+    assert isinstance(cache, LruTtlCache)
+    assert cache.max_size == 5
+    assert cache.ttl_seconds == 30
@@ -22,22 +22,78 @@ def test_initialize(app_config: AppConfig, mock_logger: Logger) -> None:
     with patch.dict(
         os.environ,
         {
+            "LOG_ASYNC": "true",
+            "LOG_FORMAT": "JSON",
+            "LOG_REQUEST_SAMPLE_RATE": "0.25",
+            "LOG_TEXT_MAX_LENGTH": "50",
+            "LOG_REDACT_TEXT": "true",
             "FASTAPI_HOST": "localhost",
             "FASTAPI_PORT": "8000",
+            "TRANSLATION_ENGINE": "ONNX",
             "TRANSLATION_MODEL_NAME": "test_translation_model",
+            "TRANSLATION_MODEL_NAMES": "other_translation_model, test_translation_model",
             "TRANSLATION_MODEL_DOWNLOAD_PATH": "translation_model_path",
             "MODEL_IDLE_TIMEOUT": "150",
+            "MODEL_PRELOAD": "true",
+            "MODEL_MIN_WARM_WORKERS": "1",
+            "MODEL_PRECISION": "INT8",
+            "MODEL_FAST_LOAD": "true",
+            "MODEL_SHARED_MEMORY": "true",
+            "MAX_LOADED_MODELS": "1",
+            "MODEL_MEMORY_BUDGET_MB": "8192",
+            "MODEL_EVICTION_POLICY": "LFU",
+            "READINESS_MAX_QUEUE_DEPTH": "32",
+            "TRANSLATION_WORKERS": "4",
+            "TRANSLATION_WORKER_THREADS": "2",
+            "TRANSLATION_BATCH_MAX_SIZE": "16",
+            "TRANSLATION_BATCH_MAX_WAIT_MS": "25",
+            "TRANSLATION_BATCH_MAX_IN_FLIGHT": "4",
+            "TRANSLATION_MAX_INPUT_TOKENS": "256",
+            "TRANSLATION_CACHE_ENABLED": "false",
+            "TRANSLATION_CACHE_MAX_SIZE": "500",
+            "TRANSLATION_CACHE_TTL": "120",
+            "TRANSLATION_MEMORY_ENABLED": "true",
+            "TRANSLATION_MEMORY_MAX_ENTRIES": "1000",
+            "TRANSLATION_SEGMENT_CACHE_ENABLED": "true",
         },
     ):
         # When
         app_config.initialize(mock_logger)
 
         # Then
+        assert app_config.log_async is True
+        assert app_config.log_format == "json"
+        assert app_config.log_request_sample_rate == 0.25
+        assert app_config.log_text_max_length == 50
+        assert app_config.log_redact_text is True
         assert app_config.fastapi_host == "localhost"
         assert app_config.fastapi_port == 8000
         assert app_config.translation_model_name == "test_translation_model"
+        assert app_config.translation_model_names == ["test_translation_model", "other_translation_model"]
+        assert app_config.translation_engine == "onnx"
         assert app_config.translation_model_download_path == "translation_model_path"
         assert app_config.model_idle_timeout == 150
+        assert app_config.model_preload is True
+        assert app_config.model_min_warm_workers == 1
+        assert app_config.model_precision == "int8"
+        assert app_config.model_fast_load is True
+        assert app_config.model_shared_memory is True
+        assert app_config.max_loaded_models == 1
+        assert app_config.model_memory_budget_mb == 8192
+        assert app_config.model_eviction_policy == "lfu"
+        assert app_config.readiness_max_queue_depth == 32
+        assert app_config.translation_workers == 4
+        assert app_config.translation_worker_threads == 2
+        assert app_config.translation_batch_max_size == 16
+        assert app_config.translation_batch_max_wait_ms == 25
+        assert app_config.translation_batch_max_in_flight == 4
+        assert app_config.translation_max_input_tokens == 256
+        assert app_config.translation_cache_enabled is False
+        assert app_config.translation_cache_max_size == 500
+        assert app_config.translation_cache_ttl == 120
+        assert app_config.translation_memory_enabled is True
+        assert app_config.translation_memory_max_entries == 1000
+        assert app_config.translation_segment_cache_enabled is True
 
 
 def test_initialize_invalid_port(app_config: AppConfig, mock_logger: Logger) -> None:
@@ -60,10 +116,38 @@ def test_initialize_log_parameters(app_config: AppConfig, mock_logger: Logger) -
     assert mock_logger.info.call_args_list[0][0][0] == "Initializing configuration..."
     assert mock_logger.info.call_args_list[1][0][0].startswith("Configuration loaded:")
     assert "LOG_LEVEL" in mock_logger.info.call_args_list[1][0][0]
+    assert "LOG_ASYNC" in mock_logger.info.call_args_list[1][0][0]
+    assert "LOG_FORMAT" in mock_logger.info.call_args_list[1][0][0]
+    assert "LOG_REQUEST_SAMPLE_RATE" in mock_logger.info.call_args_list[1][0][0]
+    assert "LOG_TEXT_MAX_LENGTH" in mock_logger.info.call_args_list[1][0][0]
+    assert "LOG_REDACT_TEXT" in mock_logger.info.call_args_list[1][0][0]
     assert "DEVICE" in mock_logger.info.call_args_list[1][0][0]
     assert "FASTAPI_HOST" in mock_logger.info.call_args_list[1][0][0]
     assert "FASTAPI_PORT" in mock_logger.info.call_args_list[1][0][0]
     assert "TRANSLATION_MODEL_NAME" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_MODEL_NAMES" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_ENGINE" in mock_logger.info.call_args_list[1][0][0]
     assert "TRANSLATION_MODEL_DOWNLOAD_PATH" in mock_logger.info.call_args_list[1][0][0]
     assert "MODEL_IDLE_TIMEOUT" in mock_logger.info.call_args_list[1][0][0]
+    assert "MODEL_PRELOAD" in mock_logger.info.call_args_list[1][0][0]
+    assert "MODEL_MIN_WARM_WORKERS" in mock_logger.info.call_args_list[1][0][0]
+    assert "MODEL_PRECISION" in mock_logger.info.call_args_list[1][0][0]
+    assert "MODEL_FAST_LOAD" in mock_logger.info.call_args_list[1][0][0]
+    assert "MODEL_SHARED_MEMORY" in mock_logger.info.call_args_list[1][0][0]
+    assert "MAX_LOADED_MODELS" in mock_logger.info.call_args_list[1][0][0]
+    assert "MODEL_MEMORY_BUDGET_MB" in mock_logger.info.call_args_list[1][0][0]
+    assert "MODEL_EVICTION_POLICY" in mock_logger.info.call_args_list[1][0][0]
+    assert "READINESS_MAX_QUEUE_DEPTH" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_WORKERS" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_WORKER_THREADS" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_BATCH_MAX_SIZE" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_BATCH_MAX_WAIT_MS" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_BATCH_MAX_IN_FLIGHT" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_MAX_INPUT_TOKENS" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_CACHE_ENABLED" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_CACHE_MAX_SIZE" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_CACHE_TTL" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_MEMORY_ENABLED" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_MEMORY_MAX_ENTRIES" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_SEGMENT_CACHE_ENABLED" in mock_logger.info.call_args_list[1][0][0]
     assert mock_logger.info.call_args_list[2][0][0] == "Configuration initialized successfully."
@@ -0,0 +1,37 @@
+import json
+import logging
+
+from core.logger.json_formatter import JsonFormatter
+
+
+def test_format_writes_single_line_json() -> None:
+    # Given
+    record = logging.LogRecord("translation-api", logging.INFO, __file__, 1, "Translated %d texts", (3,), None)
+    record.request_id = "abc123"
+
+    # When
+    output = JsonFormatter().format(record)
+
+    # Then
+    entry = json.loads(output)
+    assert "\n" not in output
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "translation-api"
+    assert entry["message"] == "Translated 3 texts"
+    assert entry["request_id"] == "abc123"
+    assert entry["timestamp"].endswith("+00:00")
+
+
+def test_format_includes_exception() -> None:
+    # Given
+    try:
+        raise ValueError("Invalid value")
+    except ValueError as e:
+        record = logging.LogRecord("translation-api", logging.ERROR, __file__, 1, "Failed", (), (ValueError, e, None))
+
+    # When
+    entry = json.loads(JsonFormatter().format(record))
+
+    # Then
+    assert "request_id" not in entry
+    assert "ValueError: Invalid value" in entry["exception"]
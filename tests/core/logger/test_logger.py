@@ -1,8 +1,12 @@
+import io
+import json
 import logging
+from logging.handlers import QueueHandler
 from unittest.mock import patch
 
 import pytest
 
+from core.logger.json_formatter import JsonFormatter
 from src.core.logger.logger import Logger
 
 
@@ -60,7 +64,10 @@ def test_debug_logs_message(logger_instance: Logger) -> None:
     # Given
     message = "Test debug message"
 
-    with patch.object(logger_instance.logger, "log") as mock_debug:
+    with (
+        patch.object(logger_instance.logger, "log") as mock_debug,
+        patch.object(logger_instance.logger, "isEnabledFor", return_value=True),
+    ):
         # When
         logger_instance.debug(message)
 
@@ -71,6 +78,129 @@ def test_debug_logs_message(logger_instance: Logger) -> None:
         )
 
 
+def test_disabled_level_skips_logging(logger_instance: Logger) -> None:
+    # Given
+    with (
+        patch.object(logger_instance.logger, "log") as mock_log,
+        patch.object(logger_instance.logger, "isEnabledFor", return_value=False),
+    ):
+        # When
+        logger_instance.debug("Status: %s", "status")
+
+        # Then
+        mock_log.assert_not_called()
+
+
+def test_info_passes_arguments_for_lazy_formatting(logger_instance: Logger) -> None:
+    # Given
+    with patch.object(logger_instance.logger, "log") as mock_info:
+        # When
+        logger_instance.info("Translated %d texts", 3)
+
+        # Then
+        mock_info.assert_called_once_with(
+            logging.INFO,
+            "tests.core.logger.test_logger.test_info_passes_arguments_for_lazy_formatting - Translated %d texts",
+            3,
+        )
+
+
+def test_enable_async_routes_records_through_queue(logger_instance: Logger) -> None:
+    # Given
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    original_handlers = logger_instance.logger.handlers
+    logger_instance.logger.handlers = [handler]
+
+    try:
+        # When
+        logger_instance.enable_async()
+        queue_handlers = logger_instance.logger.handlers
+        logger_instance.info("Queued message")
+        logger_instance.disable_async()
+
+        # Then
+        assert isinstance(queue_handlers[0], QueueHandler)
+        assert logger_instance.logger.handlers == [handler]
+        assert "Queued message" in stream.getvalue()
+    finally:
+        logger_instance.logger.handlers = original_handlers
+
+
+@pytest.mark.asyncio
+async def test_unsampled_request_skips_info_but_keeps_warnings(logger_instance: Logger) -> None:
+    # Given
+    logger_instance.request_sample_rate = 0.0
+
+    try:
+        with patch.object(logger_instance.logger, "log") as mock_log:
+            # When
+            logger_instance.begin_request()
+            logger_instance.info("Request started")
+            logger_instance.warning("Request failed")
+
+            # Then
+            mock_log.assert_called_once()
+            assert mock_log.call_args[0][0] == logging.WARNING
+    finally:
+        logger_instance.request_sample_rate = 1.0
+
+
+@pytest.mark.asyncio
+async def test_begin_request_attaches_request_id_to_records(logger_instance: Logger) -> None:
+    # Given
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonFormatter())
+    original_handlers = logger_instance.logger.handlers
+    logger_instance.logger.handlers = [handler]
+
+    try:
+        # When
+        request_id = logger_instance.begin_request()
+        logger_instance.info("Request started")
+
+        # Then
+        entry = json.loads(stream.getvalue())
+        assert entry["request_id"] == request_id
+        assert entry["message"].endswith("Request started")
+    finally:
+        logger_instance.logger.handlers = original_handlers
+
+
+def test_configure_sets_json_formatter(logger_instance: Logger) -> None:
+    # Given
+    handler = logging.StreamHandler(io.StringIO())
+    original_handlers = logger_instance.logger.handlers
+    logger_instance.logger.handlers = [handler]
+
+    try:
+        # When
+        logger_instance.configure("json", 2.0, 10, False)
+
+        # Then
+        assert isinstance(handler.formatter, JsonFormatter)
+        assert logger_instance.request_sample_rate == 1.0
+        assert str(logger_instance.text("Hello, how are you today?")) == "Hello, how... (25 chars)"
+    finally:
+        logger_instance.configure("text", 1.0, 0, False)
+        logger_instance.logger.handlers = original_handlers
+
+
+def test_text_redacts_when_enabled(logger_instance: Logger) -> None:
+    # Given
+    logger_instance.redact_text = True
+
+    try:
+        # When
+        text = str(logger_instance.text("Confidential"))
+
+        # Then
+        assert text == "<redacted 12 chars>"
+    finally:
+        logger_instance.redact_text = False
+
+
 def test_logger_is_singleton() -> None:
     # Given
     logger1 = Logger()
@@ -0,0 +1,44 @@
+from core.metrics.metrics import Metrics
+
+
+def test_metrics_is_singleton() -> None:
+    # When
+    first = Metrics()
+    second = Metrics()
+
+    # Then
+    assert first is second
+
+
+def test_record_cache_lookup_counts_hits_and_misses() -> None:
+    # Given
+    metrics = Metrics()
+    hit_labels = {"cache": "memory", "result": "hit"}
+    miss_labels = {"cache": "memory", "result": "miss"}
+    hits = metrics.registry.get_sample_value("translation_cache_requests_total", hit_labels) or 0.0
+    misses = metrics.registry.get_sample_value("translation_cache_requests_total", miss_labels) or 0.0
+
+    # When
+    metrics.record_cache_lookup("memory", True)
+    metrics.record_cache_lookup("memory", False)
+    metrics.record_cache_lookup("memory", False)
+
+    # Then
+    assert metrics.registry.get_sample_value("translation_cache_requests_total", hit_labels) == hits + 1
+    assert metrics.registry.get_sample_value("translation_cache_requests_total", miss_labels) == misses + 2
+
+
+def test_render_returns_prometheus_exposition() -> None:
+    # Given
+    metrics = Metrics()
+    metrics.stage_seconds.labels("model", "en", "fr", "generate").observe(0.2)
+
+    # When
+    output = metrics.render().decode("utf-8")
+
+    # Then
+    assert "# TYPE translation_stage_seconds histogram" in output
+    assert (
+        'translation_stage_seconds_count{model="model",source_language="en",stage="generate",target_language="fr"}'
+        in output
+    )
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from core.metrics.request_timings import RequestTimings
+
+
+def test_measure_without_current_timings_is_ignored() -> None:
+    # When
+    with RequestTimings.measure("cache_lookup"):
+        pass
+
+    # Then
+    assert RequestTimings.current() is None
+
+
+@pytest.mark.asyncio
+async def test_measure_and_record_accumulate_into_current_timings() -> None:
+    # Given
+    timings = RequestTimings.begin()
+
+    # When
+    with RequestTimings.measure("cache_lookup"):
+        await asyncio.sleep(0)
+
+    RequestTimings.record({"generate": 0.25})
+    RequestTimings.record({"generate": 0.25})
+
+    # Then
+    assert RequestTimings.current() is timings
+    assert timings.stage_seconds["cache_lookup"] >= 0
+    assert timings.stage_seconds["generate"] == 0.5
+
+
+def test_to_server_timing_formats_milliseconds() -> None:
+    # Given
+    timings = RequestTimings()
+    timings.add("queue", 0.0125)
+    timings.add("generate", 0.5)
+
+    # When
+    header = timings.to_server_timing()
+
+    # Then
+    assert timings.to_milliseconds() == {"queue": 12.5, "generate": 500.0}
+    assert header == "queue;dur=12.5, generate;dur=500.0"
@@ -0,0 +1,42 @@
+from unittest.mock import Mock
+
+import pytest
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from data.factories.translation_batch_scheduler_factory import (
+    TranslationBatchSchedulerFactory,
+)
+from data.schedulers.translation_batch_scheduler import TranslationBatchScheduler
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_config() -> AppConfig:
+    config = Mock(AppConfig)
+    config.translation_batch_max_size = 16
+    config.translation_batch_max_wait_ms = 20
+    config.translation_batch_max_in_flight = 3
+    return config
+
+
+def test_create(mock_config: AppConfig, mock_logger: Logger) -> None:
+    # Given
+    worker_pool = Mock()
+    worker_pool.workers = [Mock(), Mock()]
+    factory = TranslationBatchSchedulerFactory(config=mock_config, logger=mock_logger, metrics=Mock())
+
+    # When
+    scheduler = factory.create(worker_pool, "test-model")
+
+    # Then
+    assert isinstance(scheduler, TranslationBatchScheduler)
+    assert scheduler.worker_pool is worker_pool
+    assert scheduler.max_batch_size == 16
+    assert scheduler.max_wait == 0.02
+    assert scheduler.max_in_flight_batches == 6
+    assert scheduler.model_name == "test-model"
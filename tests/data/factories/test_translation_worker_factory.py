@@ -1,14 +1,25 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from data.workers.mbart_ctranslate2_translation_worker import (
+    MBartCTranslate2TranslationWorker,
+)
+from data.workers.mbart_onnx_translation_worker import MBartOnnxTranslationWorker
 from data.workers.mbart_translation_worker import MBartTranslationWorker
 from data.workers.seamless_translation_worker import SeamlessTranslationWorker
+from data.workers.translation_worker_pool import TranslationWorkerPool
 from domain.exceptions.unsupported_model_configuration_error import (
     UnsupportedModelConfigurationError,
 )
+from domain.exceptions.unsupported_model_precision_error import (
+    UnsupportedModelPrecisionError,
+)
+from domain.exceptions.unsupported_translation_engine_error import (
+    UnsupportedTranslationEngineError,
+)
 from src.data.factories.translation_worker_factory import TranslationWorkerFactory
 
 
@@ -19,20 +30,27 @@ def mock_logger() -> Logger:
 
 @pytest.fixture
 def mock_config() -> AppConfig:
-    return Mock(AppConfig)
+    config = Mock(AppConfig)
+    config.translation_workers = 1
+    config.translation_worker_threads = 4
+    config.translation_max_input_tokens = 400
+    config.model_precision = "fp32"
+    config.model_fast_load = False
+    config.model_shared_memory = False
+    config.translation_engine = "torch"
+    return config
 
 
 def test_create_mbart(mock_config: AppConfig, mock_logger: Logger) -> None:
     # Given
-    mock_config.translation_model_name = "facebook/mbart-large-50-many-to-many-mmt"
     mock_config.device = "cpu"
     mock_config.translation_model_download_path = "/path/to/mbart"
     mock_config.log_level = "INFO"
 
-    factory = TranslationWorkerFactory(config=mock_config, logger=mock_logger)
+    factory = TranslationWorkerFactory(config=mock_config, logger=mock_logger, metrics=Mock())
 
     # When
-    worker = factory.create()
+    worker = factory.create("facebook/mbart-large-50-many-to-many-mmt")
 
     # Then
     assert isinstance(worker, MBartTranslationWorker)
@@ -40,19 +58,23 @@ def test_create_mbart(mock_config: AppConfig, mock_logger: Logger) -> None:
     assert worker._config.model_name == "facebook/mbart-large-50-many-to-many-mmt"
     assert worker._config.model_download_path == "/path/to/mbart"
     assert worker._config.log_level == "INFO"
+    assert worker._config.num_threads == 4
+    assert worker._config.max_input_tokens == 400
+    assert worker._config.precision == "fp32"
+    assert worker._config.fast_load is False
 
 
 def test_create_seamless(mock_config: AppConfig, mock_logger: Logger) -> None:
     # Given
-    mock_config.translation_model_name = "facebook/seamless-m4t-v2-large"
     mock_config.device = "cpu"
     mock_config.translation_model_download_path = "/path/to/seamless"
     mock_config.log_level = "INFO"
+    mock_config.model_fast_load = True
 
-    factory = TranslationWorkerFactory(config=mock_config, logger=mock_logger)
+    factory = TranslationWorkerFactory(config=mock_config, logger=mock_logger, metrics=Mock())
 
     # When
-    worker = factory.create()
+    worker = factory.create("facebook/seamless-m4t-v2-large")
 
     # Then
     assert isinstance(worker, SeamlessTranslationWorker)
@@ -60,13 +82,121 @@ def test_create_seamless(mock_config: AppConfig, mock_logger: Logger) -> None:
     assert worker._config.model_name == "facebook/seamless-m4t-v2-large"
     assert worker._config.model_download_path == "/path/to/seamless"
     assert worker._config.log_level == "INFO"
+    assert worker._config.fast_load is True
 
 
 def test_create_unsupported_model(mock_config: AppConfig, mock_logger: Logger) -> None:
     # Given
-    mock_config.translation_model_name = "unsupported-model"
-    factory = TranslationWorkerFactory(config=mock_config, logger=mock_logger)
+    factory = TranslationWorkerFactory(config=mock_config, logger=mock_logger, metrics=Mock())
 
     # When / Then
     with pytest.raises(UnsupportedModelConfigurationError, match="Unsupported model name: unsupported-model"):
-        factory.create()
+        factory.create("unsupported-model")
+
+
+def test_create_unsupported_precision(mock_config: AppConfig, mock_logger: Logger) -> None:
+    # Given
+    mock_config.model_precision = "fp8"
+    factory = TranslationWorkerFactory(config=mock_config, logger=mock_logger, metrics=Mock())
+
+    # When / Then
+    with pytest.raises(UnsupportedModelPrecisionError, match="Unsupported model precision: fp8"):
+        factory.create("facebook/mbart-large-50-many-to-many-mmt")
+
+
+def test_create_pool(mock_config: AppConfig, mock_logger: Logger) -> None:
+    # Given
+    mock_config.device = "cpu"
+    mock_config.translation_model_download_path = "/path/to/mbart"
+    mock_config.log_level = "INFO"
+    mock_config.translation_workers = 3
+    mock_config.translation_worker_threads = 0
+
+    factory = TranslationWorkerFactory(config=mock_config, logger=mock_logger, metrics=Mock())
+
+    # When
+    with patch("os.cpu_count", return_value=12):
+        pool = factory.create_pool("facebook/mbart-large-50-many-to-many-mmt")
+
+    # Then
+    assert isinstance(pool, TranslationWorkerPool)
+    assert len(pool.workers) == 3
+    assert all(isinstance(worker, MBartTranslationWorker) for worker in pool.workers)
+    assert all(worker._config.num_threads == 4 for worker in pool.workers)
+    assert not pool.shared_memory
+
+
+@pytest.mark.parametrize(
+    "engine, device, shared_memory",
+    [("torch", "cpu", True), ("torch", "cuda", False), ("onnx", "cpu", False)],
+)
+def test_create_pool_shares_model_memory_only_for_torch_on_cpu(
+    mock_config: AppConfig,
+    mock_logger: Logger,
+    engine: str,
+    device: str,
+    shared_memory: bool,
+) -> None:
+    # Given
+    mock_config.model_shared_memory = True
+    mock_config.translation_engine = engine
+    mock_config.device = device
+    mock_config.translation_model_download_path = "/path/to/mbart"
+    mock_config.log_level = "INFO"
+
+    factory = TranslationWorkerFactory(config=mock_config, logger=mock_logger, metrics=Mock())
+
+    # When
+    pool = factory.create_pool("facebook/mbart-large-50-many-to-many-mmt")
+
+    # Then
+    assert pool.shared_memory is shared_memory
+    assert mock_logger.warning.called is not shared_memory
+
+
+def test_create_mbart_onnx(mock_config: AppConfig, mock_logger: Logger) -> None:
+    # Given
+    mock_config.translation_engine = "onnx"
+    mock_config.device = "cpu"
+    mock_config.translation_model_download_path = "/path/to/mbart"
+    mock_config.log_level = "INFO"
+
+    factory = TranslationWorkerFactory(config=mock_config, logger=mock_logger, metrics=Mock())
+
+    # When
+    worker = factory.create("facebook/mbart-large-50-many-to-many-mmt")
+
+    # Then
+    assert isinstance(worker, MBartOnnxTranslationWorker)
+    assert worker._config.model_name == "facebook/mbart-large-50-many-to-many-mmt"
+
+
+def test_create_mbart_ctranslate2(mock_config: AppConfig, mock_logger: Logger) -> None:
+    # Given
+    mock_config.translation_engine = "ctranslate2"
+    mock_config.model_precision = "int8"
+    mock_config.device = "cpu"
+    mock_config.translation_model_download_path = "/path/to/mbart"
+    mock_config.log_level = "INFO"
+
+    factory = TranslationWorkerFactory(config=mock_config, logger=mock_logger, metrics=Mock())
+
+    # When
+    worker = factory.create("facebook/mbart-large-50-many-to-many-mmt")
+
+    # Then
+    assert isinstance(worker, MBartCTranslate2TranslationWorker)
+    assert worker._config.precision == "int8"
+
+
+def test_create_unsupported_engine(mock_config: AppConfig, mock_logger: Logger) -> None:
+    # Given
+    mock_config.translation_engine = "onnx"
+    factory = TranslationWorkerFactory(config=mock_config, logger=mock_logger, metrics=Mock())
+
+    # When / Then
+    with pytest.raises(
+        UnsupportedTranslationEngineError,
+        match="Unsupported translation engine: onnx for model: facebook/seamless-m4t-v2-large",
+    ):
+        factory.create("facebook/seamless-m4t-v2-large")
@@ -0,0 +1,163 @@
+import sqlite3
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from core.metrics.metrics import Metrics
+from data.repositories.translation_memory_repository_impl import (
+    TranslationMemoryRepositoryImpl,
+)
+from domain.repositories.directory_repository import DirectoryRepository
+
+
+@pytest.fixture
+def mock_config(tmp_path: Path) -> AppConfig:
+    config = Mock(AppConfig)
+    config.translation_model_download_path = str(tmp_path)
+    config.translation_memory_enabled = True
+    config.translation_memory_max_entries = 2
+    return config
+
+
+@pytest.fixture
+def mock_directory_repository() -> DirectoryRepository:
+    return Mock(DirectoryRepository)
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def translation_memory_repository(
+    mock_config: AppConfig,
+    mock_directory_repository: DirectoryRepository,
+    mock_logger: Logger,
+) -> Iterator[TranslationMemoryRepositoryImpl]:
+    with patch.object(TranslationMemoryRepositoryImpl, "_instance", None):
+        yield TranslationMemoryRepositoryImpl(
+            config=mock_config,
+            directory_repository=mock_directory_repository,
+            logger=mock_logger,
+            metrics=Metrics(),
+        )
+
+
+def test_find_returns_saved_translation(translation_memory_repository: TranslationMemoryRepositoryImpl) -> None:
+    # Given
+    translation_memory_repository.save("Hello", "en_XX", "pl_PL", {"num_beams": 2, "max_length": 10}, "Cześć", "mbart")
+    translation_memory_repository.flush()
+
+    # When
+    result = translation_memory_repository.find("Hello ", "en_XX", "pl_PL", {"max_length": 10, "num_beams": 2}, "mbart")
+    missing = translation_memory_repository.find("Hello", "en_XX", "de_DE", {}, "mbart")
+
+    # Then
+    assert result == "Cześć"
+    assert missing is None
+
+
+def test_find_separates_models(translation_memory_repository: TranslationMemoryRepositoryImpl) -> None:
+    # Given
+    translation_memory_repository.save("Hello", "en_XX", "pl_PL", {}, "Cześć", "mbart")
+    translation_memory_repository.flush()
+
+    # When
+    result = translation_memory_repository.find("Hello", "en_XX", "pl_PL", {}, "seamless")
+
+    # Then
+    assert result is None
+
+
+def test_find_survives_restart(
+    translation_memory_repository: TranslationMemoryRepositoryImpl,
+    mock_config: AppConfig,
+    mock_directory_repository: DirectoryRepository,
+    mock_logger: Logger,
+) -> None:
+    # Given
+    translation_memory_repository.save("Hello", "en_XX", "pl_PL", {}, "Cześć", "mbart")
+    translation_memory_repository.flush()
+
+    with patch.object(TranslationMemoryRepositoryImpl, "_instance", None):
+        restarted = TranslationMemoryRepositoryImpl(
+            config=mock_config,
+            directory_repository=mock_directory_repository,
+            logger=mock_logger,
+            metrics=Metrics(),
+        )
+
+    # When
+    result = restarted.find("Hello", "en_XX", "pl_PL", {}, "mbart")
+
+    # Then
+    assert result == "Cześć"
+
+
+def test_save_evicts_least_recently_used_entries(
+    translation_memory_repository: TranslationMemoryRepositoryImpl,
+    mock_config: AppConfig,
+) -> None:
+    # Given
+    with patch("data.repositories.translation_memory_repository_impl.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+        translation_memory_repository.save("One", "en_XX", "pl_PL", {}, "Jeden", "mbart")
+        translation_memory_repository.save("Two", "en_XX", "pl_PL", {}, "Dwa", "mbart")
+        translation_memory_repository.flush()
+        translation_memory_repository.find("One", "en_XX", "pl_PL", {}, "mbart")
+        translation_memory_repository.flush()
+
+        # When
+        translation_memory_repository.save("Three", "en_XX", "pl_PL", {}, "Trzy", "mbart")
+        translation_memory_repository.flush()
+
+    # Then
+    assert translation_memory_repository.find("One", "en_XX", "pl_PL", {}, "mbart") == "Jeden"
+    assert translation_memory_repository.find("Two", "en_XX", "pl_PL", {}, "mbart") is None
+    assert translation_memory_repository.find("Three", "en_XX", "pl_PL", {}, "mbart") == "Trzy"
+
+    with sqlite3.connect(
+        Path(mock_config.translation_model_download_path) / "translation_memory.sqlite3",
+    ) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM translation_memory").fetchone()[0] == 2
+
+
+def test_save_skips_sampled_generation(translation_memory_repository: TranslationMemoryRepositoryImpl) -> None:
+    # Given
+    translation_memory_repository.save("Hello", "en_XX", "pl_PL", {"do_sample": True}, "Cześć", "mbart")
+    translation_memory_repository.flush()
+
+    # When
+    result = translation_memory_repository.find("Hello", "en_XX", "pl_PL", {"do_sample": True}, "mbart")
+
+    # Then
+    assert result is None
+
+
+def test_disabled_translation_memory_does_not_create_database(
+    mock_config: AppConfig,
+    mock_directory_repository: Mock,
+    mock_logger: Logger,
+) -> None:
+    # Given
+    mock_config.translation_memory_enabled = False
+
+    with patch.object(TranslationMemoryRepositoryImpl, "_instance", None):
+        repository = TranslationMemoryRepositoryImpl(
+            config=mock_config,
+            directory_repository=mock_directory_repository,
+            logger=mock_logger,
+            metrics=Metrics(),
+        )
+
+    # When
+    repository.save("Hello", "en_XX", "pl_PL", {}, "Cześć", "mbart")
+
+    # Then
+    assert repository.find("Hello", "en_XX", "pl_PL", {}, "mbart") is None
+    assert not (Path(mock_config.translation_model_download_path) / "translation_memory.sqlite3").exists()
+    mock_directory_repository.create_directory.assert_not_called()
@@ -1,15 +1,34 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
 
+from core.cache.lru_ttl_cache import LruTtlCacheFactory
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from core.metrics.metrics import Metrics
+from core.metrics.request_timings import RequestTimings
 from core.timer.timer import Timer, TimerFactory
+from data.factories.translation_batch_scheduler_factory import (
+    TranslationBatchSchedulerFactory,
+)
 from data.factories.translation_worker_factory import TranslationWorkerFactory
 from data.repositories.translation_model_repository_impl import (
+    HostedTranslationModel,
     TranslationModelRepositoryImpl,
 )
+from data.workers.translation_worker_pool import TranslationWorkerPool
+from domain.exceptions.unsupported_model_configuration_error import (
+    UnsupportedModelConfigurationError,
+)
+from domain.models.translation_model_status import TranslationModelStatus
 from domain.repositories.directory_repository import DirectoryRepository
+from domain.repositories.translation_memory_repository import (
+    TranslationMemoryRepository,
+)
 
 
 @pytest.fixture
@@ -18,8 +37,18 @@ def mock_config() -> AppConfig:
     config.translation_model_download_path = "/models"
     config.device = "cpu"
     config.translation_model_name = "openai/translation"
+    config.translation_model_names = ["openai/translation"]
+    config.max_loaded_models = 0
+    config.model_memory_budget_mb = 0
+    config.model_eviction_policy = "lru"
     config.translation_model_type = "base"
     config.model_idle_timeout = 60
+    config.model_preload = False
+    config.model_min_warm_workers = 0
+    config.translation_cache_enabled = True
+    config.translation_cache_max_size = 100
+    config.translation_cache_ttl = 60
+    config.translation_memory_enabled = False
     return config
 
 
@@ -46,17 +75,46 @@ def mock_logger() -> Mock:
 
 
 @pytest.fixture
-def mock_worker() -> Mock:
-    return Mock()
+def mock_worker_pool() -> Mock:
+    worker_pool = Mock()
+    worker_pool.rss_bytes.return_value = 0
+    return worker_pool
 
 
 @pytest.fixture
-def mock_worker_factory(mock_worker: Mock) -> Mock:
+def mock_worker_factory(mock_worker_pool: Mock) -> Mock:
     factory = Mock(spec=TranslationWorkerFactory)
-    factory.create.return_value = mock_worker
+    factory.create_pool.return_value = mock_worker_pool
     return factory
 
 
+@pytest.fixture
+def mock_scheduler() -> Mock:
+    scheduler = Mock()
+    scheduler.queue_depth.return_value = 0
+    scheduler.pending_count.return_value = 0
+    return scheduler
+
+
+@pytest.fixture
+def mock_scheduler_factory(mock_scheduler: Mock) -> Mock:
+    factory = Mock(spec=TranslationBatchSchedulerFactory)
+    factory.create.return_value = mock_scheduler
+    return factory
+
+
+@pytest.fixture
+def cache_factory() -> LruTtlCacheFactory:
+    return LruTtlCacheFactory()
+
+
+@pytest.fixture
+def mock_translation_memory_repository() -> Mock:
+    repository = Mock(TranslationMemoryRepository)
+    repository.find.return_value = None
+    return repository
+
+
 @pytest.fixture
 def translation_model_repository_impl(
     mock_config: Mock,
@@ -64,6 +122,9 @@ def translation_model_repository_impl(
     mock_timer_factory: Mock,
     mock_logger: Mock,
     mock_worker_factory: Mock,
+    mock_scheduler_factory: Mock,
+    cache_factory: LruTtlCacheFactory,
+    mock_translation_memory_repository: Mock,
 ) -> TranslationModelRepositoryImpl:
     with patch.object(TranslationModelRepositoryImpl, "_instance", None):
         return TranslationModelRepositoryImpl(
@@ -72,43 +133,949 @@ def translation_model_repository_impl(
             timer_factory=mock_timer_factory,
             logger=mock_logger,
             worker_factory=mock_worker_factory,
+            scheduler_factory=mock_scheduler_factory,
+            cache_factory=cache_factory,
+            metrics=Metrics(),
+            translation_memory_repository=mock_translation_memory_repository,
         )
 
 
-def test_translate_success(
+@pytest.mark.asyncio
+async def test_translate_success(
     translation_model_repository_impl: TranslationModelRepositoryImpl,
-    mock_worker: Mock,
+    mock_worker_pool: Mock,
     mock_timer: Mock,
+    mock_scheduler: Mock,
+    mock_scheduler_factory: Mock,
 ) -> None:
     # Given
-    mock_worker.is_alive.return_value = False
-    mock_worker.translate.return_value = "translated text"
+    mock_worker_pool.is_alive.return_value = False
+    future: Future[str] = Future()
+    future.set_result("translated text")
+    mock_scheduler.submit.return_value = future
 
     # When
-    result = translation_model_repository_impl.translate("text to translate", "en", "fr", {})
+    result = await translation_model_repository_impl.translate(
+        "text to translate",
+        "en",
+        "fr",
+        {},
+        "openai/translation",
+    )
 
     # Then
     assert result == "translated text"
-    mock_worker.start.assert_called_once()
-    mock_worker.translate.assert_called_once_with("text to translate", "en", "fr", {})
-    mock_timer.start.assert_called_once_with(60, translation_model_repository_impl._check_idle_timeout)
+    mock_scheduler_factory.create.assert_called_once_with(mock_worker_pool, "openai/translation")
+    mock_worker_pool.start.assert_called_once()
+    mock_scheduler.start.assert_called_once()
+    mock_scheduler.submit.assert_called_once_with("text to translate", "en", "fr", {}, {})
+    mock_timer.start.assert_called_once()
+    assert mock_timer.start.call_args.args[0] == 60
+
+
+@pytest.mark.asyncio
+async def test_translate_does_not_block_event_loop(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_worker_pool: Mock,
+    mock_scheduler: Mock,
+) -> None:
+    # Given
+    mock_worker_pool.is_alive.return_value = True
+    future: Future[str] = Future()
+    mock_scheduler.submit.return_value = future
+
+    # When
+    task = asyncio.create_task(
+        translation_model_repository_impl.translate("text", "en", "fr", {}, "openai/translation"),
+    )
+    await asyncio.sleep(0)
+
+    # Then
+    assert not task.done()
+    threading.Thread(target=future.set_result, args=("translated text",)).start()
+    assert await task == "translated text"
+
+
+@pytest.mark.asyncio
+async def test_translate_starts_worker_pool_off_event_loop(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_worker_pool: Mock,
+    mock_scheduler: Mock,
+) -> None:
+    # Given
+    started = threading.Event()
+    loaded = threading.Event()
+
+    def start() -> None:
+        started.set()
+        loaded.wait(timeout=1)
+
+    mock_worker_pool.is_alive.return_value = False
+    mock_worker_pool.start.side_effect = start
+    future: Future[str] = Future()
+    future.set_result("translated text")
+    mock_scheduler.submit.return_value = future
+
+    # When
+    task = asyncio.create_task(
+        translation_model_repository_impl.translate("text", "en", "fr", {}, "openai/translation"),
+    )
+    await asyncio.to_thread(started.wait, 1)
+    await asyncio.sleep(0)
+
+    # Then
+    assert not task.done()
+    loaded.set()
+    assert await task == "translated text"
 
 
 def test_check_idle_timeout_stops_worker(
     translation_model_repository_impl: TranslationModelRepositoryImpl,
-    mock_worker: Mock,
+    mock_worker_pool: Mock,
     mock_timer: Mock,
     mock_logger: Mock,
 ) -> None:
     # Given
-    mock_worker.is_alive.return_value = True
-    mock_worker.is_processing.return_value = False
+    registry = Metrics().registry
+    evictions = (
+        registry.get_sample_value(
+            "translation_model_evictions_total",
+            {"model": "openai/translation", "reason": "idle_timeout"},
+        )
+        or 0.0
+    )
+    mock_worker_pool.alive_count.return_value = 1
+    mock_worker_pool.is_processing.return_value = False
+    mock_worker_pool.pending_count.return_value = 0
 
     # When
-    translation_model_repository_impl._check_idle_timeout()
+    translation_model_repository_impl._check_idle_timeout("openai/translation")
 
     # Then
-    mock_worker.stop.assert_called_once()
+    mock_worker_pool.stop.assert_called_once_with(0)
     mock_timer.cancel.assert_called_once()
-    mock_logger.debug.assert_any_call("Checking translation model idle timeout")
-    mock_logger.info.assert_any_call("Translation model stopped due to idle timeout")
+    assert registry.get_sample_value(
+        "translation_model_evictions_total",
+        {"model": "openai/translation", "reason": "idle_timeout"},
+    ) == (evictions + 1)
+    mock_logger.debug.assert_any_call("Checking translation model idle timeout for %s", "openai/translation")
+    mock_logger.info.assert_any_call(
+        "Translation model %s stopped due to idle timeout, keeping %d warm workers",
+        "openai/translation",
+        0,
+    )
+
+
+def test_check_idle_timeout_keeps_worker_with_queued_requests(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_worker_pool: Mock,
+    mock_scheduler: Mock,
+) -> None:
+    # Given
+    mock_worker_pool.alive_count.return_value = 1
+    mock_worker_pool.is_processing.return_value = False
+    mock_worker_pool.pending_count.return_value = 0
+    mock_scheduler.pending_count.return_value = 3
+
+    # When
+    translation_model_repository_impl._check_idle_timeout("openai/translation")
+
+    # Then
+    mock_worker_pool.stop.assert_not_called()
+
+
+def test_check_idle_timeout_rechecks_idleness_under_lock(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_worker_pool: Mock,
+    mock_scheduler: Mock,
+) -> None:
+    # Given
+    mock_worker_pool.alive_count.return_value = 1
+    mock_worker_pool.is_processing.return_value = False
+    mock_worker_pool.pending_count.return_value = 0
+    checked_under_lock = []
+
+    def pending_count() -> int:
+        checked_under_lock.append(TranslationModelRepositoryImpl._lock.locked())
+        return 0
+
+    mock_scheduler.pending_count.side_effect = pending_count
+
+    # When
+    translation_model_repository_impl._check_idle_timeout("openai/translation")
+
+    # Then
+    assert checked_under_lock == [True]
+    mock_worker_pool.stop.assert_called_once_with(0)
+
+
+@pytest.mark.asyncio
+async def test_translate_batch_success(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_worker_pool: Mock,
+    mock_timer: Mock,
+    mock_scheduler: Mock,
+) -> None:
+    # Given
+    futures: list[Future[str]] = [Future(), Future()]
+    futures[0].set_result("bonjour")
+    futures[1].set_result("hallo")
+    mock_scheduler.submit.side_effect = futures
+
+    # When
+    result = await translation_model_repository_impl.translate_batch(
+        [("hello", "en", "fr", {}), ("hello", "en", "de", {})],
+        "openai/translation",
+    )
+
+    # Then
+    assert result == ["bonjour", "hallo"]
+    assert mock_scheduler.submit.call_count == 2
+    mock_scheduler.submit.assert_any_call("hello", "en", "de", {}, {})
+    mock_worker_pool.start.assert_called()
+    mock_timer.start.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_translate_returns_translation_memory_hit_off_event_loop(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_config: Mock,
+    mock_worker_pool: Mock,
+    mock_scheduler: Mock,
+    mock_translation_memory_repository: Mock,
+) -> None:
+    # Given
+    mock_config.translation_memory_enabled = True
+    lookup_threads = []
+
+    def find(*_: object) -> str:
+        lookup_threads.append(threading.current_thread())
+        return "bonjour"
+
+    mock_translation_memory_repository.find.side_effect = find
+
+    # When
+    first = await translation_model_repository_impl.translate("hello", "en", "fr", {}, "openai/translation")
+    second = await translation_model_repository_impl.translate("hello", "en", "fr", {}, "openai/translation")
+
+    # Then
+    assert first == second == "bonjour"
+    mock_translation_memory_repository.find.assert_called_once_with("hello", "en", "fr", {}, "openai/translation")
+    assert threading.main_thread() not in lookup_threads
+    mock_worker_pool.start.assert_not_called()
+    mock_scheduler.submit.assert_not_called()
+    mock_translation_memory_repository.save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_translate_saves_generated_translation_to_memory(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_config: Mock,
+    mock_scheduler: Mock,
+    mock_translation_memory_repository: Mock,
+) -> None:
+    # Given
+    mock_config.translation_memory_enabled = True
+    future: Future[str] = Future()
+    future.set_result("bonjour")
+    mock_scheduler.submit.return_value = future
+
+    # When
+    result = await translation_model_repository_impl.translate("hello", "en", "fr", {}, "openai/translation")
+
+    # Then
+    assert result == "bonjour"
+    mock_translation_memory_repository.find.assert_called_once_with("hello", "en", "fr", {}, "openai/translation")
+    mock_translation_memory_repository.save.assert_called_once_with(
+        "hello",
+        "en",
+        "fr",
+        {},
+        "bonjour",
+        "openai/translation",
+    )
+
+
+@pytest.mark.asyncio
+async def test_translate_skips_disabled_translation_memory(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_scheduler: Mock,
+    mock_translation_memory_repository: Mock,
+) -> None:
+    # Given
+    future: Future[str] = Future()
+    future.set_result("bonjour")
+    mock_scheduler.submit.return_value = future
+
+    # When
+    await translation_model_repository_impl.translate("hello", "en", "fr", {}, "openai/translation")
+
+    # Then
+    mock_translation_memory_repository.find.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_translate_returns_cached_translation(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_scheduler: Mock,
+) -> None:
+    # Given
+    registry = Metrics().registry
+    hits = registry.get_sample_value("translation_cache_requests_total", {"cache": "result", "result": "hit"}) or 0.0
+    future: Future[str] = Future()
+    future.set_result("bonjour")
+    mock_scheduler.submit.return_value = future
+    await translation_model_repository_impl.translate(
+        "hello",
+        "en",
+        "fr",
+        {"num_beams": 2, "max_length": 10},
+        "openai/translation",
+    )
+
+    # When
+    result = await translation_model_repository_impl.translate(
+        "hello\u0020 ",
+        "en",
+        "fr",
+        {"max_length": 10, "num_beams": 2},
+        "openai/translation",
+    )
+
+    # Then
+    assert result == "bonjour"
+    mock_scheduler.submit.assert_called_once()
+    assert translation_model_repository_impl.cache is not None
+    assert translation_model_repository_impl.cache.hits == 1
+    assert translation_model_repository_impl.cache.misses == 1
+    assert registry.get_sample_value("translation_cache_requests_total", {"cache": "result", "result": "hit"}) == (
+        hits + 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_translate_skips_cache_when_sampling(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_scheduler: Mock,
+) -> None:
+    # Given
+    futures: list[Future[str]] = [Future(), Future()]
+    futures[0].set_result("bonjour")
+    futures[1].set_result("salut")
+    mock_scheduler.submit.side_effect = futures
+
+    # When
+    first = await translation_model_repository_impl.translate(
+        "hello",
+        "en",
+        "fr",
+        {"do_sample": True},
+        "openai/translation",
+    )
+    second = await translation_model_repository_impl.translate(
+        "hello",
+        "en",
+        "fr",
+        {"do_sample": True},
+        "openai/translation",
+    )
+
+    # Then
+    assert (first, second) == ("bonjour", "salut")
+    assert mock_scheduler.submit.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_translate_without_cache(
+    mock_config: Mock,
+    mock_directory_repository: Mock,
+    mock_timer_factory: Mock,
+    mock_logger: Mock,
+    mock_worker_factory: Mock,
+    mock_scheduler_factory: Mock,
+    mock_scheduler: Mock,
+    mock_translation_memory_repository: Mock,
+) -> None:
+    # Given
+    mock_config.translation_cache_enabled = False
+    cache_factory = Mock(spec=LruTtlCacheFactory)
+    future: Future[str] = Future()
+    future.set_result("bonjour")
+    mock_scheduler.submit.return_value = future
+
+    with patch.object(TranslationModelRepositoryImpl, "_instance", None):
+        repository = TranslationModelRepositoryImpl(
+            config=mock_config,
+            directory_repository=mock_directory_repository,
+            timer_factory=mock_timer_factory,
+            logger=mock_logger,
+            worker_factory=mock_worker_factory,
+            scheduler_factory=mock_scheduler_factory,
+            cache_factory=cache_factory,
+            metrics=Metrics(),
+            translation_memory_repository=mock_translation_memory_repository,
+        )
+
+    # When
+    result = await repository.translate("hello", "en", "fr", {}, "openai/translation")
+
+    # Then
+    assert result == "bonjour"
+    assert repository.cache is None
+    cache_factory.create.assert_not_called()
+
+
+async def wait_for_waiters(repository: TranslationModelRepositoryImpl, waiters: int) -> None:
+    async def poll() -> None:
+        while sum(shared[1] for shared in repository._in_flight.values()) < waiters:
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(poll(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_translate_coalesces_identical_in_flight_requests(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_scheduler: Mock,
+) -> None:
+    # Given
+    future: Future[str] = Future()
+    mock_scheduler.submit.return_value = future
+    first = asyncio.create_task(
+        translation_model_repository_impl.translate("hello", "en", "fr", {}, "openai/translation"),
+    )
+    second = asyncio.create_task(
+        translation_model_repository_impl.translate("hello", "en", "fr", {}, "openai/translation"),
+    )
+    await wait_for_waiters(translation_model_repository_impl, 2)
+
+    # When
+    future.set_result("bonjour")
+
+    # Then
+    assert list(await asyncio.gather(first, second)) == ["bonjour", "bonjour"]
+    mock_scheduler.submit.assert_called_once_with("hello", "en", "fr", {}, {})
+    assert translation_model_repository_impl._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_translate_keeps_shared_generation_when_one_waiter_is_cancelled(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_scheduler: Mock,
+) -> None:
+    # Given
+    future: Future[str] = Future()
+    mock_scheduler.submit.return_value = future
+    first = asyncio.create_task(
+        translation_model_repository_impl.translate("hello", "en", "fr", {}, "openai/translation"),
+    )
+    second = asyncio.create_task(
+        translation_model_repository_impl.translate("hello", "en", "fr", {}, "openai/translation"),
+    )
+    await wait_for_waiters(translation_model_repository_impl, 2)
+
+    # When
+    first.cancel()
+    await asyncio.sleep(0)
+
+    # Then
+    assert not future.cancelled()
+    future.set_result("bonjour")
+    assert await second == "bonjour"
+
+
+@pytest.mark.asyncio
+async def test_translate_cancels_shared_generation_when_all_waiters_are_cancelled(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_scheduler: Mock,
+) -> None:
+    # Given
+    future: Future[str] = Future()
+    mock_scheduler.submit.return_value = future
+    task = asyncio.create_task(
+        translation_model_repository_impl.translate("hello", "en", "fr", {}, "openai/translation"),
+    )
+    await wait_for_waiters(translation_model_repository_impl, 1)
+
+    # When
+    task.cancel()
+    await asyncio.sleep(0)
+
+    # Then
+    assert future.cancelled()
+    assert translation_model_repository_impl._in_flight == {}
+
+
+@pytest.mark.parametrize(
+    ("model_preload", "model_min_warm_workers", "alive_count", "expected_keep_warm"),
+    [(False, 1, 2, 1), (True, 0, 2, 1), (True, 2, 3, 2)],
+)
+def test_check_idle_timeout_keeps_warm_workers(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_config: Mock,
+    mock_worker_pool: Mock,
+    model_preload: bool,
+    model_min_warm_workers: int,
+    alive_count: int,
+    expected_keep_warm: int,
+) -> None:
+    # Given
+    mock_config.model_preload = model_preload
+    mock_config.model_min_warm_workers = model_min_warm_workers
+    mock_worker_pool.alive_count.return_value = alive_count
+    mock_worker_pool.is_processing.return_value = False
+    mock_worker_pool.pending_count.return_value = 0
+
+    # When
+    translation_model_repository_impl._check_idle_timeout("openai/translation")
+
+    # Then
+    mock_worker_pool.stop.assert_called_once_with(expected_keep_warm)
+
+
+def test_check_idle_timeout_skips_when_only_warm_workers_remain(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_config: Mock,
+    mock_worker_pool: Mock,
+) -> None:
+    # Given
+    mock_config.model_min_warm_workers = 1
+    mock_worker_pool.alive_count.return_value = 1
+
+    # When
+    translation_model_repository_impl._check_idle_timeout("openai/translation")
+
+    # Then
+    mock_worker_pool.stop.assert_not_called()
+
+
+def test_preload_starts_workers_and_idle_timer(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_worker_pool: Mock,
+    mock_scheduler: Mock,
+    mock_timer: Mock,
+) -> None:
+    # When
+    translation_model_repository_impl.preload("openai/translation")
+
+    # Then
+    mock_worker_pool.start.assert_called_once()
+    mock_scheduler.start.assert_called_once()
+    mock_timer.start.assert_called_once()
+    assert mock_timer.start.call_args.args[0] == 60
+
+
+def test_get_status_reports_workers_and_scheduler(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_worker_pool: Mock,
+    mock_scheduler: Mock,
+) -> None:
+    # Given
+    mock_worker_pool.is_alive.return_value = True
+    mock_worker_pool.is_ready.return_value = True
+    mock_worker_pool.pids.return_value = [1234, None]
+    mock_scheduler.queue_depth.return_value = 3
+    mock_scheduler.in_flight_count.return_value = 8
+    mock_scheduler.last_batch_latency_ms = 250.0
+
+    # When
+    status = translation_model_repository_impl.get_status()
+
+    # Then
+    assert status == TranslationModelStatus(
+        alive=True,
+        model_loaded=True,
+        worker_pids=[1234],
+        queue_depth=3,
+        in_flight=8,
+        last_inference_latency_ms=250.0,
+        loaded_models=["openai/translation"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_translate_records_request_timings_for_all_waiters(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_scheduler: Mock,
+) -> None:
+    # Given
+    future: Future[str] = Future()
+
+    def submit(*args: Any) -> Future[str]:
+        args[4].update({"queue": 0.1, "generate": 0.25})
+        return future
+
+    async def translate_with_timings() -> RequestTimings:
+        timings = RequestTimings.begin()
+        await translation_model_repository_impl.translate("hello", "en", "fr", {}, "openai/translation")
+        return timings
+
+    mock_scheduler.submit.side_effect = submit
+
+    # When
+    first = asyncio.ensure_future(translate_with_timings())
+    second = asyncio.ensure_future(translate_with_timings())
+    await wait_for_waiters(translation_model_repository_impl, 2)
+    future.set_result("bonjour")
+    timings = await asyncio.gather(first, second)
+
+    # Then
+    mock_scheduler.submit.assert_called_once()
+    for request_timings in timings:
+        assert request_timings.stage_seconds["queue"] == 0.1
+        assert request_timings.stage_seconds["generate"] == 0.25
+        assert "cache_lookup" in request_timings.stage_seconds
+        assert "worker_start" in request_timings.stage_seconds
+
+
+@pytest.fixture
+def multi_model_repository(
+    mock_config: Mock,
+    mock_directory_repository: Mock,
+    mock_timer_factory: Mock,
+    mock_logger: Mock,
+    mock_worker_factory: Mock,
+    mock_scheduler_factory: Mock,
+    cache_factory: LruTtlCacheFactory,
+    mock_translation_memory_repository: Mock,
+) -> TranslationModelRepositoryImpl:
+    mock_config.translation_model_names = ["openai/translation", "other/translation"]
+    mock_config.max_loaded_models = 1
+    mock_worker_factory.create_pool.side_effect = lambda model_name: Mock(
+        name=model_name,
+        **{"rss_bytes.return_value": 0},
+    )
+    mock_scheduler_factory.create.side_effect = lambda worker_pool, model_name: Mock(
+        name=model_name,
+        **{"pending_count.return_value": 0},
+    )
+    mock_timer_factory.create.side_effect = lambda: Mock(spec=Timer)
+
+    with patch.object(TranslationModelRepositoryImpl, "_instance", None):
+        return TranslationModelRepositoryImpl(
+            config=mock_config,
+            directory_repository=mock_directory_repository,
+            timer_factory=mock_timer_factory,
+            logger=mock_logger,
+            worker_factory=mock_worker_factory,
+            scheduler_factory=mock_scheduler_factory,
+            cache_factory=cache_factory,
+            metrics=Metrics(),
+            translation_memory_repository=mock_translation_memory_repository,
+        )
+
+
+@pytest.mark.asyncio
+async def test_translate_routes_to_requested_model(multi_model_repository: TranslationModelRepositoryImpl) -> None:
+    # Given
+    for name, model in multi_model_repository.models.items():
+        future: Future[str] = Future()
+        future.set_result(f"bonjour from {name}")
+        model.scheduler.submit.return_value = future
+        model.worker_pool.is_alive.return_value = True
+
+    # When
+    default = await multi_model_repository.translate("hello", "en", "fr", {}, "openai/translation")
+    other = await multi_model_repository.translate("hello", "en", "fr", {}, "other/translation")
+
+    # Then
+    assert default == "bonjour from openai/translation"
+    assert other == "bonjour from other/translation"
+    multi_model_repository.models["other/translation"].scheduler.submit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_translate_unsupported_model(multi_model_repository: TranslationModelRepositoryImpl) -> None:
+    # When / Then
+    with pytest.raises(UnsupportedModelConfigurationError, match="Unsupported model name: unknown/model"):
+        await multi_model_repository.translate("hello", "en", "fr", {}, "unknown/model")
+
+
+def test_preload_unloads_least_recently_used_idle_model(multi_model_repository: TranslationModelRepositoryImpl) -> None:
+    # Given
+    default = multi_model_repository.models["openai/translation"]
+    other = multi_model_repository.models["other/translation"]
+    default.worker_pool.is_alive.return_value = True
+    default.worker_pool.is_processing.return_value = False
+    default.worker_pool.pending_count.return_value = 0
+    default.scheduler.pending_count.return_value = 0
+    other.worker_pool.is_alive.return_value = False
+
+    # When
+    multi_model_repository.preload("other/translation")
+
+    # Then
+    default.worker_pool.stop.assert_called_once_with(0)
+    default.timer.cancel.assert_called_once()
+    other.worker_pool.start.assert_called_once()
+
+
+def test_preload_keeps_busy_model_loaded(
+    multi_model_repository: TranslationModelRepositoryImpl,
+    mock_logger: Mock,
+) -> None:
+    # Given
+    default = multi_model_repository.models["openai/translation"]
+    other = multi_model_repository.models["other/translation"]
+    default.worker_pool.is_alive.return_value = True
+    default.worker_pool.is_processing.return_value = True
+    other.worker_pool.is_alive.return_value = False
+
+    # When
+    multi_model_repository.preload("other/translation")
+
+    # Then
+    default.worker_pool.stop.assert_not_called()
+    other.worker_pool.start.assert_called_once()
+    mock_logger.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_translate_unloads_least_recently_used_model_off_event_loop(
+    multi_model_repository: TranslationModelRepositoryImpl,
+) -> None:
+    # Given
+    default = multi_model_repository.models["openai/translation"]
+    other = multi_model_repository.models["other/translation"]
+    default.worker_pool.is_alive.return_value = True
+    default.worker_pool.is_processing.return_value = False
+    default.worker_pool.pending_count.return_value = 0
+    other.worker_pool.is_alive.return_value = False
+    future: Future[str] = Future()
+    future.set_result("bonjour")
+    other.scheduler.submit.return_value = future
+    stop_threads = []
+    default.worker_pool.stop.side_effect = lambda _: stop_threads.append(threading.current_thread())
+
+    # When
+    await multi_model_repository.translate("hello", "en", "fr", {}, "other/translation")
+
+    # Then
+    assert stop_threads
+    assert threading.main_thread() not in stop_threads
+    other.worker_pool.start.assert_called_once()
+
+
+def test_check_idle_timeout_keeps_warm_workers_only_for_default_model(
+    multi_model_repository: TranslationModelRepositoryImpl,
+    mock_config: Mock,
+) -> None:
+    # Given
+    mock_config.model_preload = True
+    other = multi_model_repository.models["other/translation"]
+    other.worker_pool.alive_count.return_value = 1
+    other.worker_pool.is_processing.return_value = False
+    other.worker_pool.pending_count.return_value = 0
+    other.scheduler.pending_count.return_value = 0
+
+    # When
+    multi_model_repository._check_idle_timeout("other/translation")
+
+    # Then
+    other.worker_pool.stop.assert_called_once_with(0)
+
+
+def given_loaded_idle_models(repository: TranslationModelRepositoryImpl, memory_mb: int) -> None:
+    for model in repository.models.values():
+        model.worker_pool.is_alive.return_value = True
+        model.worker_pool.is_processing.return_value = False
+        model.worker_pool.pending_count.return_value = 0
+        model.worker_pool.rss_bytes.return_value = memory_mb * 1024 * 1024
+        model.scheduler.pending_count.return_value = 0
+
+
+@pytest.fixture
+def budget_repository(
+    multi_model_repository: TranslationModelRepositoryImpl,
+    mock_config: Mock,
+) -> TranslationModelRepositoryImpl:
+    mock_config.max_loaded_models = 0
+    mock_config.model_memory_budget_mb = 1000
+    multi_model_repository.models["third/translation"] = HostedTranslationModel(
+        worker_pool=Mock(name="third/translation"),
+        scheduler=Mock(name="third/translation", **{"pending_count.return_value": 0}),
+        timer=Mock(spec=Timer),
+    )
+    given_loaded_idle_models(multi_model_repository, 400)
+    return multi_model_repository
+
+
+def test_check_idle_timeout_keeps_models_within_memory_budget(
+    budget_repository: TranslationModelRepositoryImpl,
+) -> None:
+    # Given
+    budget_repository.models["third/translation"].worker_pool.is_alive.return_value = False
+    registry = Metrics().registry
+
+    # When
+    budget_repository._check_idle_timeout("other/translation")
+
+    # Then
+    for model in budget_repository.models.values():
+        model.worker_pool.stop.assert_not_called()
+    assert registry.get_sample_value("translation_model_memory_bytes", {"model": "other/translation"}) == (
+        400 * 1024 * 1024
+    )
+
+
+def test_check_idle_timeout_counts_shared_model_memory_once(
+    budget_repository: TranslationModelRepositoryImpl,
+    mock_logger: Mock,
+) -> None:
+    # Given
+    workers = [
+        Mock(
+            **{
+                "is_alive.return_value": True,
+                "is_processing.return_value": False,
+                "pending_count.return_value": 0,
+                "rss_bytes.return_value": 200 * 1024 * 1024,
+                "uss_bytes.return_value": 20 * 1024 * 1024,
+            },
+        )
+        for _ in range(3)
+    ]
+    workers[0].shared_object_bytes.return_value = 100 * 1024 * 1024
+    worker_pool = TranslationWorkerPool(workers, logger=mock_logger, metrics=Mock(), shared_memory=True)
+    worker_pool.start()
+    budget_repository.models["third/translation"].worker_pool = worker_pool
+    registry = Metrics().registry
+
+    # When
+    budget_repository._check_idle_timeout("openai/translation")
+
+    # Then
+    for model in budget_repository.models.values():
+        if model.worker_pool is not worker_pool:
+            model.worker_pool.stop.assert_not_called()
+    for worker in workers:
+        worker.stop.assert_not_called()
+    assert registry.get_sample_value("translation_model_memory_bytes", {"model": "third/translation"}) == (
+        160 * 1024 * 1024
+    )
+
+
+def test_check_idle_timeout_evicts_least_recently_used_model_over_memory_budget(
+    budget_repository: TranslationModelRepositoryImpl,
+    mock_logger: Mock,
+) -> None:
+    # Given
+    registry = Metrics().registry
+    evictions = (
+        registry.get_sample_value(
+            "translation_model_evictions_total",
+            {"model": "other/translation", "reason": "memory_budget"},
+        )
+        or 0.0
+    )
+    budget_repository.models["openai/translation"].last_access_time = 3.0
+    budget_repository.models["other/translation"].last_access_time = 1.0
+    budget_repository.models["third/translation"].last_access_time = 2.0
+
+    # When
+    budget_repository._check_idle_timeout("openai/translation")
+
+    # Then
+    budget_repository.models["other/translation"].worker_pool.stop.assert_called_once_with(0)
+    budget_repository.models["other/translation"].timer.cancel.assert_called_once()
+    budget_repository.models["openai/translation"].worker_pool.stop.assert_not_called()
+    budget_repository.models["third/translation"].worker_pool.stop.assert_not_called()
+    assert registry.get_sample_value(
+        "translation_model_evictions_total",
+        {"model": "other/translation", "reason": "memory_budget"},
+    ) == (evictions + 1)
+    mock_logger.info.assert_any_call(
+        "Translation model %s unloaded to stay within MODEL_MEMORY_BUDGET_MB",
+        "other/translation",
+    )
+
+
+def test_check_idle_timeout_evicts_least_frequently_used_model_over_memory_budget(
+    budget_repository: TranslationModelRepositoryImpl,
+    mock_config: Mock,
+) -> None:
+    # Given
+    mock_config.model_eviction_policy = "lfu"
+    for name, last_access_time, request_count in [
+        ("openai/translation", 3.0, 10),
+        ("other/translation", 1.0, 5),
+        ("third/translation", 2.0, 1),
+    ]:
+        budget_repository.models[name].last_access_time = last_access_time
+        budget_repository.models[name].request_count = request_count
+
+    # When
+    budget_repository._check_idle_timeout("openai/translation")
+
+    # Then
+    budget_repository.models["third/translation"].worker_pool.stop.assert_called_once_with(0)
+    budget_repository.models["other/translation"].worker_pool.stop.assert_not_called()
+
+
+def test_preload_evicts_models_to_fit_previous_memory_usage(budget_repository: TranslationModelRepositoryImpl) -> None:
+    # Given
+    third = budget_repository.models["third/translation"]
+    third.worker_pool.is_alive.return_value = False
+    third.rss_bytes = 400 * 1024 * 1024
+    budget_repository.models["openai/translation"].last_access_time = 1.0
+    budget_repository.models["other/translation"].last_access_time = 2.0
+
+    # When
+    budget_repository.preload("third/translation")
+
+    # Then
+    budget_repository.models["openai/translation"].worker_pool.stop.assert_called_once_with(0)
+    budget_repository.models["other/translation"].worker_pool.stop.assert_not_called()
+    third.worker_pool.start.assert_called_once()
+    assert third.request_count == 1
+
+
+@pytest.mark.asyncio
+async def test_translate_enforces_memory_budget_off_event_loop(
+    budget_repository: TranslationModelRepositoryImpl,
+) -> None:
+    # Given
+    third = budget_repository.models["third/translation"]
+    third.worker_pool.is_alive.return_value = False
+    third.rss_bytes = 400 * 1024 * 1024
+    future: Future[str] = Future()
+    future.set_result("bonjour")
+    third.scheduler.submit.return_value = future
+    budget_repository.models["openai/translation"].last_access_time = 1.0
+    budget_repository.models["other/translation"].last_access_time = 2.0
+    threads = []
+
+    def record_thread(rss_bytes: int) -> Mock:
+        def measure() -> int:
+            threads.append(threading.current_thread())
+            return rss_bytes
+
+        return Mock(side_effect=measure)
+
+    for model in budget_repository.models.values():
+        model.worker_pool.rss_bytes = record_thread(model.worker_pool.rss_bytes.return_value)
+
+    # When
+    await budget_repository.translate("hello", "en", "fr", {}, "third/translation")
+
+    # Then
+    budget_repository.models["openai/translation"].worker_pool.stop.assert_called_once_with(0)
+    assert threads
+    assert threading.main_thread() not in threads
+
+
+def test_check_idle_timeout_warns_when_no_model_can_be_evicted(
+    budget_repository: TranslationModelRepositoryImpl,
+    mock_logger: Mock,
+) -> None:
+    # Given
+    for model in budget_repository.models.values():
+        model.worker_pool.is_processing.return_value = True
+
+    # When
+    budget_repository._check_idle_timeout("openai/translation")
+
+    # Then
+    for model in budget_repository.models.values():
+        model.worker_pool.stop.assert_not_called()
+    mock_logger.warning.assert_called_once()
@@ -0,0 +1,322 @@
+from concurrent.futures import Future
+from typing import Any, Dict, Generator, List
+from unittest.mock import Mock
+
+import pytest
+
+from core.logger.logger import Logger
+from core.metrics.metrics import Metrics
+from data.schedulers.translation_batch_scheduler import TranslationBatchScheduler
+from data.workers.base_translation_worker import (
+    TranslationBatchOutput,
+    TranslationGroupStats,
+)
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+def completed_future(results: List[Any]) -> "Future[Any]":
+    future: "Future[Any]" = Future()
+    future.set_result(TranslationBatchOutput(results, [], 0.0))
+    return future
+
+
+@pytest.fixture
+def mock_worker_pool() -> Mock:
+    worker = Mock()
+    worker.translate_batch.side_effect = lambda requests: completed_future(
+        [request[0].upper() for request in requests],
+    )
+    return worker
+
+
+@pytest.fixture
+def scheduler(mock_worker_pool: Mock, mock_logger: Logger) -> Generator[TranslationBatchScheduler, None, None]:
+    scheduler = TranslationBatchScheduler(
+        mock_worker_pool,
+        max_batch_size=2,
+        max_wait_ms=50,
+        max_in_flight_batches=1,
+        logger=mock_logger,
+        metrics=Metrics(),
+        model_name="test-model",
+    )
+    yield scheduler
+    scheduler.stop()
+
+
+def test_submit_queues_request(scheduler: TranslationBatchScheduler) -> None:
+    # When
+    future = scheduler.submit("hello", "en", "fr", {})
+
+    # Then
+    assert not future.done()
+    assert scheduler.queue_depth() == 1
+
+
+def test_collect_batch_respects_max_batch_size(scheduler: TranslationBatchScheduler) -> None:
+    # Given
+    for text in ["a", "b", "c"]:
+        scheduler.submit(text, "en", "fr", {})
+
+    # When
+    batch = scheduler._collect_batch()
+
+    # Then
+    assert [scheduled.request[0] for scheduled in batch] == ["a", "b"]
+    assert scheduler.queue_depth() == 1
+
+
+def test_pending_count_includes_collected_requests_until_dispatched(
+    scheduler: TranslationBatchScheduler,
+    mock_worker_pool: Mock,
+) -> None:
+    # Given
+    for text in ["a", "b"]:
+        scheduler.submit(text, "en", "fr", {})
+
+    # When
+    batch = scheduler._collect_batch()
+
+    # Then
+    assert scheduler.queue_depth() == 0
+    assert scheduler.pending_count() == 2
+
+    # When
+    scheduler._dispatch_slots.acquire()
+    scheduler._dispatch(batch)
+
+    # Then
+    assert scheduler.pending_count() == 0
+
+
+def test_pending_count_releases_requests_when_dispatch_fails(
+    scheduler: TranslationBatchScheduler,
+    mock_worker_pool: Mock,
+) -> None:
+    # Given
+    mock_worker_pool.translate_batch.side_effect = RuntimeError("Worker process is not running")
+    scheduler.submit("a", "en", "fr", {})
+
+    # When
+    scheduler._dispatch_slots.acquire()
+    scheduler._dispatch(scheduler._collect_batch())
+
+    # Then
+    assert scheduler.pending_count() == 0
+
+
+def test_start_skips_cancelled_requests(scheduler: TranslationBatchScheduler, mock_worker_pool: Mock) -> None:
+    # Given
+    cancelled = scheduler.submit("a", "en", "fr", {})
+    active = scheduler.submit("b", "en", "fr", {})
+    cancelled.cancel()
+
+    # When
+    scheduler.start()
+
+    # Then
+    assert active.result(timeout=5) == "B"
+    mock_worker_pool.translate_batch.assert_called_once_with([("b", "en", "fr", {})])
+    assert scheduler.pending_count() == 0
+
+
+def test_start_does_not_dispatch_batch_of_cancelled_requests(
+    scheduler: TranslationBatchScheduler,
+    mock_worker_pool: Mock,
+) -> None:
+    # Given
+    for text in ["a", "b"]:
+        scheduler.submit(text, "en", "fr", {}).cancel()
+
+    # When
+    scheduler.start()
+    completed = scheduler.submit("c", "en", "fr", {}).result(timeout=5)
+
+    # Then
+    assert completed == "C"
+    mock_worker_pool.translate_batch.assert_called_once_with([("c", "en", "fr", {})])
+    assert scheduler.pending_count() == 0
+
+
+def test_dispatch_fans_out_results(scheduler: TranslationBatchScheduler, mock_worker_pool: Mock) -> None:
+    # Given
+    error = RuntimeError("Translation error")
+    mock_worker_pool.translate_batch.side_effect = None
+    mock_worker_pool.translate_batch.return_value = completed_future(["A", error])
+    first = scheduler.submit("a", "en", "fr", {})
+    second = scheduler.submit("b", "en", "de", {})
+
+    # When
+    scheduler._dispatch_slots.acquire()
+    scheduler._dispatch(scheduler._collect_batch())
+
+    # Then
+    mock_worker_pool.translate_batch.assert_called_once_with([("a", "en", "fr", {}), ("b", "en", "de", {})])
+    assert first.result() == "A"
+    assert second.exception() is error
+
+
+def test_dispatch_propagates_worker_failure(scheduler: TranslationBatchScheduler, mock_worker_pool: Mock) -> None:
+    # Given
+    mock_worker_pool.translate_batch.side_effect = RuntimeError("Worker process is not running")
+    future = scheduler.submit("a", "en", "fr", {})
+
+    # When
+    scheduler._dispatch_slots.acquire()
+    scheduler._dispatch(scheduler._collect_batch())
+
+    # Then
+    with pytest.raises(RuntimeError, match="Worker process is not running"):
+        future.result()
+
+
+def test_start_processes_submitted_requests(scheduler: TranslationBatchScheduler, mock_worker_pool: Mock) -> None:
+    # Given
+    scheduler.start()
+
+    # When
+    futures = [scheduler.submit(text, "en", "fr", {}) for text in ["a", "b", "c"]]
+
+    # Then
+    assert [future.result(timeout=5) for future in futures] == ["A", "B", "C"]
+    assert all(len(call.args[0]) <= 2 for call in mock_worker_pool.translate_batch.call_args_list)
+
+
+def test_dispatch_does_not_wait_for_batch_completion(
+    scheduler: TranslationBatchScheduler,
+    mock_worker_pool: Mock,
+) -> None:
+    # Given
+    batch_future: "Future[List[Any]]" = Future()
+    mock_worker_pool.translate_batch.side_effect = None
+    mock_worker_pool.translate_batch.return_value = batch_future
+    future = scheduler.submit("a", "en", "fr", {})
+
+    # When
+    scheduler._dispatch_slots.acquire()
+    scheduler._dispatch(scheduler._collect_batch())
+
+    # Then
+    assert not future.done()
+    assert not scheduler._dispatch_slots.acquire(blocking=False)
+    batch_future.set_result(TranslationBatchOutput(["A"], [], 0.0))
+    assert future.result() == "A"
+    assert scheduler._dispatch_slots.acquire(blocking=False)
+
+
+def test_complete_skips_cancelled_requests(scheduler: TranslationBatchScheduler) -> None:
+    # Given
+    cancelled = scheduler.submit("a", "en", "fr", {})
+    pending = scheduler.submit("b", "en", "fr", {})
+    cancelled.cancel()
+    batch = scheduler._collect_batch()
+    scheduler._dispatch_slots.acquire()
+
+    # When
+    scheduler._complete(batch, completed_future(["A", "B"]), 0.0)
+
+    # Then
+    assert cancelled.cancelled()
+    assert pending.result() == "B"
+
+
+def test_dispatch_tracks_in_flight_requests_and_latency(
+    scheduler: TranslationBatchScheduler,
+    mock_worker_pool: Mock,
+) -> None:
+    # Given
+    batch_future: Future[List[Any]] = Future()
+    mock_worker_pool.translate_batch.side_effect = None
+    mock_worker_pool.translate_batch.return_value = batch_future
+    scheduler.submit("a", "en", "fr", {})
+    scheduler.submit("b", "en", "fr", {})
+    scheduler._dispatch_slots.acquire()
+
+    # When
+    scheduler._dispatch(scheduler._collect_batch())
+
+    # Then
+    assert scheduler.in_flight_count() == 2
+    assert scheduler.last_batch_latency_ms is None
+
+    # When
+    batch_future.set_result(TranslationBatchOutput(["A", "B"], [], 0.0))
+
+    # Then
+    assert scheduler.in_flight_count() == 0
+    assert scheduler.last_batch_latency_ms is not None
+
+
+def test_complete_records_worker_metrics(scheduler: TranslationBatchScheduler) -> None:
+    # Given
+    registry = Metrics().registry
+    labels = {"model": "test-model", "source_language": "en", "target_language": "pl"}
+    stage_labels = {**labels, "stage": "generate"}
+    generate_count = registry.get_sample_value("translation_stage_seconds_count", stage_labels) or 0.0
+    input_tokens = registry.get_sample_value("translation_tokens_total", {**labels, "direction": "input"}) or 0.0
+    ipc_count = registry.get_sample_value("translation_ipc_round_trip_seconds_count", {"model": "test-model"}) or 0.0
+    scheduler.submit("a", "en", "pl", {})
+    batch = scheduler._collect_batch()
+    scheduler._dispatch_slots.acquire()
+    stats = TranslationGroupStats("en", "pl", [0], {"generate": 0.5}, input_tokens=3, output_tokens=4)
+
+    batch_future: "Future[Any]" = Future()
+    batch_future.set_result(TranslationBatchOutput(["A"], [stats], 0.5))
+
+    # When
+    scheduler._complete(batch, batch_future, 0.0)
+
+    # Then
+    assert registry.get_sample_value("translation_stage_seconds_count", stage_labels) == generate_count + 1
+    assert registry.get_sample_value("translation_tokens_total", {**labels, "direction": "input"}) == input_tokens + 3
+    assert (
+        registry.get_sample_value("translation_ipc_round_trip_seconds_count", {"model": "test-model"}) == ipc_count + 1
+    )
+
+
+def test_dispatch_records_queue_wait_and_batch_size(scheduler: TranslationBatchScheduler) -> None:
+    # Given
+    registry = Metrics().registry
+    labels = {"model": "test-model", "source_language": "en", "target_language": "de"}
+    queue_wait_count = registry.get_sample_value("translation_queue_wait_seconds_count", labels) or 0.0
+    batch_size_sum = registry.get_sample_value("translation_batch_size_sum", {"model": "test-model"}) or 0.0
+    scheduler.submit("a", "en", "de", {})
+    scheduler.submit("b", "en", "de", {})
+    scheduler._dispatch_slots.acquire()
+
+    # When
+    scheduler._dispatch(scheduler._collect_batch())
+
+    # Then
+    assert registry.get_sample_value("translation_queue_wait_seconds_count", labels) == queue_wait_count + 2
+    assert registry.get_sample_value("translation_batch_size_sum", {"model": "test-model"}) == batch_size_sum + 2
+
+
+def test_complete_attributes_stage_seconds_to_requests(scheduler: TranslationBatchScheduler) -> None:
+    # Given
+    first_stages: Dict[str, float] = {}
+    second_stages: Dict[str, float] = {}
+    scheduler.submit("a", "en", "fr", {}, first_stages)
+    scheduler.submit("b", "en", "de", {}, second_stages)
+    batch = scheduler._collect_batch()
+    scheduler._dispatch_slots.acquire()
+    batch_future: "Future[Any]" = Future()
+    batch_future.set_result(
+        TranslationBatchOutput(
+            ["A", "B"],
+            [TranslationGroupStats("en", "fr", [0], {"generate": 0.5}), TranslationGroupStats("en", "de", [1], {})],
+            0.5,
+        ),
+    )
+
+    # When
+    scheduler._complete(batch, batch_future, 0.0)
+
+    # Then
+    assert first_stages["generate"] == 0.5
+    assert "generate" not in second_stages
+    assert "ipc" in first_stages and "ipc" in second_stages
@@ -0,0 +1,492 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+import pytest
+import torch
+from transformers import MBartConfig, MBartForConditionalGeneration
+
+from core.logger.logger import Logger
+from data.workers.base_translation_worker import (
+    BaseTranslationWorker,
+    TranslationGroupStats,
+    TranslationRequest,
+    TranslationResult,
+)
+
+
+class MockTranslationWorker(BaseTranslationWorker[str, None]):  # type: ignore
+    def __init__(self, config: str, logger: Logger) -> None:
+        super().__init__(config, logger)
+        self.generate_mock = Mock(side_effect=lambda texts, *args: [text.upper() for text in texts])
+        self.max_input_tokens = 0
+
+    def initialize_shared_object(
+        self,
+        config: str,
+    ) -> None:
+        return None
+
+    def count_tokens(
+        self,
+        texts: List[str],
+        shared_object: None,
+    ) -> List[int]:
+        return [len(text.split()) for text in texts]
+
+    def get_max_input_tokens(
+        self,
+        config: str,
+    ) -> int:
+        return self.max_input_tokens
+
+    def generate(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        generation_parameters: Dict[str, Any],
+        shared_object: None,
+        config: str,
+    ) -> List[str]:
+        with self.measure_stage("generate"):
+            result: List[str] = self.generate_mock(texts, source_language, target_language, generation_parameters)
+
+        return result
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def worker(mock_logger: Logger) -> MockTranslationWorker:
+    return MockTranslationWorker("cpu", mock_logger)
+
+
+def test_translate_batch_sends_command(worker: MockTranslationWorker) -> None:
+    # Given
+    future: Future[List[TranslationResult]] = Future()
+    worker.send_command = Mock(return_value=future)
+    requests: List[TranslationRequest] = [("hello", "en", "fr", {})]
+
+    # When
+    result = worker.translate_batch(requests)
+
+    # Then
+    assert result is future
+    worker.send_command.assert_called_once_with("translate_batch", requests)
+
+
+def test_translate_batch_raises_error_if_worker_not_running(worker: MockTranslationWorker) -> None:
+    # When / Then
+    with pytest.raises(RuntimeError, match="Worker process is not running"):
+        worker.translate_batch([("hello", "en", "fr", {})])
+
+
+def test_group_requests_by_language_pair_and_parameters() -> None:
+    # Given
+    requests: List[TranslationRequest] = [
+        ("a", "en", "fr", {"num_beams": 2}),
+        ("b", "en", "de", {}),
+        ("c", "en", "fr", {"num_beams": 2}),
+        ("d", "en", "fr", {}),
+    ]
+
+    # When
+    groups = BaseTranslationWorker.group_requests(requests)
+
+    # Then
+    assert groups == [
+        ([0, 2], "en", "fr", {"num_beams": 2}),
+        ([1], "en", "de", {}),
+        ([3], "en", "fr", {}),
+    ]
+
+
+def test_join_sequences_merges_multiple_return_sequences() -> None:
+    # When
+    result = BaseTranslationWorker.join_sequences(["a1", "a2", "b1", "b2"], 2)
+
+    # Then
+    assert result == ["a1a2", "b1b2"]
+
+
+def test_handle_command_translate_batch_runs_one_generate_per_group(worker: MockTranslationWorker) -> None:
+    # Given
+    is_processing = multiprocessing.Value("b", False)
+    processing_lock = multiprocessing.Lock()
+
+    # When
+    result = worker.handle_command(
+        "translate_batch",
+        [("a", "en", "fr", {}), ("b", "en", "de", {}), ("c", "en", "fr", {})],
+        None,
+        "cpu",
+        is_processing,
+        processing_lock,
+    )
+
+    # Then
+    assert not is_processing.value
+    assert worker.generate_mock.call_count == 2
+    worker.generate_mock.assert_any_call(["a", "c"], "en", "fr", {})
+    worker.generate_mock.assert_any_call(["b"], "en", "de", {})
+    assert result.results == ["A", "B", "C"]
+
+
+def test_handle_command_translate_batch_reports_group_stats(worker: MockTranslationWorker) -> None:
+    # Given
+    is_processing = multiprocessing.Value("b", False)
+    processing_lock = multiprocessing.Lock()
+
+    # When
+    result = worker.handle_command(
+        "translate_batch",
+        [("a", "en", "fr", {}), ("b", "en", "de", {}), ("c", "en", "fr", {})],
+        None,
+        "cpu",
+        is_processing,
+        processing_lock,
+    )
+
+    # Then
+    assert [(stats.source_language, stats.target_language, stats.indices) for stats in result.group_stats] == [
+        ("en", "fr", [0, 2]),
+        ("en", "de", [1]),
+    ]
+    assert all(set(stats.stage_seconds) == {"segment", "generate"} for stats in result.group_stats)
+    assert result.duration_seconds >= sum(sum(stats.stage_seconds.values()) for stats in result.group_stats)
+    assert worker._group_stats is None
+
+
+def test_record_tokens_excludes_padding(worker: MockTranslationWorker) -> None:
+    # Given
+    worker._group_stats = TranslationGroupStats("en", "fr", [0, 1])
+
+    # When
+    worker.record_tokens(torch.tensor([[1, 1, 1], [1, 0, 0]]), torch.tensor([[5, 6, 7], [8, 0, 0]]), 0)
+
+    # Then
+    assert worker._group_stats.input_tokens == 4
+    assert worker._group_stats.output_tokens == 4
+
+
+def test_record_tokens_without_group_is_ignored(worker: MockTranslationWorker) -> None:
+    # When
+    worker.record_tokens(torch.tensor([[1]]), torch.tensor([[1]]), 0)
+
+    # Then
+    assert worker._group_stats is None
+
+
+def test_handle_command_translate_batch_isolates_group_errors(worker: MockTranslationWorker) -> None:
+    # Given
+    is_processing = multiprocessing.Value("b", False)
+    processing_lock = multiprocessing.Lock()
+    error = RuntimeError("Translation error")
+
+    def generate(texts: List[str], _source: str, target: str, _params: Dict[str, Any]) -> List[str]:
+        if target == "de":
+            raise error
+
+        return [text.upper() for text in texts]
+
+    worker.generate_mock.side_effect = generate
+
+    # When
+    result = worker.handle_command(
+        "translate_batch",
+        [("a", "en", "fr", {}), ("b", "en", "de", {})],
+        None,
+        "cpu",
+        is_processing,
+        processing_lock,
+    )
+
+    # Then
+    assert not is_processing.value
+    assert result.results == ["A", error]
+
+
+def test_handle_command_unsupported_command(worker: MockTranslationWorker) -> None:
+    # Given
+    is_processing = multiprocessing.Value("b", False)
+    processing_lock = multiprocessing.Lock()
+
+    # When / Then
+    with pytest.raises(ValueError, match="Unsupported worker command: unknown"):
+        worker.handle_command("unknown", [], None, "cpu", is_processing, processing_lock)
+
+
+def test_merge_segments_respects_token_budget_and_paragraphs() -> None:
+    # Given
+    segments = [("a.", " "), ("b.", " "), ("c.", "\n\n"), ("d.", " "), ("e.", "")]
+
+    # When
+    result = BaseTranslationWorker.merge_segments(segments, [2, 2, 2, 2, 5], 4)
+
+    # Then
+    assert result == [("a. b.", " "), ("c.", "\n\n"), ("d.", " "), ("e.", "")]
+
+
+def test_join_chunks_restores_whitespace() -> None:
+    # When
+    result = BaseTranslationWorker.join_chunks(
+        ["A", "B", "C", "D"],
+        [("", [""], ""), ("  ", [" ", "\n\n", ""], "\n")],
+    )
+
+    # Then
+    assert result == ["A", "  B C\n\nD\n"]
+
+
+def test_handle_command_translate_batch_chunks_long_texts(worker: MockTranslationWorker) -> None:
+    # Given
+    is_processing = multiprocessing.Value("b", False)
+    processing_lock = multiprocessing.Lock()
+    worker.max_input_tokens = 4
+
+    # When
+    result = worker.handle_command(
+        "translate_batch",
+        [
+            ("short text", "en", "fr", {}),
+            ("\none two. three four. five six.\n\nseven eight. ", "en", "fr", {}),
+        ],
+        None,
+        "cpu",
+        is_processing,
+        processing_lock,
+    )
+
+    # Then
+    worker.generate_mock.assert_called_once_with(
+        ["short text", "one two. three four.", "five six.", "seven eight."],
+        "en",
+        "fr",
+        {},
+    )
+    assert result.results == ["SHORT TEXT", "\nONE TWO. THREE FOUR. FIVE SIX.\n\nSEVEN EIGHT. "]
+
+
+def test_apply_precision_int8_quantizes_linear_layers_on_cpu(worker: MockTranslationWorker) -> None:
+    # Given
+    model = torch.nn.Sequential(torch.nn.Linear(4, 4))
+
+    # When
+    quantized_model = worker.apply_precision(model, "int8", "cpu")
+
+    # Then
+    assert not isinstance(quantized_model[0], torch.nn.Linear)
+    assert quantized_model(torch.ones(1, 4)).shape == (1, 4)
+
+
+def test_apply_precision_int8_keeps_fp32_on_cuda(worker: MockTranslationWorker, mock_logger: Logger) -> None:
+    # Given
+    model = torch.nn.Sequential(torch.nn.Linear(4, 4))
+
+    # When
+    result = worker.apply_precision(model, "int8", "cuda")
+
+    # Then
+    assert result is model
+    assert isinstance(result[0], torch.nn.Linear)
+    mock_logger.warning.assert_called_once()
+
+
+def test_apply_precision_bf16_converts_weights(worker: MockTranslationWorker) -> None:
+    # Given
+    model = torch.nn.Sequential(torch.nn.Linear(4, 4))
+
+    # When
+    result = worker.apply_precision(model, "bf16", "cpu")
+
+    # Then
+    assert result[0].weight.dtype == torch.bfloat16
+
+
+def test_apply_precision_fp32_returns_model_unchanged(worker: MockTranslationWorker) -> None:
+    # Given
+    model = torch.nn.Sequential(torch.nn.Linear(4, 4))
+
+    # When
+    result = worker.apply_precision(model, "fp32", "cpu")
+
+    # Then
+    assert result is model
+    assert result[0].weight.dtype == torch.float32
+
+
+def test_load_pretrained_without_fast_load_uses_hub_cache(worker: MockTranslationWorker) -> None:
+    # Given
+    model_class = Mock()
+    processor_class = Mock()
+
+    # When
+    model, processor = worker.load_pretrained(model_class, processor_class, "org/model", "/models", False)
+
+    # Then
+    model_class.from_pretrained.assert_called_once_with("org/model", cache_dir="/models")
+    processor_class.from_pretrained.assert_called_once_with("org/model", cache_dir="/models")
+    assert model == model_class.from_pretrained.return_value
+    assert processor == processor_class.from_pretrained.return_value
+
+
+def test_load_pretrained_saves_fast_load_snapshot_on_first_load(worker: MockTranslationWorker, tmp_path: Path) -> None:
+    # Given
+    model_class = Mock()
+    processor_class = Mock()
+
+    # When
+    model, processor = worker.load_pretrained(model_class, processor_class, "org/model", str(tmp_path), True)
+
+    # Then
+    model_class.from_pretrained.assert_called_once_with("org/model", cache_dir=str(tmp_path), low_cpu_mem_usage=True)
+    model.save_pretrained.assert_called_once()
+    assert model.save_pretrained.call_args.kwargs == {"safe_serialization": True}
+    processor.save_pretrained.assert_called_once()
+    assert os.path.isdir(os.path.join(tmp_path, "safetensors", "org--model"))
+
+
+def test_load_pretrained_saves_fast_load_snapshot_once_for_concurrent_workers(
+    worker: MockTranslationWorker,
+    tmp_path: Path,
+) -> None:
+    # Given
+    fast_load_path = worker.get_fast_load_path(str(tmp_path), "org/model")
+    model_class = Mock()
+    processor_class = Mock()
+
+    def save_fast_load_snapshot(*_: object) -> None:
+        time.sleep(0.1)
+        os.makedirs(fast_load_path)
+        Path(fast_load_path, "config.json").touch()
+
+    with patch.object(worker, "_save_fast_load_snapshot", side_effect=save_fast_load_snapshot) as mock_save:
+        threads = [
+            threading.Thread(
+                target=worker.load_pretrained,
+                args=(model_class, processor_class, "org/model", str(tmp_path), True),
+            )
+            for _ in range(3)
+        ]
+
+        # When
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+    # Then
+    mock_save.assert_called_once()
+    model_class.from_pretrained.assert_any_call("org/model", cache_dir=str(tmp_path), low_cpu_mem_usage=True)
+    assert model_class.from_pretrained.call_count == 3
+
+
+def test_load_pretrained_removes_partial_fast_load_snapshot_on_failure(
+    worker: MockTranslationWorker,
+    tmp_path: Path,
+) -> None:
+    # Given
+    model_class = Mock()
+    model_class.from_pretrained.return_value.save_pretrained.side_effect = RuntimeError("serialization failed")
+
+    # When
+    with pytest.raises(RuntimeError, match="serialization failed"):
+        worker.load_pretrained(model_class, Mock(), "org/model", str(tmp_path), True)
+
+    # Then
+    assert [path.name for path in Path(tmp_path, "safetensors").iterdir()] == ["org--model.lock"]
+
+
+def test_load_pretrained_memory_maps_fast_load_snapshot(worker: MockTranslationWorker, tmp_path: Path) -> None:
+    # Given
+    fast_load_path = worker.get_fast_load_path(str(tmp_path), "org/model")
+    os.makedirs(fast_load_path)
+    Path(fast_load_path, "config.json").touch()
+    model_class = Mock()
+    processor_class = Mock()
+
+    # When
+    worker.load_pretrained(model_class, processor_class, "org/model", str(tmp_path), True)
+
+    # Then
+    model_class.from_pretrained.assert_called_once_with(fast_load_path, low_cpu_mem_usage=True, use_safetensors=True)
+    processor_class.from_pretrained.assert_called_once_with(fast_load_path)
+
+
+def test_load_pretrained_reloads_identical_weights_from_snapshot(worker: MockTranslationWorker, tmp_path: Path) -> None:
+    # Given
+    model_path = os.path.join(tmp_path, "model")
+    MBartForConditionalGeneration(
+        MBartConfig(
+            vocab_size=32,
+            d_model=8,
+            encoder_layers=1,
+            decoder_layers=1,
+            encoder_attention_heads=1,
+            decoder_attention_heads=1,
+            encoder_ffn_dim=16,
+            decoder_ffn_dim=16,
+        ),
+    ).save_pretrained(model_path)
+    download_path = os.path.join(tmp_path, "downloads")
+    saved_model, _ = worker.load_pretrained(MBartForConditionalGeneration, Mock(), model_path, download_path, True)
+
+    # When
+    loaded_model, _ = worker.load_pretrained(MBartForConditionalGeneration, Mock(), model_path, download_path, True)
+
+    # Then
+    assert os.path.isfile(os.path.join(worker.get_fast_load_path(download_path, model_path), "model.safetensors"))
+    for saved, loaded in zip(saved_model.state_dict().values(), loaded_model.state_dict().values()):
+        assert torch.equal(saved, loaded)
+
+
+def test_create_shared_object_moves_frozen_model_to_shared_memory(worker: MockTranslationWorker) -> None:
+    # Given
+    model = torch.nn.Linear(4, 4)
+    worker.initialize_shared_object = Mock(return_value=(model, "tokenizer"))  # type: ignore
+    num_threads = torch.get_num_threads()
+
+    # When
+    shared_object = worker.create_shared_object()
+
+    # Then
+    assert shared_object == (model, "tokenizer")
+    assert all(parameter.is_shared() for parameter in model.parameters())  # type: ignore
+    assert not any(parameter.requires_grad for parameter in model.parameters())
+    assert torch.get_num_threads() == num_threads
+
+
+def test_shared_object_bytes_sums_model_tensors(worker: MockTranslationWorker) -> None:
+    # Given
+    model = torch.nn.Sequential(torch.nn.Linear(4, 4), torch.nn.BatchNorm1d(4))
+
+    # When
+    shared_object_bytes = worker.shared_object_bytes((model, "tokenizer"))
+
+    # Then
+    assert shared_object_bytes == sum(
+        tensor.nelement() * tensor.element_size() for tensor in [*model.parameters(), *model.buffers()]
+    )
+    assert worker.shared_object_bytes("tokenizer") == 0
+
+
+def test_attach_shared_object_sets_worker_threads(worker: MockTranslationWorker) -> None:
+    # Given
+    config = Mock(num_threads=2)
+
+    # When
+    with patch("torch.set_num_threads") as mock_set_num_threads:
+        shared_object = worker.attach_shared_object("shared", config)
+
+    # Then
+    assert shared_object == "shared"
+    mock_set_num_threads.assert_called_once_with(2)
@@ -1,28 +1,21 @@
 import multiprocessing
+import os
+import threading
 from multiprocessing.sharedctypes import Synchronized
 from typing import Generator
 from unittest.mock import Mock, patch
 
+import psutil
 import pytest
 
 from core.logger.logger import Logger
 from data.workers.base_worker import BaseWorker
 
 
-class MockBaseWorker(BaseWorker[str, str, dict, None]):  # type: ignore
-    def _run_process(
-        self,
-        config: str,
-        pipe: multiprocessing.connection.Connection,
-        stop_event: multiprocessing.synchronize.Event,
-        is_processing: multiprocessing.Value,  # type: ignore
-        processing_lock: multiprocessing.synchronize.Lock,
-    ) -> None:
-        pass
-
+class MockBaseWorker(BaseWorker[str, str, Mock, None]):  # type: ignore
     def initialize_shared_object(
         self,
-        config: str,
+        config: Mock,
     ) -> None:
         return None
 
@@ -31,19 +24,21 @@ class MockBaseWorker(BaseWorker[str, str, dict, None]):  # type: ignore
         command: str,
         args: str,
         shared_object: None,
-        config: str,
-        pipe: multiprocessing.connection.Connection,
+        config: Mock,
         is_processing: Synchronized,  # type: ignore
         processing_lock: multiprocessing.synchronize.Lock,
-    ) -> None:
-        pass
+    ) -> str:
+        if command == "fail":
+            raise RuntimeError(args)
+
+        return args.upper()
 
     def get_worker_name(self) -> str:
         return "MockBaseWorker"
 
 
 @pytest.fixture
-def base_worker(base_config: str, mock_logger: Logger) -> Generator[MockBaseWorker, None, None]:
+def base_worker(base_config: Mock, mock_logger: Logger) -> Generator[MockBaseWorker, None, None]:
     worker = MockBaseWorker(base_config, mock_logger)
     yield worker
     worker.stop()
@@ -55,8 +50,10 @@ def mock_logger() -> Logger:
 
 
 @pytest.fixture
-def base_config() -> str:
-    return "cpu"
+def base_config() -> Mock:
+    config = Mock()
+    config.log_level = "INFO"
+    return config
 
 
 def test_start_creates_new_process(base_worker: MockBaseWorker) -> None:
@@ -115,6 +112,52 @@ def test_is_alive_returns_correct_status(base_worker: MockBaseWorker) -> None:
         assert not alive_status
 
 
+def test_rss_bytes_returns_worker_process_memory(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        mock_process = Mock()
+        mock_process.pid = os.getpid()
+        MockProcess.return_value = mock_process
+
+        # When / Then
+        assert base_worker.rss_bytes() == 0
+
+        # Given
+        base_worker.start()
+
+        # When
+        rss_bytes = base_worker.rss_bytes()
+
+        # Then
+        assert rss_bytes > 0
+
+        # When / Then
+        with patch("psutil.Process", side_effect=psutil.NoSuchProcess(mock_process.pid)):
+            assert base_worker.rss_bytes() == 0
+
+
+def test_uss_bytes_returns_worker_process_unique_memory(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        mock_process = Mock()
+        mock_process.pid = os.getpid()
+        MockProcess.return_value = mock_process
+
+        # When / Then
+        assert base_worker.uss_bytes() == 0
+
+        # Given
+        base_worker.start()
+
+        # When
+        uss_bytes = base_worker.uss_bytes()
+
+        # Then
+        assert 0 < uss_bytes <= base_worker.rss_bytes()
+
+        # When / Then
+        with patch("psutil.Process", side_effect=psutil.NoSuchProcess(mock_process.pid)):
+            assert base_worker.uss_bytes() == 0
+
+
 def test_is_processing_returns_correct_status(base_worker: MockBaseWorker) -> None:
     # Given
     base_worker._is_processing.value = True
@@ -133,3 +176,140 @@ def test_is_processing_returns_correct_status(base_worker: MockBaseWorker) -> No
 
     # Then
     assert not processing_status
+
+
+def test_send_command_raises_error_if_worker_not_running(base_worker: MockBaseWorker) -> None:
+    # When / Then
+    with pytest.raises(RuntimeError, match="Worker process is not running"):
+        base_worker.send_command("upper", "hello")
+
+
+def test_send_command_routes_responses_by_request_id(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        base_worker.start()
+        first = base_worker.send_command("upper", "first")
+        second = base_worker.send_command("upper", "second")
+        first_id, _, _ = base_worker._pipe_child.recv()
+        second_id, _, _ = base_worker._pipe_child.recv()
+
+        # When
+        base_worker._pipe_child.send((second_id, "SECOND"))
+        base_worker._pipe_child.send((first_id, RuntimeError("first failed")))
+
+        # Then
+        assert second.result(timeout=5) == "SECOND"
+        with pytest.raises(RuntimeError, match="first failed"):
+            first.result(timeout=5)
+        assert base_worker.pending_count() == 0
+
+
+def test_stop_fails_pending_requests(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        base_worker.start()
+        future = base_worker.send_command("upper", "hello")
+
+        # When
+        base_worker.stop()
+
+        # Then
+        with pytest.raises(RuntimeError, match="Worker process is not running"):
+            future.result(timeout=5)
+
+
+def test_run_process_answers_commands_with_request_id(base_worker: MockBaseWorker, base_config: Mock) -> None:
+    # Given
+    parent, child = multiprocessing.Pipe()
+    stop_event = multiprocessing.Event()
+    process_thread = threading.Thread(
+        target=base_worker._run_process,
+        args=(
+            base_config,
+            child,
+            stop_event,
+            base_worker._is_processing,
+            base_worker._processing_lock,
+            base_worker._is_ready,
+        ),
+    )
+    process_thread.start()
+
+    # When
+    parent.send(("request-1", "upper", "hello"))
+    parent.send(("request-2", "fail", "broken"))
+    first_response = parent.recv()
+    second_response = parent.recv()
+    was_ready = base_worker._is_ready.value
+    stop_event.set()
+    process_thread.join(timeout=5)
+
+    # Then
+    assert was_ready
+    assert not base_worker._is_ready.value
+    assert first_response == ("request-1", "HELLO")
+    assert second_response[0] == "request-2"
+    assert isinstance(second_response[1], RuntimeError)
+
+
+def test_run_process_uses_shared_object_instead_of_loading(base_worker: MockBaseWorker, base_config: Mock) -> None:
+    # Given
+    parent, child = multiprocessing.Pipe()
+    stop_event = multiprocessing.Event()
+    base_worker.share_object("shared")
+    base_worker.initialize_shared_object = Mock()  # type: ignore
+    base_worker.attach_shared_object = Mock(return_value="attached")
+    base_worker.handle_command = Mock(return_value="HELLO")  # type: ignore
+    process_thread = threading.Thread(
+        target=base_worker._run_process,
+        args=(
+            base_config,
+            child,
+            stop_event,
+            base_worker._is_processing,
+            base_worker._processing_lock,
+            base_worker._is_ready,
+        ),
+    )
+    process_thread.start()
+
+    # When
+    parent.send(("request-1", "upper", "hello"))
+    response = parent.recv()
+    stop_event.set()
+    process_thread.join(timeout=5)
+
+    # Then
+    assert response == ("request-1", "HELLO")
+    base_worker.initialize_shared_object.assert_not_called()
+    base_worker.attach_shared_object.assert_called_once_with("shared", base_config)
+    assert base_worker.handle_command.call_args[0][2] == "attached"
+
+
+def test_is_ready_requires_live_process_with_loaded_model(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        mock_process = Mock()
+        mock_process.pid = 1234
+        MockProcess.return_value = mock_process
+
+        # Given
+        base_worker.start()
+        assert not base_worker.is_ready()
+
+        # When
+        base_worker._is_ready.value = True
+
+        # Then
+        assert base_worker.is_ready()
+        assert base_worker.pid() == 1234
+
+        # When
+        base_worker.stop()
+
+        # Then
+        assert not base_worker.is_ready()
+        assert base_worker.pid() is None
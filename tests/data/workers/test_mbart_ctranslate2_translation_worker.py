@@ -0,0 +1,186 @@
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.logger.logger import Logger
+from data.workers.base_translation_worker import TranslationGroupStats
+from data.workers.mbart_ctranslate2_translation_worker import (
+    CONVERSION_FILE_PATTERNS,
+    MBartCTranslate2TranslationWorker,
+)
+from data.workers.mbart_translation_worker import MBartTranslationConfig
+
+
+@pytest.fixture
+def mbart_config() -> MBartTranslationConfig:
+    return MBartTranslationConfig(
+        device="cpu",
+        model_name="facebook/mbart-large-50",
+        model_download_path="/tmp",
+        log_level="INFO",
+        num_threads=2,
+        max_input_tokens=400,
+        precision="int8",
+        fast_load=False,
+    )
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def worker(mbart_config: MBartTranslationConfig, mock_logger: Logger) -> MBartCTranslate2TranslationWorker:
+    return MBartCTranslate2TranslationWorker(mbart_config, mock_logger)
+
+
+def test_get_converted_path(mbart_config: MBartTranslationConfig) -> None:
+    # When
+    converted_path = MBartCTranslate2TranslationWorker.get_converted_path(mbart_config)
+
+    # Then
+    assert converted_path == os.path.join("/tmp", "ctranslate2", "facebook--mbart-large-50")
+
+
+@pytest.mark.parametrize(
+    ("generation_parameters", "expected_options"),
+    [
+        ({}, {}),
+        ({"num_beams": 4, "max_new_tokens": 64}, {"beam_size": 4, "max_decoding_length": 64}),
+        ({"top_k": 10, "temperature": 0.7}, {}),
+        ({"do_sample": True, "temperature": 0.7}, {"sampling_topk": 50, "sampling_temperature": 0.7}),
+        ({"top_k": 10, "do_sample": True}, {"sampling_topk": 10}),
+        ({"forced_bos_token_id": 5}, {}),
+    ],
+)
+def test_get_translate_options(
+    worker: MBartCTranslate2TranslationWorker,
+    generation_parameters: Dict[str, Any],
+    expected_options: Dict[str, Any],
+) -> None:
+    # When
+    options = worker.get_translate_options(generation_parameters)
+
+    # Then
+    assert options == expected_options
+
+
+def test_ensure_converted_converts_once_for_concurrent_workers(
+    mbart_config: MBartTranslationConfig,
+    worker: MBartCTranslate2TranslationWorker,
+    tmp_path: Path,
+) -> None:
+    # Given
+    mbart_config.model_download_path = str(tmp_path)
+    converted_path = MBartCTranslate2TranslationWorker.get_converted_path(mbart_config)
+
+    def convert_model(*_: object) -> None:
+        time.sleep(0.1)
+        os.makedirs(converted_path)
+        Path(converted_path, "model.bin").touch()
+
+    with patch.object(worker, "_convert_model", side_effect=convert_model) as mock_convert_model:
+        threads = [
+            threading.Thread(target=worker._ensure_converted, args=(mbart_config, converted_path)) for _ in range(3)
+        ]
+
+        # When
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        # Then
+        mock_convert_model.assert_called_once()
+
+
+def test_convert_model_downloads_only_conversion_files(
+    mbart_config: MBartTranslationConfig,
+    worker: MBartCTranslate2TranslationWorker,
+    tmp_path: Path,
+) -> None:
+    # Given
+    mbart_config.model_download_path = str(tmp_path)
+    converted_path = MBartCTranslate2TranslationWorker.get_converted_path(mbart_config)
+    ctranslate2 = Mock()
+
+    with (
+        patch.dict(sys.modules, {"ctranslate2": ctranslate2}),
+        patch(
+            "data.workers.mbart_ctranslate2_translation_worker.snapshot_download",
+            return_value="/snapshot",
+        ) as mock_snapshot_download,
+    ):
+        # When
+        worker._convert_model(mbart_config, converted_path)
+
+    # Then
+    mock_snapshot_download.assert_called_once_with(
+        "facebook/mbart-large-50",
+        cache_dir=str(tmp_path),
+        allow_patterns=CONVERSION_FILE_PATTERNS,
+    )
+    ctranslate2.converters.TransformersConverter.assert_called_once_with("/snapshot")
+    assert os.path.isdir(converted_path)
+
+
+def test_get_translate_options_warns_about_unsupported_parameters(
+    worker: MBartCTranslate2TranslationWorker,
+    mock_logger: Logger,
+) -> None:
+    # When
+    options = worker.get_translate_options({"early_stopping": True})
+
+    # Then
+    assert options == {}
+    mock_logger.warning.assert_called_once()
+
+
+def test_generate_translates_with_target_prefix(
+    worker: MBartCTranslate2TranslationWorker,
+    mbart_config: MBartTranslationConfig,
+) -> None:
+    # Given
+    vocabulary = ["<pad>", "</s>", "en_XX", "pl_PL", "▁Hello", "▁world", "▁Cześć", "▁świecie"]
+    tokenizer = Mock()
+    tokenizer.return_value = {"input_ids": [[2, 4, 1], [2, 4, 5, 1]]}
+    tokenizer.convert_ids_to_tokens.side_effect = lambda ids: [vocabulary[i] for i in ids]
+    tokenizer.convert_tokens_to_ids.side_effect = lambda tokens: [vocabulary.index(token) for token in tokens]
+    tokenizer.decode.side_effect = (
+        lambda ids, **_: "".join(vocabulary[i] for i in ids if i > 3).replace("▁", " ").strip()
+    )
+    translator = Mock()
+    translator.translate_batch.return_value = [
+        Mock(hypotheses=[["pl_PL", "▁Cześć"]]),
+        Mock(hypotheses=[["pl_PL", "▁Cześć", "▁świecie"]]),
+    ]
+    worker._group_stats = TranslationGroupStats("en_XX", "pl_PL", [0, 1])
+
+    # When
+    result: List[str] = worker.generate(
+        ["Hello", "Hello world"],
+        "en_XX",
+        "pl_PL",
+        {"num_beams": 2},
+        (translator, tokenizer),
+        mbart_config,
+    )
+
+    # Then
+    assert result == ["Cześć", "Cześć świecie"]
+    assert tokenizer.src_lang == "en_XX"
+    translator.translate_batch.assert_called_once_with(
+        [["en_XX", "▁Hello", "</s>"], ["en_XX", "▁Hello", "▁world", "</s>"]],
+        target_prefix=[["pl_PL"], ["pl_PL"]],
+        beam_size=2,
+    )
+    assert worker._group_stats.input_tokens == 7
+    assert worker._group_stats.output_tokens == 3
+    assert set(worker._group_stats.stage_seconds) == {"tokenize", "generate", "decode"}
@@ -0,0 +1,93 @@
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.logger.logger import Logger
+from data.workers.mbart_onnx_translation_worker import MBartOnnxTranslationWorker
+from data.workers.mbart_translation_worker import MBartTranslationConfig
+
+
+@pytest.fixture
+def mbart_config(tmp_path: str) -> MBartTranslationConfig:
+    return MBartTranslationConfig(
+        device="cpu",
+        model_name="facebook/mbart-large-50",
+        model_download_path=str(tmp_path),
+        log_level="INFO",
+        num_threads=2,
+        max_input_tokens=400,
+        precision="fp32",
+        fast_load=False,
+    )
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+def test_get_export_path(mbart_config: MBartTranslationConfig) -> None:
+    # When
+    export_path = MBartOnnxTranslationWorker.get_export_path(mbart_config)
+
+    # Then
+    assert export_path == os.path.join(mbart_config.model_download_path, "onnx", "facebook--mbart-large-50")
+
+
+def test_initialize_shared_object_exports_model_once(
+    mbart_config: MBartTranslationConfig,
+    mock_logger: Logger,
+) -> None:
+    # Given
+    pytest.importorskip("optimum.onnxruntime")
+    worker = MBartOnnxTranslationWorker(mbart_config, mock_logger)
+
+    with (
+        patch("optimum.onnxruntime.ORTModelForSeq2SeqLM.from_pretrained") as mock_load_model,
+        patch("data.workers.mbart_onnx_translation_worker.AutoTokenizer.from_pretrained"),
+    ):
+        mock_model = Mock()
+        mock_model.save_pretrained.side_effect = lambda path: Path(path, "config.json").touch()
+        mock_load_model.return_value = mock_model
+
+        # When
+        worker.initialize_shared_object(mbart_config)
+        worker.initialize_shared_object(mbart_config)
+
+        # Then
+        export_path = MBartOnnxTranslationWorker.get_export_path(mbart_config)
+        assert mock_load_model.call_args_list[0].args == (mbart_config.model_name,)
+        assert mock_load_model.call_args_list[0].kwargs["export"] is True
+        assert mock_load_model.call_args_list[1].args == (export_path,)
+        assert "export" not in mock_load_model.call_args_list[1].kwargs
+        mock_model.save_pretrained.assert_called_once()
+
+
+def test_ensure_exported_exports_once_for_concurrent_workers(
+    mbart_config: MBartTranslationConfig,
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker = MBartOnnxTranslationWorker(mbart_config, mock_logger)
+    export_path = MBartOnnxTranslationWorker.get_export_path(mbart_config)
+
+    def export_model(*_: object) -> None:
+        time.sleep(0.1)
+        os.makedirs(export_path)
+        Path(export_path, "config.json").touch()
+
+    with patch.object(worker, "_export_model", side_effect=export_model) as mock_export_model:
+        threads = [threading.Thread(target=worker._ensure_exported, args=(mbart_config, export_path)) for _ in range(3)]
+
+        # When
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        # Then
+        mock_export_model.assert_called_once()
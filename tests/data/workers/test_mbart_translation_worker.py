@@ -1,4 +1,3 @@
-import multiprocessing
 from typing import Generator
 from unittest.mock import Mock, patch
 
@@ -12,11 +11,6 @@ from data.workers.mbart_translation_worker import (
 )
 
 
-@pytest.fixture
-def mock_tensor() -> Mock:
-    return Mock(spec=torch.Tensor)
-
-
 @pytest.fixture
 def mbart_config() -> MBartTranslationConfig:
     return MBartTranslationConfig(
@@ -24,6 +18,10 @@ def mbart_config() -> MBartTranslationConfig:
         model_name="facebook/mbart-large-50",
         model_download_path="/tmp",
         log_level="INFO",
+        num_threads=2,
+        max_input_tokens=400,
+        precision="fp32",
+        fast_load=False,
     )
 
 
@@ -47,55 +45,6 @@ class MockTensor:
         return self
 
 
-def test_translate_sends_correct_command(mbart_worker: MBartTranslationWorker) -> None:
-    with (
-        patch("multiprocessing.Process") as MockProcess,
-        patch(
-            "data.workers.mbart_translation_worker.AutoModelForSeq2SeqLM.from_pretrained",
-        ) as mock_load_model,
-        patch(
-            "data.workers.mbart_translation_worker.AutoTokenizer.from_pretrained",
-        ) as mock_load_tokenizer,
-    ):
-        mock_process = Mock()
-        MockProcess.return_value = mock_process
-        mock_model = Mock()
-        mock_tokenizer = Mock()
-        mock_load_model.return_value = mock_model
-        mock_load_tokenizer.return_value = mock_tokenizer
-
-        # Given
-        mbart_worker.start()
-        text = "Hello, world!"
-        source_language = "en"
-        target_language = "fr"
-
-        # When
-        with (
-            patch.object(mbart_worker._pipe_parent, "send") as mock_send,
-            patch.object(
-                mbart_worker._pipe_parent,
-                "recv",
-                return_value="Bonjour, le monde!",
-            ),
-        ):
-            mbart_worker.translate(text, source_language, target_language, {})
-
-            # Then
-            mock_send.assert_called_once_with(("translate", (text, source_language, target_language, {})))
-
-
-def test_translate_raises_error_if_worker_not_running(mbart_worker: MBartTranslationWorker) -> None:
-    # Given
-    text = "Hello, world!"
-    source_language = "en"
-    target_language = "fr"
-
-    # When / Then
-    with pytest.raises(RuntimeError, match="Worker process is not running"):
-        mbart_worker.translate(text, source_language, target_language, {})
-
-
 def test_initialize_shared_object(mbart_config: MBartTranslationConfig, mock_logger: Logger) -> None:
     worker = MBartTranslationWorker(mbart_config, mock_logger)
     with (
@@ -103,6 +52,7 @@ def test_initialize_shared_object(mbart_config: MBartTranslationConfig, mock_log
         patch(
             "data.workers.mbart_translation_worker.AutoTokenizer.from_pretrained",
         ) as mock_load_tokenizer,
+        patch("torch.set_num_threads") as mock_set_num_threads,
     ):
         mock_model = Mock()
         mock_tokenizer = Mock()
@@ -122,93 +72,81 @@ def test_initialize_shared_object(mbart_config: MBartTranslationConfig, mock_log
             mbart_config.model_name,
             cache_dir=mbart_config.model_download_path,
         )
+        mock_set_num_threads.assert_called_once_with(2)
         assert model == mock_model
         assert tokenizer == mock_tokenizer
 
 
-def test_handle_command_translate(mbart_worker: MBartTranslationWorker, mbart_config: MBartTranslationConfig) -> None:
-    with (
-        patch("data.workers.mbart_translation_worker.AutoModelForSeq2SeqLM.from_pretrained") as mock_load_model,
-        patch(
-            "data.workers.mbart_translation_worker.AutoTokenizer.from_pretrained",
-        ) as mock_load_tokenizer,
-        patch("torch.no_grad"),
-    ):
-        mock_model = Mock()
-        mock_tokenizer = Mock()
-        mock_load_model.return_value = mock_model
-        mock_load_tokenizer.return_value = mock_tokenizer
-        mock_tokenizer.lang_code_to_id = {"fr": 1}
-        mock_is_processing = multiprocessing.Value("b", False)
-        mock_processing_lock = multiprocessing.Lock()
-        pipe = Mock()
-        mock_input_tensors = {"input_ids": MockTensor(), "attention_mask": MockTensor()}
-        mock_tokenizer.return_value.to.return_value = mock_input_tensors
-        mock_generated_tokens = torch.tensor([[4, 5, 6]])
-        mock_model.generate.return_value = mock_generated_tokens
-        mock_tokenizer.decode.return_value = "Bonjour, le monde!"
-
-        # When
-        mbart_worker.handle_command(
-            command="translate",
-            args=("Hello, world!", "en", "fr", {}),
-            shared_object=(mock_model, mock_tokenizer),
-            config=mbart_config,
-            pipe=pipe,
-            is_processing=mock_is_processing,
-            processing_lock=mock_processing_lock,
-        )
+def test_generate_translates_padded_batch(
+    mbart_worker: MBartTranslationWorker,
+    mbart_config: MBartTranslationConfig,
+) -> None:
+    # Given
+    mock_model = Mock()
+    mock_tokenizer = Mock()
+    mock_tokenizer.lang_code_to_id = {"fr": 1}
+    mock_input_tensors = {"input_ids": MockTensor(), "attention_mask": MockTensor()}
+    mock_tokenizer.return_value.to.return_value = mock_input_tensors
+    mock_generated_tokens = torch.tensor([[4, 5, 6], [7, 8, 9]])
+    mock_model.generate.return_value = mock_generated_tokens
+    mock_tokenizer.batch_decode.return_value = ["Bonjour, le monde!", "Au revoir!"]
+
+    # When
+    result = mbart_worker.generate(
+        ["Hello, world!", "Goodbye!"],
+        "en",
+        "fr",
+        {},
+        (mock_model, mock_tokenizer),
+        mbart_config,
+    )
 
-        # Then
-        assert not mock_is_processing.value
-        mock_tokenizer.assert_called_once_with(
-            "Hello, world!",
-            return_tensors="pt",
-        )
-        mock_model.generate.assert_called_once_with(**mock_input_tensors, forced_bos_token_id=1)
-        pipe.send.assert_called_once_with("Bonjour, le monde!")
+    # Then
+    assert result == ["Bonjour, le monde!", "Au revoir!"]
+    assert mock_tokenizer.src_lang == "en"
+    mock_tokenizer.assert_called_once_with(
+        ["Hello, world!", "Goodbye!"],
+        return_tensors="pt",
+        padding=True,
+    )
+    mock_model.generate.assert_called_once_with(**mock_input_tensors, forced_bos_token_id=1)
+    mock_tokenizer.batch_decode.assert_called_once_with(mock_generated_tokens, skip_special_tokens=True)
 
 
-def test_handle_command_translate_error(
+def test_generate_keeps_forced_bos_token_id(
     mbart_worker: MBartTranslationWorker,
     mbart_config: MBartTranslationConfig,
 ) -> None:
-    with (
-        patch("data.workers.mbart_translation_worker.AutoModelForSeq2SeqLM.from_pretrained") as mock_load_model,
-        patch(
-            "data.workers.mbart_translation_worker.AutoTokenizer.from_pretrained",
-        ) as mock_load_tokenizer,
-        patch("torch.no_grad"),
-    ):
-        mock_model = Mock()
-        mock_tokenizer = Mock()
-        mock_load_model.return_value = mock_model
-        mock_load_tokenizer.return_value = mock_tokenizer
-        mock_tokenizer.lang_code_to_id = {"fr": 1}
-        mock_is_processing = multiprocessing.Value("b", False)
-        mock_processing_lock = multiprocessing.Lock()
-        pipe = Mock()
-        mock_input_tensors = MockTensor()
-        mock_tokenizer.return_value = Mock()
-        mock_tokenizer.return_value.to.return_value = {
-            "input_ids": mock_input_tensors,
-            "attention_mask": mock_input_tensors,
-        }
-        mock_model.generate.side_effect = RuntimeError("Translation error")
+    # Given
+    mock_model = Mock()
+    mock_tokenizer = Mock()
+    mock_tokenizer.lang_code_to_id = {"fr": 1}
+    mock_input_tensors = {"input_ids": MockTensor(), "attention_mask": MockTensor()}
+    mock_tokenizer.return_value.to.return_value = mock_input_tensors
+    mock_tokenizer.batch_decode.return_value = ["Bonjour"]
+
+    # When
+    mbart_worker.generate(
+        ["Hello"],
+        "en",
+        "fr",
+        {"forced_bos_token_id": 7},
+        (mock_model, mock_tokenizer),
+        mbart_config,
+    )
 
-        # When
-        mbart_worker.handle_command(
-            command="translate",
-            args=("Hello, world!", "en", "fr", {}),
-            shared_object=(mock_model, mock_tokenizer),
-            config=mbart_config,
-            pipe=pipe,
-            is_processing=mock_is_processing,
-            processing_lock=mock_processing_lock,
-        )
+    # Then
+    mock_model.generate.assert_called_once_with(**mock_input_tensors, forced_bos_token_id=7)
 
-        # Then
-        assert not mock_is_processing.value
-        assert pipe.send.call_count == 1
-        assert isinstance(pipe.send.call_args[0][0], RuntimeError)
-        assert pipe.send.call_args[0][0].args[0] == "Translation error"
+
+def test_count_tokens_excludes_special_tokens(mbart_worker: MBartTranslationWorker) -> None:
+    # Given
+    mock_tokenizer = Mock()
+    mock_tokenizer.return_value = {"input_ids": [[1, 2, 3], [4]]}
+
+    # When
+    result = mbart_worker.count_tokens(["Hello, world!", "Hi"], (Mock(), mock_tokenizer))
+
+    # Then
+    assert result == [3, 1]
+    mock_tokenizer.assert_called_once_with(["Hello, world!", "Hi"], add_special_tokens=False)
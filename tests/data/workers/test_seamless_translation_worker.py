@@ -1,4 +1,3 @@
-import multiprocessing
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -18,6 +17,10 @@ def mock_config() -> SeamlessTranslationConfig:
         model_name="facebook/seamless-m4t-v2-large",
         model_download_path="/path/to/model",
         log_level="INFO",
+        num_threads=2,
+        max_input_tokens=400,
+        precision="fp32",
+        fast_load=False,
     )
 
 
@@ -33,38 +36,6 @@ def mock_worker(mock_config: SeamlessTranslationConfig, mock_logger: Logger) ->
     return worker
 
 
-def test_translate_success(mock_worker: SeamlessTranslationWorker) -> None:
-    # Given
-    mock_worker.is_alive = Mock(return_value=True)
-    mock_worker._pipe_parent.recv = Mock(return_value="translated text")
-
-    # When
-    result = mock_worker.translate("hello", "en", "fr", {})
-
-    # Then
-    assert result == "translated text"
-    mock_worker._pipe_parent.send.assert_called_once_with(("translate", ("hello", "en", "fr", {})))
-
-
-def test_translate_worker_not_running(mock_worker: SeamlessTranslationWorker) -> None:
-    # Given
-    mock_worker.is_alive = Mock(return_value=False)
-
-    # When / Then
-    with pytest.raises(RuntimeError, match="Worker process is not running"):
-        mock_worker.translate("hello", "en", "fr", {})
-
-
-def test_translate_exception(mock_worker: SeamlessTranslationWorker) -> None:
-    # Given
-    mock_worker.is_alive = Mock(return_value=True)
-    mock_worker._pipe_parent.recv = Mock(return_value=Exception("Translation error"))
-
-    # When / Then
-    with pytest.raises(Exception, match="Translation error"):
-        mock_worker.translate("hello", "en", "fr", {})
-
-
 def test_initialize_shared_object(mock_config: SeamlessTranslationConfig, mock_logger: Logger) -> None:
     # Given
     with (
@@ -73,6 +44,7 @@ def test_initialize_shared_object(mock_config: SeamlessTranslationConfig, mock_l
             AutoProcessor,
             "from_pretrained",
         ) as mock_processor,
+        patch("torch.set_num_threads") as mock_set_num_threads,
     ):
         mock_model.return_value = MagicMock()
         mock_processor.return_value = MagicMock()
@@ -85,62 +57,65 @@ def test_initialize_shared_object(mock_config: SeamlessTranslationConfig, mock_l
         # Then
         mock_model.assert_called_once_with(mock_config.model_name, cache_dir=mock_config.model_download_path)
         mock_processor.assert_called_once_with(mock_config.model_name, cache_dir=mock_config.model_download_path)
+        mock_set_num_threads.assert_called_once_with(2)
         assert model is not None
         assert processor is not None
 
 
-def test_handle_command_translate_success(
+def test_generate_translates_padded_batch(
     mock_worker: SeamlessTranslationWorker,
     mock_config: SeamlessTranslationConfig,
 ) -> None:
     # Given
-    mock_pipe = Mock()
-    is_processing = multiprocessing.Value("b", False)
-    processing_lock = multiprocessing.Lock()
     mock_model = MagicMock()
     mock_processor = MagicMock()
-    mock_processor.decode.return_value = "translated text"
+    mock_processor.batch_decode.return_value = ["translated hello", "translated world"]
 
     # When
-    mock_worker.handle_command(
-        "translate",
-        ("hello", "en", "fr", {}),
+    result = mock_worker.generate(
+        ["hello", "world"],
+        "en",
+        "fr",
+        {"num_beams": 2},
         (mock_model, mock_processor),
         mock_config,
-        mock_pipe,
-        is_processing,
-        processing_lock,
     )
 
     # Then
-    mock_pipe.send.assert_called_once_with("translated text")
+    assert result == ["translated hello", "translated world"]
+    mock_processor.assert_called_once_with(
+        ["hello", "world"],
+        src_lang="en",
+        return_tensors="pt",
+        padding=True,
+    )
+    mock_model.generate.assert_called_once()
+    assert mock_model.generate.call_args.kwargs["tgt_lang"] == "fr"
+    assert mock_model.generate.call_args.kwargs["num_beams"] == 2
 
 
-def test_handle_command_translate_exception(
+def test_generate_raises_decoding_error(
     mock_worker: SeamlessTranslationWorker,
     mock_config: SeamlessTranslationConfig,
 ) -> None:
     # Given
-    mock_pipe = Mock()
-    is_processing = multiprocessing.Value("b", False)
-    processing_lock = multiprocessing.Lock()
     mock_model = MagicMock()
     mock_processor = MagicMock()
-    mock_processor.decode.side_effect = RuntimeError("Decoding error")
+    mock_processor.batch_decode.side_effect = RuntimeError("Decoding error")
+
+    # When / Then
+    with pytest.raises(RuntimeError, match="Decoding error"):
+        mock_worker.generate(["hello"], "en", "fr", {}, (mock_model, mock_processor), mock_config)
+
+
+def test_count_tokens_excludes_special_tokens(mock_worker: SeamlessTranslationWorker) -> None:
+    # Given
+    mock_processor = Mock()
+    mock_processor.tokenizer.return_value = {"input_ids": [[1, 2, 3], [4]]}
 
     # When
-    mock_worker.handle_command(
-        "translate",
-        ("hello", "en", "fr", {}),
-        (mock_model, mock_processor),
-        mock_config,
-        mock_pipe,
-        is_processing,
-        processing_lock,
-    )
+    result = mock_worker.count_tokens(["Hello, world!", "Hi"], (Mock(), mock_processor))
 
     # Then
-    assert mock_pipe.send.call_count == 1
-    sent_exception = mock_pipe.send.call_args[0][0]
-    assert isinstance(sent_exception, RuntimeError)
-    assert str(sent_exception) == "Decoding error"
+    assert result == [3, 1]
+    mock_processor.tokenizer.assert_called_once_with(["Hello, world!", "Hi"], add_special_tokens=False)
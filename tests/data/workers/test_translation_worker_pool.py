@@ -0,0 +1,202 @@
+from concurrent.futures import Future
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from core.logger.logger import Logger
+from data.workers.base_translation_worker import TranslationRequest
+from data.workers.translation_worker_pool import TranslationWorkerPool
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_workers() -> List[Mock]:
+    workers = [Mock(), Mock(), Mock()]
+
+    for pending_count, worker in zip([3, 1, 2], workers):
+        worker.is_alive.return_value = True
+        worker.is_processing.return_value = False
+        worker.is_ready.return_value = False
+        worker.pending_count.return_value = pending_count
+
+    return workers
+
+
+@pytest.fixture
+def mock_metrics() -> Mock:
+    return Mock()
+
+
+@pytest.fixture
+def worker_pool(mock_workers: List[Mock], mock_logger: Logger, mock_metrics: Mock) -> TranslationWorkerPool:
+    return TranslationWorkerPool(mock_workers, logger=mock_logger, metrics=mock_metrics)
+
+
+def test_start_starts_only_stopped_workers(worker_pool: TranslationWorkerPool, mock_workers: List[Mock]) -> None:
+    # Given
+    mock_workers[1].is_alive.return_value = False
+    mock_workers[1].pid.return_value = None
+
+    # When
+    worker_pool.start()
+
+    # Then
+    mock_workers[0].start.assert_not_called()
+    mock_workers[1].start.assert_called_once()
+    mock_workers[2].start.assert_not_called()
+
+
+def test_start_counts_restarts_of_crashed_workers(
+    worker_pool: TranslationWorkerPool,
+    mock_workers: List[Mock],
+    mock_metrics: Mock,
+) -> None:
+    # Given
+    mock_workers[1].is_alive.return_value = False
+    mock_workers[1].pid.return_value = 11
+    mock_workers[1].get_worker_name.return_value = "MBartTranslationWorker"
+
+    # When
+    worker_pool.start()
+
+    # Then
+    mock_workers[1].start.assert_called_once()
+    mock_metrics.worker_restarts.labels.assert_called_once_with(worker="MBartTranslationWorker")
+    mock_metrics.worker_restarts.labels.return_value.inc.assert_called_once()
+
+
+def test_stop_stops_all_workers(worker_pool: TranslationWorkerPool, mock_workers: List[Mock]) -> None:
+    # When
+    worker_pool.stop()
+
+    # Then
+    for worker in mock_workers:
+        worker.stop.assert_called_once()
+
+
+def test_stop_keeps_warm_workers(worker_pool: TranslationWorkerPool, mock_workers: List[Mock]) -> None:
+    # When
+    worker_pool.stop(keep_warm=1)
+
+    # Then
+    mock_workers[0].stop.assert_not_called()
+    mock_workers[1].stop.assert_called_once()
+    mock_workers[2].stop.assert_called_once()
+
+
+def test_start_shares_model_loaded_once_between_workers(mock_workers: List[Mock], mock_logger: Logger) -> None:
+    # Given
+    worker_pool = TranslationWorkerPool(mock_workers, logger=mock_logger, metrics=Mock(), shared_memory=True)
+    for worker in mock_workers:
+        worker.is_alive.return_value = False
+
+    # When
+    worker_pool.start()
+    worker_pool.start()
+
+    # Then
+    shared_object = mock_workers[0].create_shared_object.return_value
+    mock_workers[0].create_shared_object.assert_called_once()
+    for worker in mock_workers:
+        worker.share_object.assert_called_once_with(shared_object)
+        assert worker.start.call_count == 2
+
+
+def test_stop_releases_shared_model_when_no_worker_is_kept_warm(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = TranslationWorkerPool(mock_workers, logger=mock_logger, metrics=Mock(), shared_memory=True)
+    worker_pool.start()
+
+    # When
+    worker_pool.stop(1)
+
+    # Then
+    for worker in mock_workers:
+        worker.share_object.assert_called_once()
+
+    # When
+    worker_pool.stop()
+
+    # Then
+    for worker in mock_workers:
+        worker.share_object.assert_called_with(None)
+
+
+def test_rss_bytes_counts_shared_model_once(mock_workers: List[Mock], mock_logger: Logger) -> None:
+    # Given
+    worker_pool = TranslationWorkerPool(mock_workers, logger=mock_logger, metrics=Mock(), shared_memory=True)
+    mock_workers[0].shared_object_bytes.return_value = 1000
+    for worker in mock_workers:
+        worker.rss_bytes.return_value = 1100
+        worker.uss_bytes.return_value = 100
+
+    # When
+    worker_pool.start()
+
+    # Then
+    assert worker_pool.rss_bytes() == 1300
+
+    # When
+    worker_pool.stop()
+
+    # Then
+    assert worker_pool.rss_bytes() == 3300
+
+
+def test_status_aggregates_workers(worker_pool: TranslationWorkerPool, mock_workers: List[Mock]) -> None:
+    # Given
+    mock_workers[0].is_alive.return_value = False
+    mock_workers[2].is_processing.return_value = True
+    mock_workers[1].is_ready.return_value = True
+    for pid, worker in zip([None, 11, 12], mock_workers):
+        worker.pid.return_value = pid
+        worker.rss_bytes.return_value = 0 if pid is None else 100
+
+    # When / Then
+    assert worker_pool.is_alive()
+    assert worker_pool.alive_count() == 2
+    assert worker_pool.is_processing()
+    assert worker_pool.is_ready()
+    assert worker_pool.pids() == [None, 11, 12]
+    assert worker_pool.pending_count() == 6
+    assert worker_pool.rss_bytes() == 200
+
+
+def test_translate_batch_dispatches_to_least_loaded_live_worker(
+    worker_pool: TranslationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    future: Future[List[str]] = Future()
+    mock_workers[1].is_alive.return_value = False
+    mock_workers[2].translate_batch.return_value = future
+    requests: List[TranslationRequest] = [("hello", "en", "fr", {})]
+
+    # When
+    result = worker_pool.translate_batch(requests)
+
+    # Then
+    assert result is future
+    mock_workers[2].translate_batch.assert_called_once_with(requests)
+    mock_workers[0].translate_batch.assert_not_called()
+
+
+def test_translate_batch_raises_error_if_no_worker_running(
+    worker_pool: TranslationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    for worker in mock_workers:
+        worker.is_alive.return_value = False
+
+    # When / Then
+    with pytest.raises(RuntimeError, match="Worker process is not running"):
+        worker_pool.translate_batch([("hello", "en", "fr", {})])
@@ -0,0 +1,34 @@
+from domain.services.text_segmentation_service import TextSegmentationService
+
+
+def test_split_sentences_and_paragraphs() -> None:
+    # Given
+    text = "Hello world. How are you?  Fine!\n\nNext paragraph"
+
+    # When
+    segments = TextSegmentationService().split(text)
+
+    # Then
+    assert segments == [
+        ("Hello world.", " "),
+        ("How are you?", "  "),
+        ("Fine!", "\n\n"),
+        ("Next paragraph", ""),
+    ]
+    assert "".join(segment + separator for segment, separator in segments) == text
+
+
+def test_split_text_without_boundaries() -> None:
+    # When
+    segments = TextSegmentationService().split("3.14 is not a boundary")
+
+    # Then
+    assert segments == [("3.14 is not a boundary", "")]
+
+
+def test_split_blank_text() -> None:
+    # When
+    segments = TextSegmentationService().split("  \n ")
+
+    # Then
+    assert segments == []
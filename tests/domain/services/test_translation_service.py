@@ -1,11 +1,18 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from domain.exceptions.language_not_found_error import LanguageNotFoundError
+from domain.exceptions.unsupported_model_configuration_error import (
+    UnsupportedModelConfigurationError,
+)
+from domain.models.translation_model_status import TranslationModelStatus
 from domain.repositories.translation_model_repository import TranslationModelRepository
 from domain.services.language_mapping_service import LanguageMappingService
+from domain.services.text_segmentation_service import TextSegmentationService
 from domain.services.translation_service import TranslationService
 
 
@@ -18,12 +25,16 @@ def mock_logger() -> Logger:
 def mock_config() -> AppConfig:
     config = Mock(AppConfig)
     config.translation_model_name = "test_model"
+    config.translation_model_names = ["test_model", "other_model"]
+    config.translation_segment_cache_enabled = False
     return config
 
 
 @pytest.fixture
 def mock_translation_model_repository() -> TranslationModelRepository:
-    return Mock(TranslationModelRepository)
+    repository = Mock(TranslationModelRepository)
+    repository.translate = AsyncMock()
+    return repository
 
 
 @pytest.fixture
@@ -43,10 +54,12 @@ def translation_service(
         config=mock_config,
         translation_model_repository=mock_translation_model_repository,
         language_mapping_service=mock_language_mapping_service,
+        text_segmentation_service=TextSegmentationService(),
     )
 
 
-def test_translate_text_success(
+@pytest.mark.asyncio
+async def test_translate_text_success(
     translation_service: TranslationService,
     mock_translation_model_repository: TranslationModelRepository,
     mock_language_mapping_service: LanguageMappingService,
@@ -59,14 +72,21 @@ def test_translate_text_success(
     mock_translation_model_repository.translate.return_value = "Hola Mundo"
 
     # When
-    result = translation_service.translate_text(text, source_language, target_language, {})
+    result = await translation_service.translate_text(text, source_language, target_language, {})
 
     # Then
     assert result == "Hola Mundo"
-    mock_translation_model_repository.translate.assert_called_once_with(text, source_language, target_language, {})
+    mock_translation_model_repository.translate.assert_awaited_once_with(
+        text,
+        source_language,
+        target_language,
+        {},
+        "test_model",
+    )
 
 
-def test_translate_text_exception(
+@pytest.mark.asyncio
+async def test_translate_text_exception(
     translation_service: TranslationService,
     mock_translation_model_repository: TranslationModelRepository,
     mock_language_mapping_service: LanguageMappingService,
@@ -80,4 +100,189 @@ def test_translate_text_exception(
 
     # When / Then
     with pytest.raises(Exception, match="Translation error"):
-        translation_service.translate_text(text, source_language, target_language, {})
+        await translation_service.translate_text(text, source_language, target_language, {})
+
+
+@pytest.mark.asyncio
+async def test_translate_batch_success(
+    translation_service: TranslationService,
+    mock_translation_model_repository: Mock,
+    mock_language_mapping_service: Mock,
+) -> None:
+    # Given
+    mock_language_mapping_service.map_language.side_effect = lambda language, _: f"{language}_mapped"
+    mock_translation_model_repository.translate_batch = AsyncMock(return_value=["Hola", "Bonjour"])
+
+    # When
+    result = await translation_service.translate_batch([("Hello", "en", "es"), ("Hello", "en", "fr")], {})
+
+    # Then
+    assert result == ["Hola", "Bonjour"]
+    assert mock_language_mapping_service.map_language.call_count == 3
+    mock_translation_model_repository.translate_batch.assert_awaited_once_with(
+        [("Hello", "en_mapped", "es_mapped", {}), ("Hello", "en_mapped", "fr_mapped", {})],
+        "test_model",
+    )
+
+
+@pytest.mark.asyncio
+async def test_translate_text_stream_yields_segments_in_order(
+    translation_service: TranslationService,
+    mock_translation_model_repository: Mock,
+    mock_language_mapping_service: Mock,
+) -> None:
+    # Given
+    async def translate(text: str, *_: object) -> str:
+        await asyncio.sleep(0.02 if text == "Hello." else 0)
+        return text.upper()
+
+    mock_language_mapping_service.map_language.side_effect = ["en", "es"]
+    mock_translation_model_repository.translate.side_effect = translate
+
+    # When
+    result = [chunk async for chunk in translation_service.translate_text_stream("Hello. World!", "en", "es", {})]
+
+    # Then
+    assert result == [("HELLO.", " "), ("WORLD!", "")]
+    assert mock_translation_model_repository.translate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_translate_text_stream_cancels_pending_segments_on_close(
+    translation_service: TranslationService,
+    mock_translation_model_repository: Mock,
+    mock_language_mapping_service: Mock,
+) -> None:
+    # Given
+    pending: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+
+    async def translate(text: str, *_: object) -> str:
+        if text == "Hello.":
+            return "Hola."
+        return await pending
+
+    mock_language_mapping_service.map_language.side_effect = ["en", "es"]
+    mock_translation_model_repository.translate.side_effect = translate
+    stream = translation_service.translate_text_stream("Hello. World!", "en", "es", {})
+
+    # When
+    first = await stream.__anext__()
+    await stream.aclose()
+    await asyncio.sleep(0)
+
+    # Then
+    assert first == ("Hola.", " ")
+    assert pending.cancelled()
+
+
+def test_translate_text_stream_validates_before_streaming(
+    translation_service: TranslationService,
+    mock_translation_model_repository: Mock,
+    mock_language_mapping_service: Mock,
+) -> None:
+    # When / Then
+    with pytest.raises(UnsupportedModelConfigurationError, match="Unsupported model name: unknown_model"):
+        translation_service.translate_text_stream("Hello. World!", "en", "es", {}, "unknown_model")
+
+    # Given
+    mock_language_mapping_service.map_language.side_effect = LanguageNotFoundError("xx", "test_model")
+
+    # When / Then
+    with pytest.raises(LanguageNotFoundError):
+        translation_service.translate_text_stream("Hello. World!", "xx", "es", {})
+
+    mock_translation_model_repository.translate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_translate_text_with_segment_cache_translates_each_segment(
+    translation_service: TranslationService,
+    mock_config: Mock,
+    mock_translation_model_repository: Mock,
+    mock_language_mapping_service: Mock,
+) -> None:
+    # Given
+    mock_config.translation_segment_cache_enabled = True
+    mock_language_mapping_service.map_language.side_effect = ["en", "es"]
+    mock_translation_model_repository.translate.side_effect = lambda text, *_: "Hola." if text == "Hello." else "Adiós."
+
+    # When
+    result = await translation_service.translate_text("\nHello. Goodbye.\n", "en", "es", {})
+
+    # Then
+    assert result == "\nHola. Adiós.\n"
+    mock_translation_model_repository.translate.assert_any_await("Hello.", "en", "es", {}, "test_model")
+    mock_translation_model_repository.translate.assert_any_await("Goodbye.", "en", "es", {}, "test_model")
+
+
+@pytest.mark.asyncio
+async def test_translate_text_uses_requested_model(
+    translation_service: TranslationService,
+    mock_translation_model_repository: Mock,
+    mock_language_mapping_service: Mock,
+) -> None:
+    # Given
+    mock_language_mapping_service.map_language.side_effect = ["en", "es"]
+    mock_translation_model_repository.translate.return_value = "Hola Mundo"
+
+    # When
+    await translation_service.translate_text("Hello World", "en", "es", {}, "other_model")
+
+    # Then
+    mock_language_mapping_service.map_language.assert_any_call("en", "other_model")
+    mock_translation_model_repository.translate.assert_awaited_once_with("Hello World", "en", "es", {}, "other_model")
+
+
+@pytest.mark.asyncio
+async def test_translate_text_rejects_model_that_is_not_hosted(
+    translation_service: TranslationService,
+    mock_translation_model_repository: Mock,
+) -> None:
+    # When / Then
+    with pytest.raises(UnsupportedModelConfigurationError, match="Unsupported model name: unknown_model"):
+        await translation_service.translate_text("Hello World", "en", "es", {}, "unknown_model")
+
+    mock_translation_model_repository.translate.assert_not_awaited()
+
+
+def test_preload_model_preloads_repository(
+    translation_service: TranslationService,
+    mock_translation_model_repository: Mock,
+) -> None:
+    # When
+    translation_service.preload_model()
+
+    # Then
+    mock_translation_model_repository.preload.assert_called_once_with("test_model")
+
+
+def test_get_model_status_returns_repository_status(
+    translation_service: TranslationService,
+    mock_translation_model_repository: Mock,
+) -> None:
+    # Given
+    status = TranslationModelStatus(True, True, [1234], 0, 0, None, ["test_model"])
+    mock_translation_model_repository.get_status.return_value = status
+
+    # When / Then
+    assert translation_service.get_model_status() == status
+
+
+@pytest.mark.parametrize(
+    ("model_loaded", "queue_depth", "max_queue_depth", "expected"),
+    [(False, 0, 0, False), (True, 100, 0, True), (True, 9, 10, True), (True, 10, 10, False)],
+)
+def test_is_model_ready(
+    translation_service: TranslationService,
+    mock_config: Mock,
+    model_loaded: bool,
+    queue_depth: int,
+    max_queue_depth: int,
+    expected: bool,
+) -> None:
+    # Given
+    mock_config.readiness_max_queue_depth = max_queue_depth
+    status = TranslationModelStatus(True, model_loaded, [1234], queue_depth, 0, None, [])
+
+    # When / Then
+    assert translation_service.is_model_ready(status) is expected
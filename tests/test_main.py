@@ -15,7 +15,13 @@ def mock_logger() -> Logger:
 
 @pytest.fixture
 def mock_config() -> AppConfig:
-    return Mock(AppConfig)
+    config = Mock(AppConfig)
+    config.log_async = False
+    config.log_format = "text"
+    config.log_request_sample_rate = 1.0
+    config.log_text_max_length = 200
+    config.log_redact_text = False
+    return config
 
 
 @pytest.fixture
@@ -82,3 +88,34 @@ def test_main_start_exception(
             main(mock_logger, mock_config, mock_server)
 
         mock_load_config.assert_called_once()
+
+
+def test_main_enables_async_logging(
+    mock_logger: Logger,
+    mock_config: AppConfig,
+    mock_server: APIServer,
+) -> None:
+    # Given
+    mock_config.log_level = "INFO"
+    mock_config.log_async = True
+
+    # When
+    main(mock_logger, mock_config, mock_server)
+
+    # Then
+    mock_logger.enable_async.assert_called_once()
+
+
+def test_main_configures_log_output(
+    mock_logger: Logger,
+    mock_config: AppConfig,
+    mock_server: APIServer,
+) -> None:
+    # Given
+    mock_config.log_level = "INFO"
+
+    # When
+    main(mock_logger, mock_config, mock_server)
+
+    # Then
+    mock_logger.configure.assert_called_once_with("text", 1.0, 200, False)